@@ -50,6 +50,9 @@ class BufferedDataWriter(Generic[TWriter]):
         self.closed_files: List[str] = []  # all fully processed files
         # buffered items must be less than max items in file
         self.buffer_max_items = min(buffer_max_items, file_max_items or buffer_max_items)
+        # arrow tables are already batched so they are written as they come
+        if self.file_format == "arrow":
+            self.buffer_max_items = 1
         self.file_max_bytes = file_max_bytes
         self.file_max_items = file_max_items
         # the open function is either gzip.open or open
@@ -68,9 +71,12 @@ class BufferedDataWriter(Generic[TWriter]):
 
     def write_data_item(self, item: TDataItems, columns: TTableSchemaColumns) -> None:
         self._ensure_open()
+        # all arrow items in a file must have the same schema
+        if self.file_format == "arrow" and self._writer and not item.schema.equals(self._writer.schema):
+            self._rotate_file()
         # rotate file if columns changed and writer does not allow for that
         # as the only allowed change is to add new column (no updates/deletes), we detect the change by comparing lengths
-        if self._writer and not self._writer.data_format().supports_schema_changes and len(columns) != len(self._current_columns):
+        if self._writer and not self._writer.data_format().supports_schema_changes and columns is not None and len(columns) != len(self._current_columns):
             assert len(columns) > len(self._current_columns)
             self._rotate_file()
         # until the first chunk is written we can change the columns schema freely
@@ -52,6 +52,24 @@ def escape_postgres_literal(v: Any) -> Any:
     return str(v)
 
 
+def escape_postgres_csv_value(v: Any) -> str:
+    """Formats `v` as a field of PostgreSQL COPY csv format. Unquoted empty field is NULL so all strings are quoted"""
+    if v is None:
+        return ""
+    if isinstance(v, str):
+        return '"' + v.replace('"', '""') + '"'
+    if isinstance(v, bool):
+        return "true" if v else "false"
+    if isinstance(v, (datetime, date, time)):
+        return v.isoformat()
+    if isinstance(v, (list, dict)):
+        return escape_postgres_csv_value(json.dumps(v))
+    if isinstance(v, bytes):
+        return f"\\x{v.hex()}"
+
+    return str(v)
+
+
 def escape_duckdb_literal(v: Any) -> Any:
     if isinstance(v, str):
         # we escape extended string which behave like the redshift string
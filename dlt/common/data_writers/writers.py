@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, Sequence, IO, Type, Optional, List, cast
 
 from dlt.common import json
+from dlt.common.data_writers.escape import escape_postgres_csv_value
 from dlt.common.typing import StrAny
 from dlt.common.schema.typing import TTableSchemaColumns
 from dlt.common.destination import TLoaderFileFormat, DestinationCapabilitiesContext
@@ -68,8 +69,12 @@ class DataWriter(abc.ABC):
             return JsonlListPUAEncodeWriter
         elif file_format == "insert_values":
             return InsertValuesWriter
+        elif file_format == "csv":
+            return CsvWriter
         elif file_format == "parquet":
             return ParquetDataWriter  # type: ignore
+        elif file_format == "arrow":
+            return ArrowWriter  # type: ignore
         else:
             raise ValueError(file_format)
 
@@ -178,6 +183,43 @@ class InsertValuesWriter(DataWriter):
         )
 
 
+class CsvWriter(DataWriter):
+    """Writes rows in csv format accepted by PostgreSQL COPY. First line is a header with column names, NULL is an unquoted empty field"""
+
+    def __init__(self, f: IO[Any], caps: DestinationCapabilitiesContext = None) -> None:
+        super().__init__(f, caps)
+        self._headers_lookup: Dict[str, int] = None
+
+    def write_header(self, columns_schema: TTableSchemaColumns) -> None:
+        assert columns_schema is not None, "column schema required"
+        headers = columns_schema.keys()
+        self._headers_lookup = {v: i for i, v in enumerate(headers)}
+        self._f.write(",".join(map(escape_postgres_csv_value, headers)))
+        self._f.write("\n")
+
+    def write_data(self, rows: Sequence[Any]) -> None:
+        super().write_data(rows)
+        for row in rows:
+            output = [""] * len(self._headers_lookup)
+            for n, v in row.items():
+                output[self._headers_lookup[n]] = escape_postgres_csv_value(v)
+            self._f.write(",".join(output))
+            self._f.write("\n")
+
+    def write_footer(self) -> None:
+        pass
+
+    @classmethod
+    def data_format(cls) -> TFileFormatSpec:
+        return TFileFormatSpec(
+            "csv",
+            file_extension="csv",
+            is_binary_format=False,
+            supports_schema_changes=False,
+            supports_compression=True,
+        )
+
+
 @configspec
 class ParquetDataWriterConfiguration(BaseConfiguration):
     flavor: str = "spark"
@@ -185,6 +227,11 @@ class ParquetDataWriterConfiguration(BaseConfiguration):
     data_page_size: int = 1024 * 1024
     timestamp_precision: str = "us"
     timestamp_timezone: str = "UTC"
+    row_group_size: Optional[int] = None
+    """Number of rows buffered before a row group is written, by default each written chunk of rows is a row group. Buffered rows are not
+    counted in the file size so rotation by `file_max_bytes` happens only after a row group is written"""
+    use_dictionary: bool = True
+    """Dictionary encode the columns"""
 
     __section__: str = known_sections.DATA_WRITER
 
@@ -198,7 +245,9 @@ class ParquetDataWriter(DataWriter):
                  flavor: str = "spark",
                  version: str = "2.4",
                  data_page_size: int = 1024 * 1024,
-                 timestamp_timezone: str = "UTC"
+                 timestamp_timezone: str = "UTC",
+                 row_group_size: Optional[int] = None,
+                 use_dictionary: bool = True
                  ) -> None:
         super().__init__(f, caps)
         from dlt.common.libs.pyarrow import pyarrow
@@ -210,6 +259,23 @@ class ParquetDataWriter(DataWriter):
         self.parquet_version = version
         self.parquet_data_page_size = data_page_size
         self.timestamp_timezone = timestamp_timezone
+        self.parquet_row_group_size = row_group_size
+        self.parquet_use_dictionary = use_dictionary
+        # values of the rows not yet written, buffered per column
+        self._columns_buffer: Dict[str, List[Any]] = {}
+        self._buffered_rows_count = 0
+
+    def _create_writer(self, schema: Any) -> Any:
+        from dlt.common.libs.pyarrow import pyarrow
+
+        return pyarrow.parquet.ParquetWriter(
+            self._f,
+            schema,
+            flavor=self.parquet_flavor,
+            version=self.parquet_version,
+            data_page_size=self.parquet_data_page_size,
+            use_dictionary=self.parquet_use_dictionary
+        )
 
     def write_header(self, columns_schema: TTableSchemaColumns) -> None:
         from dlt.common.libs.pyarrow import pyarrow, get_py_arrow_datatype
@@ -224,24 +290,37 @@ class ParquetDataWriter(DataWriter):
         )
         # find row items that are of the complex type (could be abstracted out for use in other writers?)
         self.complex_indices = [i for i, field in columns_schema.items() if field["data_type"] == "complex"]
-        self.writer = pyarrow.parquet.ParquetWriter(self._f, self.schema, flavor=self.parquet_flavor, version=self.parquet_version, data_page_size=self.parquet_data_page_size)
-
+        self._columns_buffer = {name: [] for name in self.schema.names}
+        self.writer = self._create_writer(self.schema)
 
     def write_data(self, rows: Sequence[Any]) -> None:
         super().write_data(rows)
+        # rows are not modified, values are collected per column and missing values become nulls
+        for name, values in self._columns_buffer.items():
+            values.extend([row.get(name) for row in rows])
+        self._buffered_rows_count += len(rows)
+        if not self.parquet_row_group_size or self._buffered_rows_count >= self.parquet_row_group_size:
+            self._flush_columns()
+
+    def _flush_columns(self) -> None:
         from dlt.common.libs.pyarrow import pyarrow
 
-        # replace complex types with json
-        for key in self.complex_indices:
-            for row in rows:
-                if key in row:
-                    row[key] = json.dumps(row[key])
-
-        table = pyarrow.Table.from_pylist(rows, schema=self.schema)
-        # Write
-        self.writer.write_table(table)
+        if self._buffered_rows_count == 0:
+            return
+        arrays = []
+        for field in self.schema:
+            values = self._columns_buffer[field.name]
+            if field.name in self.complex_indices:
+                # complex values are serialized to json one by one, there's no arrow type for arbitrary python objects
+                values = [None if v is None else json.dumps(v) for v in values]
+            arrays.append(pyarrow.array(values, type=field.type))
+            self._columns_buffer[field.name] = []
+        table = pyarrow.Table.from_arrays(arrays, schema=self.schema)
+        self.writer.write_table(table, row_group_size=self.parquet_row_group_size)
+        self._buffered_rows_count = 0
 
     def write_footer(self) -> None:
+        self._flush_columns()
         self.writer.close()
         self.writer = None
 
@@ -249,3 +328,33 @@ class ParquetDataWriter(DataWriter):
     @classmethod
     def data_format(cls) -> TFileFormatSpec:
         return TFileFormatSpec("parquet", "parquet", True, False, requires_destination_capabilities=True, supports_compression=False)
+
+
+class ArrowWriter(ParquetDataWriter):
+    """Writes arrow tables and record batches into parquet file. File schema is taken from the first item written, the following items must have
+    the same schema"""
+
+    def write_header(self, columns_schema: TTableSchemaColumns) -> None:
+        # writer is created with the schema of the first item
+        pass
+
+    def write_data(self, rows: Sequence[Any]) -> None:
+        from dlt.common.libs.pyarrow import pyarrow
+
+        for item in rows:
+            if not self.writer:
+                self.schema = item.schema
+                self.writer = self._create_writer(self.schema)
+            if isinstance(item, pyarrow.RecordBatch):
+                self.writer.write_batch(item, row_group_size=self.parquet_row_group_size)
+            else:
+                self.writer.write_table(item, row_group_size=self.parquet_row_group_size)
+            self.items_count += item.num_rows
+
+    def write_footer(self) -> None:
+        if self.writer:
+            super().write_footer()
+
+    @classmethod
+    def data_format(cls) -> TFileFormatSpec:
+        return TFileFormatSpec("arrow", "parquet", True, False, requires_destination_capabilities=False, supports_compression=False)
@@ -319,6 +319,22 @@ class WithStagingDataset(ABC):
         return self  # type: ignore
 
 
+class WithReferenceJobsBatch(ABC):
+    """Adds capability to load many reference jobs (files on the staging destination) of a table with a single operation ie. COPY with a list of files"""
+
+    max_reference_jobs_batch: ClassVar[int] = 1000
+    """Max number of reference jobs the loader passes in a single batch"""
+
+    @abstractmethod
+    def start_reference_jobs_batch(self, table: TTableSchema, file_paths: Sequence[str], load_id: str) -> List[LoadJob]:
+        """Starts a single load of all reference jobs in `file_paths` into `table`.
+
+        Returns a job for each of the `file_paths`, in the same order. Each job reports the state of the whole operation so the
+        loader may complete, retry or fail each file separately. Raises like `start_file_load` if the operation cannot be started.
+        """
+        pass
+
+
 TDestinationReferenceArg = Union["DestinationReference", ModuleType, None, str]
 
 
@@ -1,8 +1,9 @@
 import os
+import re
 import base64
 import dataclasses
 from datetime import date, datetime, time  # noqa: I251
-from typing import Any, Callable, List, Protocol, IO, Union
+from typing import Any, Callable, Dict, List, Protocol, IO, Type, Union
 from uuid import UUID
 from hexbytes import HexBytes
 from enum import Enum
@@ -119,9 +120,30 @@ DECODERS: List[Callable[[Any], Any]] = [
 ]
 # how many decoders?
 PUA_CHARACTER_MAX = len(DECODERS)
+# finds PUA type markers in serialized documents
+PUA_MARKER_RE = re.compile("[\uF026-\uF02D]")
+PUA_MARKER_RE_B = re.compile(b"\xef\x80[\xa6-\xad]")
+
+# encoders for exact types, avoids going through the isinstance chain for most common types
+PUA_ENCODERS: Dict[Type[Any], Callable[[Any], str]] = {
+    Wei: lambda obj: _WEI + str(obj),
+    Decimal: lambda obj: _DECIMAL + str(obj),
+    datetime: lambda obj: _DATETIME + obj.isoformat(),
+    pendulum.DateTime: lambda obj: _DATETIME + obj.isoformat(),
+    date: lambda obj: _DATE + obj.isoformat(),
+    pendulum.Date: lambda obj: _DATE + obj.isoformat(),
+    time: lambda obj: _TIME + obj.isoformat(),
+    pendulum.Time: lambda obj: _TIME + obj.isoformat(),
+    UUID: lambda obj: _UUIDT + str(obj),
+    HexBytes: lambda obj: _HEXBYTES + obj.hex(),
+    bytes: lambda obj: _B64BYTES + base64.b64encode(obj).decode('ascii'),
+}
 
 
 def custom_pua_encode(obj: Any) -> str:
+    encoder = PUA_ENCODERS.get(obj.__class__)
+    if encoder is not None:
+        return encoder(obj)
     # wei is subclass of decimal and must be checked first
     if isinstance(obj, Wei):
         return _WEI + str(obj)
@@ -158,7 +180,7 @@ def custom_pua_decode(obj: Any) -> Any:
     if isinstance(obj, str) and len(obj) > 1:
         c = ord(obj[0]) - 0xF026
         # decode only the PUA space defined in DECODERS
-        if c >=0 and c <= PUA_CHARACTER_MAX:
+        if c >=0 and c < PUA_CHARACTER_MAX:
             return DECODERS[c](obj[1:])
     return obj
 
@@ -171,12 +193,19 @@ def custom_pua_decode_nested(obj: Any) -> Any:
     return obj
 
 
+def may_have_pua(s: Union[str, bytes, bytearray, memoryview]) -> bool:
+    """Checks if serialized document `s` contains PUA type markers. If not, values parsed from it do not need to be decoded"""
+    if isinstance(s, str):
+        return PUA_MARKER_RE.search(s) is not None
+    return PUA_MARKER_RE_B.search(s) is not None
+
+
 def custom_pua_remove(obj: Any) -> Any:
     """Removes the PUA data type marker and leaves the correctly serialized type representation. Unmarked values are returned as-is."""
     if isinstance(obj, str) and len(obj) > 1:
         c = ord(obj[0]) - 0xF026
         # decode only the PUA space defined in DECODERS
-        if c >=0 and c <= PUA_CHARACTER_MAX:
+        if c >=0 and c < PUA_CHARACTER_MAX:
             return obj[1:]
     return obj
 
@@ -1,7 +1,7 @@
 from typing import IO, Any, Union
 import orjson
 
-from dlt.common.json import custom_pua_encode, custom_pua_decode_nested, custom_encode
+from dlt.common.json import custom_pua_encode, custom_pua_decode_nested, custom_encode, may_have_pua
 from dlt.common.typing import AnyFun
 
 _impl_name = "orjson"
@@ -33,11 +33,13 @@ def typed_dumps(obj: Any, sort_keys: bool = False, pretty: bool = False) -> str:
 
 
 def typed_loads(s: str) -> Any:
-    return custom_pua_decode_nested(loads(s))
+    obj = loads(s)
+    return custom_pua_decode_nested(obj) if may_have_pua(s) else obj
 
 
 def typed_loadb(s: Union[bytes, bytearray, memoryview]) -> Any:
-    return custom_pua_decode_nested(loadb(s))
+    obj = loadb(s)
+    return custom_pua_decode_nested(obj) if may_have_pua(s) else obj
 
 
 def dumps(obj: Any, sort_keys: bool = False, pretty:bool = False) -> str:
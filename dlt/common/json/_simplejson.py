@@ -4,7 +4,7 @@ from typing import IO, Any, Union
 import simplejson
 import platform
 
-from dlt.common.json import custom_pua_encode, custom_pua_decode_nested, custom_encode
+from dlt.common.json import custom_pua_encode, custom_pua_decode_nested, custom_encode, may_have_pua
 
 if platform.python_implementation() == "PyPy":
     # disable speedups on PyPy, it can be actually faster than Python C
@@ -65,7 +65,8 @@ def typed_dumps(obj: Any, sort_keys: bool = False, pretty: bool = False) -> str:
 
 
 def typed_loads(s: str) -> Any:
-    return custom_pua_decode_nested(loads(s))
+    obj = loads(s)
+    return custom_pua_decode_nested(obj) if may_have_pua(s) else obj
 
 
 def typed_dumpb(obj: Any, sort_keys: bool = False, pretty: bool = False) -> bytes:
@@ -73,7 +74,8 @@ def typed_dumpb(obj: Any, sort_keys: bool = False, pretty: bool = False) -> byte
 
 
 def typed_loadb(s: Union[bytes, bytearray, memoryview]) -> Any:
-    return custom_pua_decode_nested(loadb(s))
+    obj = loadb(s)
+    return custom_pua_decode_nested(obj) if may_have_pua(s) else obj
 
 
 def dumps(obj: Any, sort_keys: bool = False, pretty:bool = False) -> str:
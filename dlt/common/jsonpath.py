@@ -1,9 +1,9 @@
-from typing import Iterable, Union, List, Any
+from typing import Iterable, Optional, Union, List, Any
 from itertools import chain
 
 from dlt.common.typing import DictStrAny
 
-from jsonpath_ng import parse as _parse, JSONPath
+from jsonpath_ng import parse as _parse, JSONPath, Child, Fields, Root
 
 
 TJsonPath = Union[str, JSONPath]  # Jsonpath compiled or str
@@ -46,3 +46,24 @@ def resolve_paths(paths: TAnyJsonPath, data: DictStrAny) -> List[str]:
     paths = compile_paths(paths)
     p: JSONPath
     return list(chain.from_iterable((str(r.full_path) for r in p.find(data)) for p in paths))
+
+
+def extract_simple_field_names(path: TJsonPath) -> Optional[List[str]]:
+    """Returns the list of keys if `path` selects a single value by nested field names ie. `a.b` or `$.a.b`, otherwise returns None
+
+    Example:
+    >>> extract_simple_field_names('$.a.b')
+    >>> # ['a', 'b']
+    """
+    path = compile_path(path)
+    if isinstance(path, Root):
+        return []
+    if isinstance(path, Fields) and len(path.fields) == 1 and path.fields[0] != "*":
+        return [path.fields[0]]
+    if isinstance(path, Child):
+        left = extract_simple_field_names(path.left)
+        right = extract_simple_field_names(path.right)
+        # root may only start the path
+        if left is not None and right:
+            return left + right
+    return None
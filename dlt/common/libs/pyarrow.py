@@ -1,17 +1,30 @@
-from typing import Any, Tuple, Optional
+import base64
+import secrets
+from array import array
+from typing import Any, Tuple, Optional, Union
+
 from dlt import version
+from dlt.common import json
 from dlt.common.exceptions import MissingDependencyException
+from dlt.common.normalizers.json.relational import DLT_ID_LENGTH_BYTES
 
 from dlt.common.destination.capabilities import DestinationCapabilitiesContext
-from dlt.common.schema.typing import TColumnType
+from dlt.common.schema.typing import TColumnType, TTableSchemaColumns
 
 try:
     import pyarrow
     import pyarrow.parquet
+    import pyarrow.compute
 except ModuleNotFoundError:
     raise MissingDependencyException("DLT parquet Helpers", [f"{version.DLT_PKG_NAME}[parquet]"], "DLT Helpers for for parquet.")
 
 
+TAnyArrowItem = Union[pyarrow.Table, pyarrow.RecordBatch]
+
+DLT_IDS_CHUNK_SIZE = 1 << 24
+"""Max number of row ids generated into a single arrow array"""
+
+
 def get_py_arrow_datatype(column: TColumnType, caps: DestinationCapabilitiesContext, tz: str) -> Any:
     column_type = column["data_type"]
     if column_type == "text":
@@ -82,3 +95,123 @@ def get_pyarrow_int(precision: Optional[int]) -> Any:
     elif precision <= 32:
         return pyarrow.int32()
     return pyarrow.int64()
+
+
+def get_column_type_from_py_arrow(dtype: pyarrow.DataType) -> TColumnType:
+    """Returns dlt data type with precision and scale for pyarrow `dtype`. `data_type` is None for null type"""
+    if pyarrow.types.is_dictionary(dtype):
+        return get_column_type_from_py_arrow(dtype.value_type)
+    if pyarrow.types.is_string(dtype) or pyarrow.types.is_large_string(dtype):
+        return dict(data_type="text")
+    elif pyarrow.types.is_floating(dtype):
+        return dict(data_type="double")
+    elif pyarrow.types.is_boolean(dtype):
+        return dict(data_type="bool")
+    elif pyarrow.types.is_timestamp(dtype):
+        return dict(data_type="timestamp", precision=_get_unit_precision(dtype.unit))
+    elif pyarrow.types.is_date(dtype):
+        return dict(data_type="date")
+    elif pyarrow.types.is_time(dtype):
+        return dict(data_type="time", precision=_get_unit_precision(dtype.unit))
+    elif pyarrow.types.is_integer(dtype):
+        # int64 is the default bigint
+        if dtype.bit_width < 64:
+            return dict(data_type="bigint", precision=dtype.bit_width)
+        return dict(data_type="bigint")
+    elif pyarrow.types.is_fixed_size_binary(dtype):
+        return dict(data_type="binary", precision=dtype.byte_width)
+    elif pyarrow.types.is_binary(dtype) or pyarrow.types.is_large_binary(dtype):
+        return dict(data_type="binary")
+    elif pyarrow.types.is_decimal(dtype):
+        return dict(data_type="decimal", precision=dtype.precision, scale=dtype.scale)
+    elif pyarrow.types.is_nested(dtype):
+        return dict(data_type="complex")
+    elif pyarrow.types.is_null(dtype):
+        return dict(data_type=None)
+    else:
+        raise ValueError(dtype)
+
+
+def _get_unit_precision(unit: str) -> int:
+    return {"s": 0, "ms": 3, "us": 6, "ns": 9}[unit]
+
+
+def py_arrow_to_table_schema_columns(schema: pyarrow.Schema) -> TTableSchemaColumns:
+    """Converts arrow `schema` to dlt column schemas, columns with null type are skipped"""
+    columns: TTableSchemaColumns = {}
+    for field in schema:
+        column_type = get_column_type_from_py_arrow(field.type)
+        if column_type["data_type"] is None:
+            continue
+        columns[field.name] = {"name": field.name, "nullable": field.nullable, **column_type}  # type: ignore[misc]
+    return columns
+
+
+def columns_to_arrow_schema(columns: TTableSchemaColumns, caps: DestinationCapabilitiesContext, tz: str = "UTC") -> pyarrow.Schema:
+    """Converts dlt column schemas into arrow schema, complete columns only"""
+    return pyarrow.schema(
+        [pyarrow.field(
+            name,
+            get_py_arrow_datatype(column, caps, tz),
+            nullable=column.get("nullable", True)
+        ) for name, column in columns.items() if column.get("data_type")]
+    )
+
+
+def cast_to_arrow_schema(item: TAnyArrowItem, schema: pyarrow.Schema) -> pyarrow.Table:
+    """Selects and orders columns in `item` according to `schema` and casts them to the schema types. Columns missing in `item` are filled with nulls
+    and complex types are serialized to json strings.
+    """
+    if isinstance(item, pyarrow.RecordBatch):
+        item = pyarrow.Table.from_batches([item])
+    arrays = []
+    for field in schema:
+        if field.name not in item.column_names:
+            arrays.append(pyarrow.nulls(item.num_rows, field.type))
+            continue
+        column = item.column(field.name)
+        if pyarrow.types.is_nested(column.type) and not pyarrow.types.is_nested(field.type):
+            # complex types are stored as json
+            column = nested_to_json_strings(column)
+        if not column.type.equals(field.type):
+            column = column.cast(field.type)
+        arrays.append(column)
+    return pyarrow.Table.from_arrays(arrays, schema=schema)
+
+
+def nested_to_json_strings(column: Union[pyarrow.Array, pyarrow.ChunkedArray]) -> pyarrow.Array:
+    """Serializes values of nested arrow `column` into json strings. Arrow has no kernel that serializes nested types so values
+    are converted into Python objects and serialized one by one. Serialized documents are joined into a single newline separated
+    buffer which is split by arrow into the resulting array. Compact json never contains raw newlines
+    """
+    if isinstance(column, pyarrow.ChunkedArray):
+        column = column.combine_chunks()
+    if len(column) == 0:
+        return pyarrow.array([], type=pyarrow.string())
+    documents = b"\n".join(map(json.dumpb, column.to_pylist()))
+    values = pyarrow.compute.split_pattern(pyarrow.array([documents], type=pyarrow.large_binary()), b"\n").flatten()
+    values = values.cast(pyarrow.large_string()).cast(pyarrow.string())
+    # nulls were serialized as "null" documents, restore them from the source column
+    if column.null_count:
+        values = pyarrow.compute.if_else(column.is_null(), pyarrow.scalar(None, type=pyarrow.string()), values)
+    return values
+
+
+def generate_dlt_ids(count: int, id_length_bytes: int = DLT_ID_LENGTH_BYTES) -> pyarrow.ChunkedArray:
+    """Generates `count` random, base64 encoded row ids of `id_length_bytes` random bytes, without creating Python string per row.
+    The ids have the same length as the ids generated by the relational normalizer.
+    """
+    # random bytes of each id are padded to a multiple of 3 so all ids encode at once into fixed size chunks without base64 padding
+    id_chunk_bytes = (id_length_bytes + 2) // 3 * 3
+    id_chunk_chars = id_chunk_bytes // 3 * 4
+    # length of the id encoded without the padding
+    id_chars = (id_length_bytes * 4 + 2) // 3
+    chunks = []
+    # limit the size of the arrays so the offsets of the resulting string arrays do not overflow
+    for chunk_start in range(0, count, DLT_IDS_CHUNK_SIZE):
+        chunk_count = min(DLT_IDS_CHUNK_SIZE, count - chunk_start)
+        ids_buffer = base64.b64encode(secrets.token_bytes(id_chunk_bytes * chunk_count))
+        offsets = array("q", range(0, id_chunk_chars * (chunk_count + 1), id_chunk_chars))
+        ids = pyarrow.LargeStringArray.from_buffers(chunk_count, pyarrow.py_buffer(offsets), pyarrow.py_buffer(ids_buffer))
+        chunks.append(pyarrow.compute.utf8_slice_codeunits(ids, 0, id_chars).cast(pyarrow.string()))
+    return pyarrow.chunked_array(chunks, type=pyarrow.string())
@@ -29,6 +29,10 @@ class DataItemNormalizer(abc.ABC, Generic[TNormalizerConfig]):
     def extend_schema(self) -> None:
         pass
 
+    def on_schema_change(self, table_name: str = None) -> None:
+        """Called when table `table_name` or, if None, any tables or settings of the schema change. Normalizers must drop information cached from the schema"""
+        pass
+
     @classmethod
     @abc.abstractmethod
     def update_normalizer_config(cls, schema: Schema, config: TNormalizerConfig) -> None:
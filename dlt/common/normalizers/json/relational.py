@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from typing import Dict, List, Mapping, Optional, Sequence, Tuple, cast, TypedDict, Any
 from dlt.common.data_types.typing import TDataType
 from dlt.common.normalizers.exceptions import InvalidJsonNormalizer
@@ -13,6 +14,7 @@ from dlt.common.validation import validate_dict
 
 EMPTY_KEY_IDENTIFIER = "_empty"  # replace empty keys with this
 DLT_ID_LENGTH_BYTES = 10
+FLATTEN_PATHS_CACHE_SIZE = 8192  # max number of memoized (path, key) entries per table used in flattening
 
 class TDataItemRow(TypedDict, total=False):
     _dlt_id: str  # unique id of current row
@@ -46,6 +48,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
     propagation_config: RelationalNormalizerConfigPropagation
     max_nesting: int
     _skip_primary_key: Dict[str, bool]
+    _flatten_paths: Dict[str, "OrderedDict[Tuple[Tuple[str, ...], str, int], Tuple[str, str, str, bool]]"]
 
     def __init__(self, schema: Schema) -> None:
         self.schema = schema
@@ -56,6 +59,8 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         self.propagation_config = self.normalizer_config.get("propagation", None)
         self.max_nesting = self.normalizer_config.get("max_nesting", 1000)
         self._skip_primary_key = {}
+        # memoized normalized names and complex type decisions per table
+        self._flatten_paths = {}
         # self.known_types: Dict[str, TDataType] = {}
         # self.primary_keys = Dict[str, ]
 
@@ -78,9 +83,34 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         if column is None:
             data_type = schema.get_preferred_type(field_name)
         else:
-            data_type = column["data_type"]
+            data_type = column.get("data_type")
         return data_type == "complex"
 
+    def _compute_flatten_path(self, table: str, path: Tuple[str, ...], k: str, _r_lvl: int) -> Tuple[str, str, str, bool]:
+        """Returns normalized key, column name, child table identifier (None for empty key) and complex type flag for key `k` at `path` in `table`"""
+        schema_naming = self.schema.naming
+        table_k: str = None
+        if k.strip():
+            norm_k = schema_naming.normalize_identifier(k)
+            table_k = schema_naming.normalize_table_identifier(k)
+        else:
+            # for empty keys in the data use _
+            norm_k = EMPTY_KEY_IDENTIFIER
+        child_name = norm_k if path == () else schema_naming.shorten_fragments(*path, norm_k)
+        return norm_k, child_name, table_k, self._is_complex_type(table, child_name, _r_lvl)
+
+    def on_schema_change(self, table_name: str = None) -> None:
+        # complex type decisions depend on the columns of the flattened table and on the schema settings
+        if table_name is None:
+            self._flatten_paths.clear()
+        else:
+            self._flatten_paths.pop(table_name, None)
+
+    def _get_flatten_paths(self, table: str) -> "OrderedDict[Tuple[Tuple[str, ...], str, int], Tuple[str, str, str, bool]]":
+        table_paths = self._flatten_paths.get(table)
+        if table_paths is None:
+            table_paths = self._flatten_paths[table] = OrderedDict()
+        return table_paths
 
     def _flatten(
         self,
@@ -92,27 +122,30 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         out_rec_row: DictStrAny = {}
         out_rec_list: Dict[Tuple[str, ...], Sequence[Any]] = {}
         schema_naming = self.schema.naming
+        table_paths = self._get_flatten_paths(table)
 
         def norm_row_dicts(dict_row: StrAny, __r_lvl: int, path: Tuple[str, ...] = ()) -> None:
             for k, v in dict_row.items():
-                if k.strip():
-                    norm_k = schema_naming.normalize_identifier(k)
+                path_key = (path, k, __r_lvl)
+                flattened = table_paths.get(path_key)
+                if flattened is None:
+                    flattened = table_paths[path_key] = self._compute_flatten_path(table, path, k, __r_lvl)
+                    # evict least recently used path if there are too many distinct paths ie. with keys being data
+                    if len(table_paths) > FLATTEN_PATHS_CACHE_SIZE:
+                        table_paths.popitem(last=False)
                 else:
-                    # for empty keys in the data use _
-                    norm_k = EMPTY_KEY_IDENTIFIER
-                # if norm_k != k:
-                #     print(f"{k} -> {norm_k}")
-                child_name = norm_k if path == () else schema_naming.shorten_fragments(*path, norm_k)
+                    table_paths.move_to_end(path_key)
+                norm_k, child_name, table_k, is_complex = flattened
                 # for lists and dicts we must check if type is possibly complex
                 if isinstance(v, (dict, list)):
-                    if not self._is_complex_type(table, child_name, __r_lvl):
+                    if not is_complex:
                         # TODO: if schema contains table {table}__{child_name} then convert v into single element list
                         if isinstance(v, dict):
                             # flatten the dict more
                             norm_row_dicts(v, __r_lvl + 1, path + (norm_k,))
                         else:
                             # pass the list to out_rec_list
-                            out_rec_list[path + (schema_naming.normalize_table_identifier(k),)] = v
+                            out_rec_list[path + (table_k or schema_naming.normalize_table_identifier(k),)] = v
                         continue
                     else:
                         # pass the complex value to out_rec_row
@@ -1,11 +1,13 @@
+import os
+import threading
 import multiprocessing
-from typing import Callable, Union, cast
+from typing import Callable, Dict, Optional, Tuple, Union, cast
 from multiprocessing.pool import ThreadPool, Pool
 
 from dlt.common import logger, sleep
 from dlt.common.runtime import init
 from dlt.common.runners.runnable import Runnable, TPool
-from dlt.common.runners.configuration import PoolRunnerConfiguration
+from dlt.common.runners.configuration import PoolRunnerConfiguration, TPoolType
 from dlt.common.runners.typing import TRunMetrics
 from dlt.common.runtime import signals
 from dlt.common.exceptions import SignalReceivedException
@@ -24,15 +26,73 @@ def create_pool(config: PoolRunnerConfiguration) -> Pool:
     return None
 
 
+# pools kept between runs, one per pool type and number of workers
+_PERSISTENT_POOLS: Dict[Tuple[TPoolType, int], Pool] = {}
+# number of runs currently using a persistent pool
+_PERSISTENT_POOLS_BORROWS: Dict[Pool, int] = {}
+_PERSISTENT_POOLS_LOCK = threading.Lock()
+
+
+def borrow_persistent_pool(config: PoolRunnerConfiguration) -> Pool:
+    """Returns a pool of `config.pool_type` with `config.workers` that is kept between runs so the workers do not start, import dlt and
+    initialize the runtime on every run. The pool is created on first use and may be used by many runs at the same time. Each borrowed pool
+    must be returned with `return_persistent_pool`.
+    """
+    if config.pool_type not in ("process", "thread"):
+        return None
+    key = (config.pool_type, config.workers or os.cpu_count() or 1)
+    with _PERSISTENT_POOLS_LOCK:
+        pool = _PERSISTENT_POOLS.get(key)
+        if pool is None:
+            pool = _PERSISTENT_POOLS[key] = create_pool(config)
+        _PERSISTENT_POOLS_BORROWS[pool] = _PERSISTENT_POOLS_BORROWS.get(pool, 0) + 1
+        return pool
+
+
+def return_persistent_pool(pool: Pool, discard: bool = False) -> None:
+    """Returns `pool` taken with `borrow_persistent_pool`. With `discard` the pool is not handed out anymore ie. because tasks of a failed run
+    may still be running in the workers. Pools that are not kept are terminated when the last run using them returns them.
+    """
+    with _PERSISTENT_POOLS_LOCK:
+        borrows = _PERSISTENT_POOLS_BORROWS.pop(pool) - 1
+        if borrows > 0:
+            _PERSISTENT_POOLS_BORROWS[pool] = borrows
+        if discard:
+            _PERSISTENT_POOLS.pop(_find_persistent_pool_key(pool), None)
+        terminate = borrows == 0 and _find_persistent_pool_key(pool) is None
+    if terminate:
+        logger.info("Closing discarded persistent pool")
+        pool.terminate()
+
+
+def close_persistent_pools() -> None:
+    """Terminates all pools kept between runs. Pools that are still used are terminated when returned"""
+    with _PERSISTENT_POOLS_LOCK:
+        idle_pools = [pool for pool in _PERSISTENT_POOLS.values() if pool not in _PERSISTENT_POOLS_BORROWS]
+        _PERSISTENT_POOLS.clear()
+    for pool in idle_pools:
+        pool.terminate()
+
+
+def _find_persistent_pool_key(pool: Pool) -> Optional[Tuple[TPoolType, int]]:
+    return next((key for key, persistent_pool in _PERSISTENT_POOLS.items() if persistent_pool is pool), None)
+
+
 def run_pool(config: PoolRunnerConfiguration, run_f: Union[Runnable[TPool], Callable[[TPool], TRunMetrics]]) -> int:
     # validate the run function
     if not isinstance(run_f, Runnable) and not callable(run_f):
         raise ValueError(run_f, "Pool runner entry point must be a function f(pool: TPool) or Runnable")
 
-    # start pool
-    pool = create_pool(config)
-    logger.info(f"Created {config.pool_type} pool with {config.workers or 'default no.'} workers")
+    # start pool or take the one kept from previous runs
+    if config.persistent_pool:
+        pool = borrow_persistent_pool(config)
+        logger.info(f"Using persistent {config.pool_type} pool with {config.workers or 'default no.'} workers")
+    else:
+        pool = create_pool(config)
+        logger.info(f"Created {config.pool_type} pool with {config.workers or 'default no.'} workers")
     runs_count = 1
+    # persistent pool is kept only if all the tasks completed
+    keep_pool = False
 
     def _run_func() -> bool:
         if callable(run_f):
@@ -50,13 +110,17 @@ def run_pool(config: PoolRunnerConfiguration, run_f: Union[Runnable[TPool], Call
             signals.raise_if_signalled()
             runs_count += 1
             sleep(config.run_sleep)
+        keep_pool = config.persistent_pool
         return runs_count
     except SignalReceivedException as sigex:
         # sleep this may raise SignalReceivedException
         logger.warning(f"Exiting runner due to signal {sigex.signal_code}")
         raise
     finally:
-        if pool:
+        if pool and config.persistent_pool:
+            # tasks of the failed run may still be running in the workers so the pool is not used again
+            return_persistent_pool(pool, discard=not keep_pool)
+        elif pool:
             logger.info("Closing processing pool")
             # terminate pool and do not join
             pool.terminate()
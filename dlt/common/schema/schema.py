@@ -1,6 +1,6 @@
 import yaml
 from copy import copy, deepcopy
-from typing import ClassVar, Dict, List, Mapping, Optional, Sequence, Tuple, Any, cast
+from typing import ClassVar, Dict, List, Mapping, Optional, Sequence, Tuple, Any, Type, cast
 from dlt.common import json
 
 from dlt.common.utils import extend_list_deduplicated
@@ -17,8 +17,16 @@ from dlt.common.schema.exceptions import (CannotCoerceColumnException, CannotCoe
 from dlt.common.validation import validate_dict
 
 
+# column name, column schema the step was made for, data type in schema and data type of the python value or None if value is passed as is
+TRowPlanStep = Tuple[str, Optional[TColumnSchema], TDataType, Optional[TDataType]]
+# column names and python types of the values in a row
+TRowPlanKey = Tuple[Tuple[str, ...], Tuple[Type[Any], ...]]
+
+
 class Schema:
     ENGINE_VERSION: ClassVar[int] = SCHEMA_ENGINE_VERSION
+    MAX_ROW_PLANS_PER_TABLE: ClassVar[int] = 64
+    """Max number of distinct row shapes for which coercion plans are cached in a single table"""
 
     naming: NamingConvention
     """Naming convention used by the schema to normalize identifiers"""
@@ -52,6 +60,8 @@ class Schema:
     _compiled_includes: Dict[str, Sequence[REPattern]]
     # type detections
     _type_detections: Sequence[TTypeDetections]
+    # coercion plans per table for rows with known column names and python types
+    _row_plans: Dict[str, Dict[TRowPlanKey, Sequence[TRowPlanStep]]]
 
     # normalizers config
     _normalizers_config: TNormalizersConfig
@@ -162,6 +172,18 @@ class Schema:
 
            Returns tuple with row with coerced values and a partial table containing just the newly added columns or None if no changes were detected
         """
+        # rows with the same column names and value types as already seen rows are coerced with a cached plan
+        table_plans = self._row_plans.get(table_name)
+        if table_plans:
+            table = self._schema_tables.get(table_name)
+            if table is not None:
+                plan_key: TRowPlanKey = (tuple(row), tuple(map(type, row.values())))
+                plan = table_plans.get(plan_key)
+                if plan is not None:
+                    coerced_row = self._coerce_row_with_plan(plan, table["columns"], row)
+                    if coerced_row is not None:
+                        return coerced_row, None
+
         # get existing or create a new table
         updated_table_partial: TPartialTableSchema = None
         table = self._schema_tables.get(table_name)
@@ -170,14 +192,18 @@ class Schema:
         table_columns = table["columns"]
 
         new_row: DictStrAny = {}
+        plan_steps: List[TRowPlanStep] = []
         for col_name, v in row.items():
             # skip None values, we should infer the types later
             if v is None:
                 # just check if column is nullable if it exists
                 self._coerce_null_value(table_columns, table_name, col_name)
+                plan_steps.append((col_name, table_columns.get(col_name), None, None))
             else:
                 new_col_name, new_col_def, new_v = self._coerce_non_null_value(table_columns, table_name, col_name, v)
                 new_row[new_col_name] = new_v
+                if new_col_name == col_name and not new_col_def:
+                    plan_steps.append(self._make_row_plan_step(table_columns[col_name], v))
                 if new_col_def:
                     if not updated_table_partial:
                         # create partial table with only the new columns
@@ -185,6 +211,12 @@ class Schema:
                         updated_table_partial["columns"] = {}
                     updated_table_partial["columns"][new_col_name] = new_col_def
 
+        # cache the plan if all values fit into existing columns without variants
+        if updated_table_partial is None and len(plan_steps) == len(row) and table_name in self._schema_tables:
+            table_plans = self._row_plans.setdefault(table_name, {})
+            if len(table_plans) < self.MAX_ROW_PLANS_PER_TABLE:
+                table_plans[(tuple(row), tuple(map(type, row.values())))] = plan_steps
+
         return new_row, updated_table_partial
 
     def update_schema(self, partial_table: TPartialTableSchema) -> TPartialTableSchema:
@@ -197,6 +229,9 @@ class Schema:
                     table_name, parent_table_name,
                     f" This may be due to misconfigured excludes filter that fully deletes content of the {parent_table_name}. Add includes that will preserve the parent table."
                     )
+        # coercion plans of the table are not valid anymore
+        self._row_plans.pop(table_name, None)
+        self.data_item_normalizer.on_schema_change(table_name)
         table = self._schema_tables.get(table_name)
         if table is None:
             # add the whole new table to SchemaTables
@@ -214,7 +249,8 @@ class Schema:
         Returns:
             Tuple[int, str]: Current (``stored_version``, ``stored_version_hash``) tuple
         """
-        version = utils.bump_version_if_modified(self.to_dict())
+        stored_schema = self.to_dict()
+        version = stored_schema["version"], stored_schema["version_hash"]
         self._stored_version, self._stored_version_hash = version
         return version
 
@@ -309,6 +345,11 @@ class Schema:
     def get_preferred_type(self, col_name: str) -> Optional[TDataType]:
         return next((m[1] for m in self._compiled_preferred_types if m[0].search(col_name)), None)
 
+    def infer_column_hints(self, col_name: str, data_type: TDataType) -> TColumnSchema:
+        """Creates schema of column `col_name` with known `data_type` and hints inferred from the column name. Used when data type
+        comes with the data ie. from arrow tables"""
+        return self._infer_column(col_name, None, data_type)
+
     @property
     def version(self) -> int:
         """Version of the schema content that takes into account changes from the time of schema loading/creation.
@@ -317,7 +358,7 @@ class Schema:
         Returns:
             int: Current schema version
         """
-        return utils.bump_version_if_modified(self.to_dict())[0]
+        return self.to_dict()["version"]
 
     @property
     def stored_version(self) -> int:
@@ -331,7 +372,7 @@ class Schema:
     @property
     def version_hash(self) -> str:
         """Current version hash of the schema, recomputed from the actual content"""
-        return utils.bump_version_if_modified(self.to_dict())[1]
+        return self.to_dict()["version_hash"]
 
     @property
     def stored_version_hash(self) -> str:
@@ -444,6 +485,44 @@ class Schema:
 
         return col_name, new_column, coerced_v
 
+    @staticmethod
+    def _make_row_plan_step(column: TColumnSchema, v: Any) -> TRowPlanStep:
+        col_type = column["data_type"]
+        py_type = py_type_to_sc_type(type(v))
+        # values of basic python types that match the column type are not coerced
+        if col_type == py_type and type(v) in (str, int, float, bool):
+            return column["name"], column, col_type, None
+        return column["name"], column, col_type, py_type
+
+    @staticmethod
+    def _coerce_row_with_plan(plan: Sequence[TRowPlanStep], table_columns: TTableSchemaColumns, row: StrAny) -> Optional[DictStrAny]:
+        """Coerces `row` with types resolved in `plan`. Returns None if any of the values requires a variant column or if
+        any of the columns in `table_columns` was replaced or modified in place after the plan was made
+        """
+        new_row: DictStrAny = {}
+        for (col_name, column, col_type, py_type), v in zip(plan, row.values()):
+            if table_columns.get(col_name) is not column:
+                return None
+            if col_type is None:
+                # skip None values if the column is still nullable
+                if column is not None and not column.get("nullable", True):
+                    return None
+                continue
+            if column.get("data_type") != col_type:
+                return None
+            if py_type is None:
+                new_row[col_name] = v
+                continue
+            try:
+                coerced_v = coerce_value(col_type, py_type, v)
+            except (ValueError, SyntaxError):
+                return None
+            # variants are generated only in full coercion
+            if callable(coerced_v):
+                return None
+            new_row[col_name] = coerced_v
+        return new_row
+
     def _infer_column_type(self, v: Any, col_name: str, skip_preferred: bool = False) -> TDataType:
         tv = type(v)
         # try to autodetect data type
@@ -510,6 +589,7 @@ class Schema:
         self._compiled_excludes: Dict[str, Sequence[REPattern]] = {}
         self._compiled_includes: Dict[str, Sequence[REPattern]] = {}
         self._type_detections: Sequence[TTypeDetections] = None
+        self._row_plans = {}
 
         self._normalizers_config = None
         self.naming = None
@@ -550,6 +630,10 @@ class Schema:
         self._schema_name = name
 
     def _compile_settings(self) -> None:
+        # tables or settings changed so drop all coercion plans
+        self._row_plans = {}
+        if self.data_item_normalizer:
+            self.data_item_normalizer.on_schema_change()
         # if self._settings:
         for pattern, dt in self._settings.get("preferred_types", {}).items():
             # add tuples to be searched in coercions
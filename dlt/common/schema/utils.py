@@ -149,13 +149,13 @@ def bump_version_if_modified(stored_schema: TStoredSchema) -> Tuple[int, str]:
 
 def generate_version_hash(stored_schema: TStoredSchema) -> str:
     # generates hash out of stored schema content, excluding the hash itself and version
-    schema_copy = deepcopy(stored_schema)
-    schema_copy.pop("version")
-    schema_copy.pop("version_hash", None)
-    schema_copy.pop("imported_version_hash", None)
+    # content is serialized, not modified so a shallow copy without the excluded keys is enough
+    # note: serialized tables are not cached, tables are modified in place via `Schema.tables` and column references
+    # so a cache invalidated only in `update_schema` would keep stale hashes and schema changes would not bump the version
+    schema_copy = {k: v for k, v in stored_schema.items() if k not in ("version", "version_hash", "imported_version_hash")}
     # ignore order of elements when computing the hash
-    content = json.dumps(schema_copy, sort_keys=True)
-    h = hashlib.sha3_256(content.encode("utf-8"))
+    content = json.dumpb(schema_copy, sort_keys=True)
+    h = hashlib.sha3_256(content)
     # additionally check column order
     table_names = sorted((schema_copy.get("tables") or {}).keys())
     if table_names:
@@ -1,6 +1,7 @@
+import asyncio
 import threading
 from types import ModuleType
-from typing import Dict, NamedTuple, Optional, Type
+from typing import Any, Dict, NamedTuple, Optional, Type
 
 from dlt.common.configuration.specs import BaseConfiguration
 from dlt.common.exceptions import ResourceNameNotAvailable
@@ -18,23 +19,33 @@ class SourceInfo(NamedTuple):
 _SOURCES: Dict[str, SourceInfo] = {}
 """A registry of all the decorated sources and resources discovered when importing modules"""
 
-_CURRENT_PIPE_NAME: Dict[int, str] = {}
-"""Name of currently executing pipe per thread id set during execution of a gen in pipe"""
+_CURRENT_PIPE_NAME: Dict[Any, str] = {}
+"""Name of currently executing pipe per thread id (or asyncio task) set during execution of a gen in pipe"""
+
+
+def _current_pipe_key() -> Any:
+    """Async generators of many pipes are evaluated on a single event loop thread, so they are identified by the running task"""
+    # avoid raising when there's no running loop, this is called for each extracted item
+    if asyncio._get_running_loop() is not None:
+        task = asyncio.current_task()
+        if task is not None:
+            return task
+    return threading.get_ident()
 
 
 def set_current_pipe_name(name: str) -> None:
     """Set pipe name in current thread"""
-    _CURRENT_PIPE_NAME[threading.get_ident()] = name
+    _CURRENT_PIPE_NAME[_current_pipe_key()] = name
 
 
 def unset_current_pipe_name() -> None:
     """Unset pipe name in current thread"""
-    _CURRENT_PIPE_NAME[threading.get_ident()] = None
+    _CURRENT_PIPE_NAME.pop(_current_pipe_key(), None)
 
 
 def get_current_pipe_name() -> str:
     """Gets pipe name associated with current thread"""
-    name = _CURRENT_PIPE_NAME.get(threading.get_ident())
+    name = _CURRENT_PIPE_NAME.get(_current_pipe_key())
     if name is None:
         raise ResourceNameNotAvailable()
     return name
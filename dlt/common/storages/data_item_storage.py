@@ -17,7 +17,8 @@ class DataItemStorage(ABC):
         # unique writer id
         writer_id = f"{load_id}.{schema_name}.{table_name}"
         writer = self.buffered_writers.get(writer_id, None)
-        if not writer:
+        # writers closed before all the items were written are replaced with new ones
+        if not writer or writer.closed:
             # assign a jsonl writer for each table
             path = self._get_data_item_path_template(load_id, schema_name, table_name)
             writer = BufferedDataWriter(self.loader_file_format, path)
@@ -36,7 +37,7 @@ class DataItemStorage(ABC):
     def close_writers(self, extract_id: str) -> None:
         # flush and close all files
         for name, writer in self.buffered_writers.items():
-            if name.startswith(extract_id):
+            if name.startswith(extract_id) and not writer.closed:
                 logger.debug(f"Closing writer for {name} with file {writer._file} and actual name {writer._file_name}")
                 writer.close()
 
@@ -1,12 +1,14 @@
 import contextlib
 from copy import deepcopy
+import gzip
 import os
+import shutil
 import datetime  # noqa: 251
 import humanize
 from os.path import join
 from pathlib import Path
 from pendulum.datetime import DateTime
-from typing import Dict, Iterable, List, NamedTuple, Literal, Optional, Sequence, Set, get_args, cast
+from typing import IO, Any, Dict, Iterable, List, NamedTuple, Literal, Optional, Sequence, Set, Tuple, get_args, cast
 
 from dlt.common import json, pendulum
 from dlt.common.configuration import known_sections
@@ -21,7 +23,7 @@ from dlt.common.storages.configuration import LoadStorageConfiguration
 from dlt.common.storages.versioned_storage import VersionedStorage
 from dlt.common.storages.data_item_storage import DataItemStorage
 from dlt.common.storages.exceptions import JobWithUnsupportedWriterException, LoadPackageNotFound
-from dlt.common.utils import flatten_list_or_items
+from dlt.common.utils import flatten_list_or_items, uniq_id
 
 
 # folders to manage load jobs in a single load package
@@ -190,6 +192,108 @@ class LoadStorage(DataItemStorage, VersionedStorage):
             writer.write_all(table, rows)
         return Path(file_name).name
 
+    def merge_temp_job_files(self, load_id: str, max_file_bytes: int) -> int:
+        """Merges job files of the same table and file format in temporary load package `load_id` into files of at most `max_file_bytes`
+        so fewer load jobs are created. Only jsonl, insert_values, csv and parquet files are merged, insert_values and csv files must have
+        the same columns and parquet files the same arrow schema. Returns the number of job files removed
+        """
+        groups: Dict[Tuple[str, str, str], List[Tuple[str, int]]] = {}
+        for file in sorted(self.storage.list_folder_files(join(load_id, LoadStorage.NEW_JOBS_FOLDER))):
+            file_path = self.storage.make_full_path(file)
+            file_size = os.path.getsize(file_path)
+            job_info = LoadStorage.parse_job_file_name(file)
+            if file_size >= max_file_bytes or job_info.file_format not in ("jsonl", "insert_values", "csv", "parquet"):
+                continue
+            merge_key = (job_info.table_name, job_info.file_format, LoadStorage._get_job_file_merge_key(job_info.file_format, file_path))
+            groups.setdefault(merge_key, []).append((file_path, file_size))
+
+        removed_count = 0
+        for (table_name, file_format, _), files in groups.items():
+            # take files in order until the next one does not fit
+            batches: List[List[str]] = [[]]
+            batch_size = 0
+            for file_path, file_size in files:
+                if batches[-1] and batch_size + file_size > max_file_bytes:
+                    batches.append([])
+                    batch_size = 0
+                batches[-1].append(file_path)
+                batch_size += file_size
+            for batch in batches:
+                if len(batch) < 2:
+                    continue
+                file_name = self.build_job_file_name(table_name, uniq_id(5), with_extension=False) + "." + file_format
+                merged_path = join(os.path.dirname(batch[0]), file_name)
+                if file_format == "parquet":
+                    LoadStorage._merge_parquet_job_files(batch, merged_path)
+                else:
+                    LoadStorage._merge_text_job_files(batch, merged_path, file_format)
+                # package is temporary so there's no need to do that atomically
+                for file_path in batch:
+                    os.remove(file_path)
+                removed_count += len(batch) - 1
+        return removed_count
+
+    @staticmethod
+    def _get_job_file_merge_key(file_format: str, file_path: str) -> str:
+        if file_format in ("insert_values", "csv"):
+            # header contains the column names
+            with FileStorage.open_zipsafe_ro(file_path, "rb") as f:
+                return cast(bytes, f.readline()).decode("utf-8")
+        if file_format == "parquet":
+            from dlt.common.libs.pyarrow import pyarrow
+
+            return str(pyarrow.parquet.read_schema(file_path).remove_metadata())
+        return ""
+
+    @staticmethod
+    def _merge_text_job_files(file_paths: Sequence[str], merged_path: str, file_format: str) -> None:
+        # keep compression of the merged files, empty files look like gzipped so they are skipped
+        is_gzipped = any(FileStorage.is_gzipped(path) for path in file_paths if os.path.getsize(path) > 0)
+        open_f = gzip.open if is_gzipped else open
+        with open_f(merged_path, "wb") as f_merged:  # type: ignore[operator]
+            has_rows = False
+            for file_path in file_paths:
+                with FileStorage.open_zipsafe_ro(file_path, "rb") as f:
+                    if file_format == "insert_values":
+                        # write header once and join the values of all files
+                        header = f.readline() + f.readline()
+                        values = f.read()
+                        if file_path is file_paths[0]:
+                            f_merged.write(header)
+                        if values.endswith(b";"):
+                            values = values[:-1]
+                        if values:
+                            if has_rows:
+                                f_merged.write(b",\n")
+                            f_merged.write(values)
+                            has_rows = True
+                    elif file_format == "csv":
+                        # write header once
+                        header = f.readline()
+                        if file_path is file_paths[0]:
+                            f_merged.write(header)
+                        shutil.copyfileobj(f, f_merged)
+                    else:
+                        shutil.copyfileobj(f, f_merged)
+            if has_rows:
+                f_merged.write(b";")
+
+    @staticmethod
+    def _merge_parquet_job_files(file_paths: Sequence[str], merged_path: str) -> None:
+        from dlt.common.libs.pyarrow import pyarrow
+
+        with open(merged_path, "wb") as f_merged:
+            writer = DataWriter.from_file_format("arrow", f_merged)
+            # row groups are copied without changes
+            for file_path in file_paths:
+                parquet_file = pyarrow.parquet.ParquetFile(file_path)
+                for row_group_no in range(parquet_file.num_row_groups):
+                    writer.write_data([parquet_file.read_row_group(row_group_no)])
+            if writer.items_count == 0:
+                # all files were empty
+                writer.write_data([pyarrow.parquet.read_schema(file_paths[0]).empty_table()])
+            writer.write_footer()
+
     def load_package_schema(self, load_id: str) -> Schema:
         # load schema from a load package to be processed
         schema_path = join(self.get_package_path(load_id), LoadStorage.SCHEMA_FILE_NAME)
@@ -47,10 +47,15 @@ class NormalizeStorage(VersionedStorage):
     @staticmethod
     def parse_normalize_file_name(file_name: str) -> TParsedNormalizeFileName:
         # parse extracted file name and returns (events found, load id, schema_name)
-        if not file_name.endswith("jsonl"):
+        if not file_name.endswith("jsonl") and not NormalizeStorage.is_arrow_file(file_name):
             raise ValueError(file_name)
 
         parts = Path(file_name).stem.split(".")
         if len(parts) != 3:
             raise ValueError(file_name)
         return TParsedNormalizeFileName(*parts)
+
+    @staticmethod
+    def is_arrow_file(file_name: str) -> bool:
+        # arrow tables and data frames are extracted into parquet files
+        return file_name.endswith("parquet")
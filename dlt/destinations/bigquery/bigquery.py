@@ -7,7 +7,9 @@ from google.api_core import exceptions as api_core_exceptions
 
 from dlt.common import json, logger
 from dlt.common.destination import DestinationCapabilitiesContext
-from dlt.common.destination.reference import FollowupJob, NewLoadJob, TLoadJobState, LoadJob
+from dlt.common.destination.reference import FollowupJob, NewLoadJob, TLoadJobState, LoadJob, WithReferenceJobsBatch
+from dlt.common.exceptions import DestinationTerminalException
+from dlt.common.runtime.logger import pretty_format_exception
 from dlt.common.data_types import TDataType
 from dlt.common.storages.file_storage import FileStorage
 from dlt.common.schema import TColumnSchema, Schema, TTableSchemaColumns
@@ -20,7 +22,7 @@ from dlt.destinations.bigquery import capabilities
 from dlt.destinations.bigquery.configuration import BigQueryClientConfiguration
 from dlt.destinations.bigquery.sql_client import BigQuerySqlClient, BQ_TERMINAL_REASONS
 from dlt.destinations.sql_jobs import SqlMergeJob, SqlStagingCopyJob
-from dlt.destinations.job_impl import NewReferenceJob
+from dlt.destinations.job_impl import EmptyLoadJob, NewReferenceJob
 from dlt.destinations.sql_client import SqlClientBase
 from dlt.destinations.type_mapping import TypeMapper
 
@@ -78,16 +80,19 @@ class BigQueryLoadJob(LoadJob, FollowupJob):
         file_name: str,
         bq_load_job: bigquery.LoadJob,
         http_timeout: float,
-        retry_deadline: float
+        retry_deadline: float,
+        poll_job: bool = True
     ) -> None:
         self.bq_load_job = bq_load_job
         self.default_retry = bigquery.DEFAULT_RETRY.with_deadline(retry_deadline)
         self.http_timeout = http_timeout
+        # jobs of files loaded in a batch share `bq_load_job` and only the first one polls the server
+        self.poll_job = poll_job
         super().__init__(file_name)
 
     def state(self) -> TLoadJobState:
         # check server if done
-        done = self.bq_load_job.done(retry=self.default_retry, timeout=self.http_timeout)
+        done = self.bq_load_job.done(retry=self.default_retry, timeout=self.http_timeout, reload=self.poll_job)
         if done:
             # rows processed
             if self.bq_load_job.output_rows is not None and self.bq_load_job.error_result is None:
@@ -150,9 +155,11 @@ class BigqueryStagingCopyJob(SqlStagingCopyJob):
             sql.append(f"CREATE TABLE {table_name} CLONE {staging_table_name};")
         return sql
 
-class BigQueryClient(SqlJobClientWithStaging):
+class BigQueryClient(SqlJobClientWithStaging, WithReferenceJobsBatch):
 
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
+    max_reference_jobs_batch: ClassVar[int] = 10000
+    """BigQuery accepts up to 10 000 source URIs in a load job"""
 
     def __init__(self, schema: Schema, config: BigQueryClientConfiguration) -> None:
         sql_client = BigQuerySqlClient(
@@ -176,7 +183,7 @@ class BigQueryClient(SqlJobClientWithStaging):
     def restore_file_load(self, file_path: str) -> LoadJob:
         """Returns a completed SqlLoadJob or restored BigQueryLoadJob
 
-        See base class for details on SqlLoadJob. BigQueryLoadJob is restored with job id derived from `file_path`
+        See base class for details on SqlLoadJob. BigQueryLoadJob is restored with job id stored in the reference file or derived from `file_path`
 
         Args:
             file_path (str): a path to a job file
@@ -207,27 +214,64 @@ class BigQueryClient(SqlJobClientWithStaging):
         job = super().start_file_load(table, file_path, load_id)
 
         if not job:
+            job = self._start_load_job(table, file_path)
+        return job
+
+    def start_reference_jobs_batch(self, table: TTableSchema, file_paths: Sequence[str], load_id: str) -> List[LoadJob]:
+        """Starts a single load job with a list of source URIs for the referenced files of each format.
+
+        The job id is derived from the first file in the list and stored in the reference files of the batch so each of them restores the job.
+        """
+        jobs: Dict[str, LoadJob] = {}
+        for references in NewReferenceJob.resolve_references_by_format(file_paths).values():
+            group_file_paths = list(references.keys())
+            # store the shared job id before the job starts so it is found when restored
+            job_id = BigQueryLoadJob.get_job_id_from_file_path(group_file_paths[0])
+            for file_path in group_file_paths:
+                NewReferenceJob.set_reference_job_id(file_path, job_id)
             try:
-                job = BigQueryLoadJob(
+                job = self._start_load_job(table, group_file_paths[0], list(references.values()))
+            except Exception as ex:
+                # jobs for other formats may be already running so only files in this group are failed or retried
+                logger.exception(f"Problem when starting load job for files {group_file_paths}")
+                state: TLoadJobState = "failed" if isinstance(ex, DestinationTerminalException) else "retry"
+                exception = pretty_format_exception()
+                for file_path in group_file_paths:
+                    jobs[file_path] = EmptyLoadJob.from_file_path(file_path, state, exception)
+                continue
+            jobs[group_file_paths[0]] = job
+            for file_path in group_file_paths[1:]:
+                jobs[file_path] = BigQueryLoadJob(
                     FileStorage.get_file_name_from_file_path(file_path),
-                    self._create_load_job(table, file_path),
+                    cast(BigQueryLoadJob, job).bq_load_job,
                     self.config.http_timeout,
-                    self.config.retry_deadline
+                    self.config.retry_deadline,
+                    poll_job=False
                 )
-            except api_core_exceptions.GoogleAPICallError as gace:
-                reason = BigQuerySqlClient._get_reason_from_errors(gace)
-                if reason == "notFound":
-                    # google.api_core.exceptions.NotFound: 404 - table not found
-                    raise LoadJobUnknownTableException(table["name"], file_path)
-                elif reason == "duplicate":
-                    # google.api_core.exceptions.Conflict: 409 PUT - already exists
-                    return self.restore_file_load(file_path)
-                elif reason in BQ_TERMINAL_REASONS:
-                    # google.api_core.exceptions.BadRequest - will not be processed ie bad job name
-                    raise LoadJobTerminalException(file_path, f"The server reason was: {reason}")
-                else:
-                    raise DestinationTransientException(gace)
-        return job
+        return [jobs[file_path] for file_path in file_paths]
+
+    def _start_load_job(self, table: TTableSchema, file_path: str, bucket_paths: Sequence[str] = None) -> LoadJob:
+        """Starts a load job with id derived from `file_path`, loading data from `bucket_paths` if provided"""
+        try:
+            return BigQueryLoadJob(
+                FileStorage.get_file_name_from_file_path(file_path),
+                self._create_load_job(table, file_path, bucket_paths),
+                self.config.http_timeout,
+                self.config.retry_deadline
+            )
+        except api_core_exceptions.GoogleAPICallError as gace:
+            reason = BigQuerySqlClient._get_reason_from_errors(gace)
+            if reason == "notFound":
+                # google.api_core.exceptions.NotFound: 404 - table not found
+                raise LoadJobUnknownTableException(table["name"], file_path)
+            elif reason == "duplicate":
+                # google.api_core.exceptions.Conflict: 409 PUT - already exists
+                return self.restore_file_load(file_path)
+            elif reason in BQ_TERMINAL_REASONS:
+                # google.api_core.exceptions.BadRequest - will not be processed ie bad job name
+                raise LoadJobTerminalException(file_path, f"The server reason was: {reason}")
+            else:
+                raise DestinationTransientException(gace)
 
     def _get_table_update_sql(self, table_name: str, new_columns: Sequence[TColumnSchema], generate_alter: bool, separate_alters: bool = False) -> List[str]:
         sql = super()._get_table_update_sql(table_name, new_columns, generate_alter)
@@ -277,16 +321,15 @@ class BigQueryClient(SqlJobClientWithStaging):
         except gcp_exceptions.NotFound:
             return False, schema_table
 
-    def _create_load_job(self, table: TTableSchema, file_path: str) -> bigquery.LoadJob:
+    def _create_load_job(self, table: TTableSchema, file_path: str, bucket_paths: Sequence[str] = None) -> bigquery.LoadJob:
         # append to table for merge loads (append to stage) and regular appends
         table_name = table["name"]
 
-        # determine wether we load from local or uri
-        bucket_path = None
+        # determine wether we load from local or uri(s), all uris must have the same format
         ext: str = os.path.splitext(file_path)[1][1:]
         if NewReferenceJob.is_reference_job(file_path):
-            bucket_path = NewReferenceJob.resolve_reference(file_path)
-            ext = os.path.splitext(bucket_path)[1][1:]
+            bucket_paths = bucket_paths or [NewReferenceJob.resolve_reference(file_path)]
+            ext = os.path.splitext(bucket_paths[0])[1][1:]
 
         # choose correct source format
         source_format = bigquery.SourceFormat.NEWLINE_DELIMITED_JSON
@@ -309,9 +352,9 @@ class BigQueryClient(SqlJobClientWithStaging):
             ignore_unknown_values=False,
             max_bad_records=0)
 
-        if bucket_path:
+        if bucket_paths:
             return self.sql_client.native_connection.load_table_from_uri(
-                    bucket_path,
+                    bucket_paths,
                     self.sql_client.make_qualified_table_name(table_name, escape=False),
                     job_id=job_id,
                     job_config=job_config,
@@ -328,7 +371,11 @@ class BigQueryClient(SqlJobClientWithStaging):
                 )
 
     def _retrieve_load_job(self, file_path: str) -> bigquery.LoadJob:
-        job_id = BigQueryLoadJob.get_job_id_from_file_path(file_path)
+        job_id = None
+        if NewReferenceJob.is_reference_job(file_path):
+            # reference files loaded in a batch share the job of the first file, see `start_reference_jobs_batch`
+            job_id = NewReferenceJob.get_reference_job_id(file_path)
+        job_id = job_id or BigQueryLoadJob.get_job_id_from_file_path(file_path)
         return cast(bigquery.LoadJob, self.sql_client.native_connection.get_job(job_id))
 
     def _from_db_type(self, bq_t: str, precision: Optional[int], scale: Optional[int]) -> TColumnType:
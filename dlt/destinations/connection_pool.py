@@ -0,0 +1,167 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, ClassVar, Deque, Dict, Generic, Hashable, List, Optional, Tuple
+
+from dlt.common import json, logger
+from dlt.common.configuration import configspec
+from dlt.common.configuration.container import Container
+from dlt.common.configuration.specs.base_configuration import BaseConfiguration, ContainerInjectableContext
+from dlt.common.utils import digest128
+
+from dlt.destinations.typing import TNativeConn
+
+
+class ConnectionPool(Generic[TNativeConn]):
+    """A thread safe pool of native connections to a single destination.
+
+    Borrowing never blocks: a new connection is opened if no idle connection is available. At most `max_size` connections are kept idle,
+    connections idle for longer than `idle_timeout` seconds are evicted. `close_f` closes a native connection and `check_f` tells if idle
+    connection can be reused, it may also reset the session state of the connection.
+    """
+
+    def __init__(
+        self,
+        close_f: Callable[[TNativeConn], None],
+        check_f: Callable[[TNativeConn], bool],
+        max_size: int,
+        idle_timeout: float
+    ) -> None:
+        self.close_f = close_f
+        self.check_f = check_f
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.opened_count = 0
+        """Number of connections opened by the pool"""
+        self.reused_count = 0
+        """Number of times an idle connection was reused"""
+        self.closed = False
+        self._idle: Deque[Tuple[TNativeConn, float]] = deque()
+        self._lock = threading.Lock()
+
+    def borrow(self, open_f: Callable[[], TNativeConn]) -> TNativeConn:
+        """Returns healthy idle connection or opens a new one with `open_f`"""
+        while True:
+            with self._lock:
+                expired = self._evict_idle()
+                idle = self._idle.pop() if self._idle else None
+            # connections are closed and checked outside of the lock as it may take time
+            for conn in expired:
+                self._close(conn)
+            if idle is None:
+                break
+            # most recently returned connection is the most likely to be alive
+            conn = idle[0]
+            if self._is_healthy(conn):
+                with self._lock:
+                    self.reused_count += 1
+                return conn
+            self._close(conn)
+        conn = open_f()
+        with self._lock:
+            self.opened_count += 1
+        return conn
+
+    def return_conn(self, conn: TNativeConn) -> None:
+        """Puts `conn` back into the pool or closes it if pool is full or closed"""
+        with self._lock:
+            expired = self._evict_idle()
+            is_pooled = not self.closed and len(self._idle) < self.max_size
+            if is_pooled:
+                self._idle.append((conn, time.monotonic()))
+        for expired_conn in expired:
+            self._close(expired_conn)
+        if not is_pooled:
+            self._close(conn)
+
+    def close(self) -> None:
+        """Closes all idle connections, connections returned after that are closed as well"""
+        with self._lock:
+            self.closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+        for conn in idle:
+            self._close(conn)
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def _evict_idle(self) -> List[TNativeConn]:
+        """Removes connections idle for too long and returns them to be closed outside of the lock. Must be called with the lock held"""
+        # idle connections are ordered by return time, oldest first
+        now = time.monotonic()
+        expired: List[TNativeConn] = []
+        while self._idle and now - self._idle[0][1] > self.idle_timeout:
+            expired.append(self._idle.popleft()[0])
+        return expired
+
+    def _is_healthy(self, conn: TNativeConn) -> bool:
+        try:
+            return self.check_f(conn)
+        except Exception:
+            return False
+
+    def _close(self, conn: TNativeConn) -> None:
+        try:
+            self.close_f(conn)
+        except Exception as ex:
+            logger.warning(f"Could not close pooled connection: {ex}")
+
+
+@configspec
+class ConnectionPoolsContext(ContainerInjectableContext):
+    """A context with connection pools keyed by destination, present when `Load` is running"""
+    max_size: int = 1
+    """Max number of idle connections kept by each pool"""
+    idle_timeout: float = 60.0
+    """Idle connections are closed after that many seconds"""
+    _pools: Dict[Hashable, ConnectionPool[Any]]
+    _pools_lock: threading.Lock
+
+    can_create_default: ClassVar[bool] = False
+
+    def __init__(self, max_size: int = 1, idle_timeout: float = 60.0) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._pools = {}
+        self._pools_lock = threading.Lock()
+
+    def get_pool(self, key: Hashable, close_f: Callable[[TNativeConn], None], check_f: Callable[[TNativeConn], bool]) -> ConnectionPool[TNativeConn]:
+        """Gets or creates a pool for a destination identified by `key`"""
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = ConnectionPool(close_f, check_f, self.max_size, self.idle_timeout)
+            return pool
+
+    def close(self) -> None:
+        """Closes all idle connections in all pools"""
+        with self._pools_lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.close()
+
+
+def get_active_pools() -> ConnectionPoolsContext:
+    """Returns connection pools context if injected ie. by `Load`, otherwise None"""
+    container = Container()
+    if ConnectionPoolsContext in container:
+        return container[ConnectionPoolsContext]
+    return None
+
+
+def credentials_pool_key(credentials: Optional[BaseConfiguration]) -> str:
+    """Returns a digest of the connection fields of `credentials` so clients with equal credentials share a pool"""
+    if credentials is None:
+        return ""
+    return digest128(json.dumps(_connection_fields(credentials), sort_keys=True))
+
+
+def _connection_fields(credentials: BaseConfiguration) -> Dict[str, Any]:
+    # values are serialized explicitly, reprs of objects may contain memory addresses and differ for equal credentials
+    fields: Dict[str, Any] = {}
+    for key in credentials.get_resolvable_fields():
+        value = credentials[key]
+        fields[key] = _connection_fields(value) if isinstance(value, BaseConfiguration) else value
+    return fields
@@ -1,7 +1,7 @@
 import duckdb
 
 from contextlib import contextmanager
-from typing import Any, AnyStr, ClassVar, Iterator, Optional, Sequence
+from typing import Any, AnyStr, ClassVar, Dict, Hashable, Iterator, Optional, Sequence, Tuple
 from dlt.common.destination import DestinationCapabilitiesContext
 
 from dlt.destinations.exceptions import DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
@@ -33,6 +33,7 @@ class DuckDbSqlClient(SqlClientBase[duckdb.DuckDBPyConnection], DBTransaction):
 
     dbapi: ClassVar[DBApi] = duckdb
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
+    _borrowed_cursors: ClassVar[Dict[int, Tuple[duckdb.DuckDBPyConnection, DuckDbBaseCredentials]]] = {}
 
     def __init__(self, dataset_name: str, credentials: DuckDbBaseCredentials) -> None:
         super().__init__(None, dataset_name)
@@ -41,9 +42,19 @@ class DuckDbSqlClient(SqlClientBase[duckdb.DuckDBPyConnection], DBTransaction):
 
     @raise_open_connection_error
     def open_connection(self) -> duckdb.DuckDBPyConnection:
-        self._conn = self.credentials.borrow_conn(read_only=self.credentials.read_only)
+        self._conn = self._borrow_connection(self._connect)
+        return self._conn
+
+    def close_connection(self) -> None:
+        if self._conn:
+            self._return_connection(self._conn)
+            self._conn = None
+
+    def _connect(self) -> duckdb.DuckDBPyConnection:
+        conn = self.credentials.borrow_conn(read_only=self.credentials.read_only)
+        self._borrowed_cursors[id(conn)] = (conn, self.credentials)
         # TODO: apply config settings from credentials
-        self._conn.execute("PRAGMA enable_checkpoint_on_shutdown;")
+        conn.execute("PRAGMA enable_checkpoint_on_shutdown;")
         config={
             "search_path": self.fully_qualified_dataset_name(),
             "TimeZone": "UTC",
@@ -54,15 +65,34 @@ class DuckDbSqlClient(SqlClientBase[duckdb.DuckDBPyConnection], DBTransaction):
                 try:
                     # TODO: serialize str and ints, dbapi args do not work here
                     # TODO: enable various extensions ie. parquet
-                    self._conn.execute(f"SET {k} = '{v}'")
+                    conn.execute(f"SET {k} = '{v}'")
                 except (duckdb.CatalogException, duckdb.BinderException):
                     pass
-        return self._conn
-
-    def close_connection(self) -> None:
-        if self._conn:
-            self.credentials.return_conn(self._conn)
-            self._conn = None
+        return conn
+
+    def _connection_pool_key(self) -> Hashable:
+        # clients of the same database share a pool. external connection has no path, its pool is bound to the connection object
+        # which is kept alive by the credentials of the client referenced from the pool via `_close_native_connection`
+        database = self.credentials._conn_str()
+        if database == ":external:":
+            return (type(self), id(self.credentials._conn), self.dataset_name)
+        return (type(self), database, self.dataset_name)
+
+    def _close_native_connection(self, conn: duckdb.DuckDBPyConnection) -> None:
+        # pooled cursors keep the main connection in credentials open. clients with different credentials instances
+        # share a pool so the cursor is returned to the credentials it was borrowed from
+        _, credentials = self._borrowed_cursors.pop(id(conn), (conn, self.credentials))
+        credentials.return_conn(conn)
+
+    def _is_connection_reusable(self, conn: duckdb.DuckDBPyConnection) -> bool:
+        # roll back transaction left open ie. by a failed job, raises on closed cursor
+        try:
+            conn.rollback()
+        except duckdb.TransactionException:
+            pass
+        # consume the result, pending result breaks multi statement queries executed next
+        conn.execute("SELECT 1").fetchall()
+        return True
 
     @contextmanager
     @raise_database_error
@@ -8,7 +8,7 @@ from dlt.common.schema import Schema, TTableSchema, TSchemaTables
 from dlt.common.schema.typing import TWriteDisposition
 from dlt.common.storages import FileStorage
 from dlt.common.destination import DestinationCapabilitiesContext
-from dlt.common.destination.reference import FollowupJob, NewLoadJob, TLoadJobState, LoadJob, JobClientBase
+from dlt.common.destination.reference import FollowupJob, NewLoadJob, TLoadJobState, LoadJob, JobClientBase, WithReferenceJobsBatch
 
 from dlt.destinations.exceptions import (LoadJobNotExistsException, LoadJobInvalidStateTransitionException,
                                             DestinationTerminalException, DestinationTransientException)
@@ -69,7 +69,7 @@ class LoadDummyJob(LoadJob, FollowupJob):
 JOBS: Dict[str, LoadDummyJob] = {}
 
 
-class DummyClient(JobClientBase):
+class DummyClient(JobClientBase, WithReferenceJobsBatch):
     """dummy client storing jobs in memory"""
 
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
@@ -106,6 +106,9 @@ class DummyClient(JobClientBase):
 
         return JOBS[job_id]
 
+    def start_reference_jobs_batch(self, table: TTableSchema, file_paths: Sequence[str], load_id: str) -> List[LoadJob]:
+        return [self.start_file_load(table, file_path, load_id) for file_path in file_paths]
+
     def restore_file_load(self, file_path: str) -> LoadJob:
         job_id = FileStorage.get_file_name_from_file_path(file_path)
         if job_id not in JOBS:
@@ -10,6 +10,10 @@ from dlt.common.storages import FilesystemConfiguration
 @configspec
 class FilesystemDestinationClientConfiguration(FilesystemConfiguration, DestinationClientStagingConfiguration): # type: ignore[misc]
     destination_name: Final[str] = "filesystem"  # type: ignore
+    upload_chunk_size: Optional[int] = None
+    """Size in bytes of a part in multipart upload, if not set the filesystem default is used"""
+    max_upload_concurrency: Optional[int] = None
+    """Number of parts of a single file uploaded concurrently in multipart upload, if not set the filesystem default is used"""
 
     @resolve_type('credentials')
     def resolve_credentials_type(self) -> Type[CredentialsConfiguration]:
@@ -24,5 +28,7 @@ class FilesystemDestinationClientConfiguration(FilesystemConfiguration, Destinat
             dataset_name: str = None,
             default_schema_name: Optional[str] = None,
             bucket_url: str = None,
+            upload_chunk_size: Optional[int] = None,
+            max_upload_concurrency: Optional[int] = None,
         ) -> None:
             ...
@@ -1,7 +1,7 @@
 import posixpath
 import os
 from types import TracebackType
-from typing import ClassVar, List, Type, Iterable, Set
+from typing import ClassVar, List, Type, Iterable, Set, Tuple, Hashable
 from fsspec import AbstractFileSystem
 
 from dlt.common import logger
@@ -9,7 +9,9 @@ from dlt.common.schema import Schema, TSchemaTables, TTableSchema
 from dlt.common.storages import FileStorage, LoadStorage, filesystem_from_config
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.destination.reference import NewLoadJob, TLoadJobState, LoadJob, JobClientBase, FollowupJob
+from dlt.common.typing import DictStrAny
 
+from dlt.destinations.connection_pool import ConnectionPool, credentials_pool_key, get_active_pools
 from dlt.destinations.job_impl import EmptyLoadJob
 from dlt.destinations.filesystem import capabilities
 from dlt.destinations.filesystem.configuration import FilesystemDestinationClientConfiguration
@@ -25,7 +27,8 @@ class LoadFilesystemJob(LoadJob):
             *,
             config: FilesystemDestinationClientConfiguration,
             schema_name: str,
-            load_id: str
+            load_id: str,
+            fs_client: AbstractFileSystem = None
     ) -> None:
         file_name = FileStorage.get_file_name_from_file_path(local_path)
         self.config = config
@@ -33,11 +36,22 @@ class LoadFilesystemJob(LoadJob):
         self.destination_file_name = LoadFilesystemJob.make_destination_filename(config.layout, file_name, schema_name, load_id)
 
         super().__init__(file_name)
-        fs_client, _ = filesystem_from_config(config)
-        self.destination_file_name = LoadFilesystemJob.make_destination_filename(config.layout, file_name, schema_name, load_id)
+        # reuse the filesystem of the client, create new one only if job is used standalone
+        if fs_client is None:
+            fs_client, _ = filesystem_from_config(config)
         item = self.make_remote_path()
-        logger.info("PUT file {item}")
-        fs_client.put_file(local_path, item)
+        logger.info(f"PUT file {item}")
+        fs_client.put_file(local_path, item, **self.make_put_kwargs(config))
+
+    @staticmethod
+    def make_put_kwargs(config: FilesystemDestinationClientConfiguration) -> DictStrAny:
+        """Passes multipart upload settings to `put_file` only if set so filesystems that do not support them are not affected"""
+        put_kwargs: DictStrAny = {}
+        if config.upload_chunk_size:
+            put_kwargs["chunksize"] = config.upload_chunk_size
+        if config.max_upload_concurrency:
+            put_kwargs["max_concurrency"] = config.max_upload_concurrency
+        return put_kwargs
 
     @staticmethod
     def make_destination_filename(layout: str, file_name: str, schema_name: str, load_id: str) -> str:
@@ -77,8 +91,10 @@ class FilesystemClient(JobClientBase):
 
     def __init__(self, schema: Schema, config: FilesystemDestinationClientConfiguration) -> None:
         super().__init__(schema, config)
-        self.fs_client, self.fs_path = filesystem_from_config(config)
         self.config: FilesystemDestinationClientConfiguration = config
+        self._fs_pool: ConnectionPool[Tuple[AbstractFileSystem, str]] = None
+        self._fs = self._borrow_filesystem()
+        self.fs_client, self.fs_path = self._fs
         # verify files layout. we need {table_name} and only allow {schema_name} before it, otherwise tables
         # cannot be replaced and we cannot initialize folders consistently
         self.table_prefix_layout = path_utils.get_table_prefix_layout(config.layout)
@@ -105,6 +121,7 @@ class FilesystemClient(JobClientBase):
                 truncate_prefixes.add(posixpath.join(self.dataset_path, table_prefix))
             # print(f"TRUNCATE PREFIXES {truncate_prefixes}")
 
+            truncated_files: List[str] = []
             for truncate_dir in truncated_dirs:
                 # get files in truncate dirs
                 # NOTE: glob implementation in fsspec does not look thread safe, way better is to use ls and then filter
@@ -116,14 +133,15 @@ class FilesystemClient(JobClientBase):
                     # print(f"in truncate dir {truncate_dir}: {all_files}")
                     for item in all_files:
                         # check every file against all the prefixes
-                        for search_prefix in truncate_prefixes:
-                            if item.startswith(search_prefix):
-                                # NOTE: deleting in chunks on s3 does not raise on access denied, file non existing and probably other errors
-                                logger.info(f"DEL {item}")
-                                # print(f"DEL {item}")
-                                self.fs_client.rm(item)
+                        if any(item.startswith(search_prefix) for search_prefix in truncate_prefixes):
+                            logger.info(f"DEL {item}")
+                            truncated_files.append(item)
                 except FileNotFoundError:
                     logger.info(f"Directory or path to truncate tables {truncate_dir} does not exist but it should be created previously!")
+            if truncated_files:
+                # delete all files with a single call, cloud filesystems send batched delete requests
+                # NOTE: deleting in chunks on s3 does not raise on access denied, file non existing and probably other errors
+                self.fs_client.rm(truncated_files)
 
     def update_stored_schema(self, only_tables: Iterable[str] = None, expected_update: TSchemaTables = None) -> TSchemaTables:
         # create destination dirs for all tables
@@ -152,7 +170,8 @@ class FilesystemClient(JobClientBase):
             self.dataset_path,
             config=self.config,
             schema_name=self.schema.name,
-            load_id=load_id
+            load_id=load_id,
+            fs_client=self.fs_client
         )
 
     def restore_file_load(self, file_path: str) -> LoadJob:
@@ -168,4 +187,19 @@ class FilesystemClient(JobClientBase):
         return self
 
     def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: TracebackType) -> None:
-        pass
+        if self._fs_pool is not None:
+            self._fs_pool.return_conn(self._fs)
+            self._fs_pool = None
+
+    def _borrow_filesystem(self) -> Tuple[AbstractFileSystem, str]:
+        """Borrows authenticated filesystem from a pool if connection pools are active (ie. when running in `Load`) so the
+        credentials are resolved and the filesystem with its http sessions is created once per load, not for every client and job.
+        """
+        pools = get_active_pools()
+        if pools is None:
+            return filesystem_from_config(self.config)
+        self._fs_pool = pools.get_pool(self._filesystem_pool_key(), lambda fs: None, lambda fs: True)
+        return self._fs_pool.borrow(lambda: filesystem_from_config(self.config))
+
+    def _filesystem_pool_key(self) -> Hashable:
+        return (type(self), credentials_pool_key(self.config.credentials), self.config.bucket_url)
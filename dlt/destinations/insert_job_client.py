@@ -1,11 +1,12 @@
 import os
 import abc
+import time
 from typing import Any, Iterator, List
 
+from dlt.common import logger
 from dlt.common.destination.reference import LoadJob, FollowupJob, TLoadJobState
 from dlt.common.schema.typing import TTableSchema
 from dlt.common.storages import FileStorage
-from dlt.common.utils import chunks
 
 from dlt.destinations.sql_client import SqlClientBase
 from dlt.destinations.job_impl import EmptyLoadJob
@@ -16,10 +17,19 @@ class InsertValuesLoadJob(LoadJob, FollowupJob):
     def __init__(self, table_name: str, file_path: str, sql_client: SqlClientBase[Any]) -> None:
         super().__init__(FileStorage.get_file_name_from_file_path(file_path))
         self._sql_client = sql_client
+        self.rows_count = 0
+        self.query_length = 0
+        started_at = time.monotonic()
         # insert file content immediately
         with self._sql_client.begin_transaction():
             for fragments in self._insert(sql_client.make_qualified_table_name(table_name), file_path):
                 self._sql_client.execute_fragments(fragments)
+                self.query_length += sum(map(len, fragments))
+        elapsed = max(time.monotonic() - started_at, 0.001)
+        logger.info(
+            f"Inserted {self.rows_count} rows into {table_name} from {self._file_name} in {elapsed:.3f}s: "
+            f"{self.rows_count / elapsed:.0f} rows/s, {self.query_length / elapsed:.0f} characters/s"
+        )
 
     def state(self) -> TLoadJobState:
         # this job is always done
@@ -30,63 +40,48 @@ class InsertValuesLoadJob(LoadJob, FollowupJob):
         raise NotImplementedError()
 
     def _insert(self, qualified_table_name: str, file_path: str) -> Iterator[List[str]]:
+        """Reads the file line by line and yields lists of SQL fragments, each executed in a single round trip. A round trip contains one or
+        more INSERT statements with up to `max_query_length // 2` characters of values and each statement has at most `max_rows_per_insert` rows.
+        Lines (rows) are passed as fragments so file content is not copied until the driver joins the fragments.
+        """
         # WARNING: maximum redshift statement is 16MB https://docs.aws.amazon.com/redshift/latest/dg/c_redshift-sql.html
-        # the procedure below will split the inserts into max_query_length // 2 packs
+        max_length = self._sql_client.capabilities.max_query_length // 2
+        max_rows = self._sql_client.capabilities.max_rows_per_insert
         with FileStorage.open_zipsafe_ro(file_path, "r", encoding="utf-8") as f:
-            header = f.readline()
+            header = f.readline().format(qualified_table_name)
             values_mark = f.readline()
             # properly formatted file has a values marker at the beginning
             assert values_mark == "VALUES\n"
 
-            max_rows = self._sql_client.capabilities.max_rows_per_insert
-
-            insert_sql = []
-            while content := f.read(self._sql_client.capabilities.max_query_length // 2):
-                # read one more line in order to
-                # 1. complete the content which ends at "random" position, not an end line
-                # 2. to modify its ending without a need to re-allocating the 8MB of "content"
-                until_nl = f.readline()
-                # if until next line contains just '\n' try to take another line so we can finish content properly
-                # TODO: write test for this case (content ends with ",")
-                if until_nl == "\n":
-                    until_nl = f.readline()
-                until_nl = until_nl.strip("\n")
-                # if there was anything left, until_nl contains the last line
-                is_eof = len(until_nl) == 0 or until_nl[-1] == ";"
-                if not is_eof:
-                    # print(f'replace the "," with " {until_nl} {len(insert_sql)}')
-                    until_nl = until_nl[:-1] + ";"
-
-                if max_rows is not None:
-                    # mssql has a limit of 1000 rows per INSERT, so we need to split into separate statements
-                    values_rows = content.splitlines(keepends=True)
-                    len_rows = len(values_rows)
-                    processed = 0
-                    # Chunk by max_rows - 1 for simplicity because one more row may be added
-                    for chunk in chunks(values_rows, max_rows - 1):
-                        processed += len(chunk)
-                        insert_sql.extend([header.format(qualified_table_name), values_mark])
-                        if processed == len_rows:
-                            # On the last chunk we need to add the extra row read
-                            insert_sql.append("".join(chunk) + until_nl)
-                        else:
-                            # Replace the , with ;
-                            insert_sql.append("".join(chunk).strip()[:-1] + ";\n")
-                else:
-                    # otherwise write all content in a single INSERT INTO
-                    insert_sql.extend([header.format(qualified_table_name), values_mark, content])
-
-                    if until_nl:
-                        insert_sql.append(until_nl)
-
-                # actually this may be empty if we were able to read a full file into content
-                if not is_eof:
-                    # execute chunk of insert
-                    yield insert_sql
-                    insert_sql = []
-
-        if insert_sql:
-            yield insert_sql
+            fragments: List[str] = []
+            fragments_length = statement_length = statement_rows = 0
+            for line in f:
+                # a line starting before the length limit is still added to the statement
+                if statement_rows > 0 and (statement_length >= max_length or statement_rows == max_rows):
+                    # mssql has a limit of 1000 rows per INSERT, so several statements may be sent together
+                    fragments[-1] = self._end_statement(fragments[-1])
+                    statement_length = statement_rows = 0
+                    if fragments_length >= max_length:
+                        yield fragments
+                        fragments = []
+                        fragments_length = 0
+                if statement_rows == 0:
+                    fragments.extend((header, values_mark))
+                fragments.append(line)
+                statement_rows += 1
+                statement_length += len(line)
+                fragments_length += len(line)
+                self.rows_count += 1
+
+            if fragments:
+                fragments[-1] = self._end_statement(fragments[-1])
+                yield fragments
+
+    @staticmethod
+    def _end_statement(line: str) -> str:
+        # the last row of a statement ends with ; instead of ,
+        line = line.rstrip("\n")
+        return line[:-1] + ";" if line.endswith(",") else line
 
 
 class InsertValuesJobClient(SqlJobClientWithStaging):
@@ -1,5 +1,6 @@
 import os
 import tempfile  # noqa: 251
+from typing import Dict, List, Optional, Sequence
 
 from dlt.common.storages import FileStorage
 
@@ -53,5 +54,28 @@ class NewReferenceJob(NewLoadJobImpl):
     @staticmethod
     def resolve_reference(file_path: str) -> str:
         with open(file_path, "r+", encoding="utf-8") as f:
-            # Reading from a file
-            return f.read()
+            # Reading from a file, remote path is in the first line
+            return f.readline().rstrip("\n")
+
+    @staticmethod
+    def resolve_references_by_format(file_paths: Sequence[str]) -> Dict[str, Dict[str, str]]:
+        """Resolves references in `file_paths` and groups them by the file format of the remote paths. Each group maps reference file path to remote path"""
+        remote_paths: Dict[str, Dict[str, str]] = {}
+        for file_path in file_paths:
+            remote_path = NewReferenceJob.resolve_reference(file_path)
+            remote_paths.setdefault(os.path.splitext(remote_path)[1][1:], {})[file_path] = remote_path
+        return remote_paths
+
+    @staticmethod
+    def set_reference_job_id(file_path: str, job_id: str) -> None:
+        """Stores in the reference file the id of a destination job that loads the referenced file, ie. together with other files"""
+        remote_path = NewReferenceJob.resolve_reference(file_path)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(remote_path + "\n" + job_id)
+
+    @staticmethod
+    def get_reference_job_id(file_path: str) -> Optional[str]:
+        """Gets destination job id stored with `set_reference_job_id` or None"""
+        with open(file_path, "r", encoding="utf-8") as f:
+            f.readline()
+            return f.readline() or None
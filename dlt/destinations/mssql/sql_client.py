@@ -36,21 +36,33 @@ class PyOdbcMsSqlClient(SqlClientBase[pyodbc.Connection], DBTransaction):
         self.credentials = credentials
 
     def open_connection(self) -> pyodbc.Connection:
-        self._conn = pyodbc.connect(
-            self.credentials.to_odbc_dsn(),
-            timeout=self.credentials.connect_timeout,
-        )
-        # https://github.com/mkleehammer/pyodbc/wiki/Using-an-Output-Converter-function
-        self._conn.add_output_converter(-155, handle_datetimeoffset)
-        self._conn.autocommit = True
+        self._conn = self._borrow_connection(self._connect)
         return self._conn
 
     @raise_open_connection_error
     def close_connection(self) -> None:
         if self._conn:
-            self._conn.close()
+            self._return_connection(self._conn)
             self._conn = None
 
+    def _connect(self) -> pyodbc.Connection:
+        conn = pyodbc.connect(
+            self.credentials.to_odbc_dsn(),
+            timeout=self.credentials.connect_timeout,
+        )
+        # https://github.com/mkleehammer/pyodbc/wiki/Using-an-Output-Converter-function
+        conn.add_output_converter(-155, handle_datetimeoffset)
+        conn.autocommit = True
+        return conn
+
+    def _is_connection_reusable(self, conn: pyodbc.Connection) -> bool:
+        if conn.closed:
+            return False
+        # make sure that pooled connection does not continue any transaction
+        conn.rollback()
+        conn.autocommit = True
+        return True
+
     @contextmanager
     def begin_transaction(self) -> Iterator[DBTransaction]:
         try:
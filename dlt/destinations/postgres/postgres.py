@@ -1,11 +1,15 @@
+import csv
+import time
 from typing import ClassVar, Dict, Optional, Sequence, List, Any
 
+from dlt.common import logger
 from dlt.common.wei import EVM_DECIMAL_PRECISION
-from dlt.common.destination.reference import NewLoadJob
+from dlt.common.destination.reference import LoadJob, FollowupJob, NewLoadJob, TLoadJobState
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.data_types import TDataType
 from dlt.common.schema import TColumnSchema, TColumnHint, Schema
 from dlt.common.schema.typing import TTableSchema, TColumnType
+from dlt.common.storages import FileStorage
 
 from dlt.destinations.sql_jobs import SqlStagingCopyJob
 
@@ -94,6 +98,34 @@ class PostgresStagingCopyJob(SqlStagingCopyJob):
         return sql
 
 
+class PostgresCsvCopyJob(LoadJob, FollowupJob):
+    """Streams csv job file into the table with COPY ... FROM STDIN. Columns are taken from the file header"""
+
+    def __init__(self, table_name: str, file_path: str, sql_client: Psycopg2SqlClient) -> None:
+        super().__init__(FileStorage.get_file_name_from_file_path(file_path))
+        self._sql_client = sql_client
+        started_at = time.monotonic()
+        with FileStorage.open_zipsafe_ro(file_path, "r", encoding="utf-8") as f:
+            # read just the header line, the rest of the file is sent as is
+            headers = next(csv.reader([f.readline()]))
+            columns = ",".join(map(sql_client.capabilities.escape_identifier, headers))
+            qualified_table_name = sql_client.make_qualified_table_name(table_name)
+            # unquoted empty field is NULL in csv format
+            copy_sql = f"COPY {qualified_table_name} ({columns}) FROM STDIN WITH (FORMAT csv)"
+            with sql_client.begin_transaction():
+                rows_count = sql_client.copy_from_file(copy_sql, f)
+        elapsed = max(time.monotonic() - started_at, 0.001)
+        logger.info(f"Copied {rows_count} rows into {table_name} from {self._file_name} in {elapsed:.3f}s: {rows_count / elapsed:.0f} rows/s")
+
+    def state(self) -> TLoadJobState:
+        # this job is always done
+        return "completed"
+
+    def exception(self) -> str:
+        # this part of code should be never reached
+        raise NotImplementedError()
+
+
 class PostgresClient(InsertValuesJobClient):
 
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
@@ -109,6 +141,12 @@ class PostgresClient(InsertValuesJobClient):
         self.active_hints = HINT_TO_POSTGRES_ATTR if self.config.create_indexes else {}
         self.type_mapper = PostgresTypeMapper(self.capabilities)
 
+    def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
+        job = super().start_file_load(table, file_path, load_id)
+        if not job and file_path.endswith("csv"):
+            job = PostgresCsvCopyJob(table["name"], file_path, self.sql_client)
+        return job
+
     def _get_column_def_sql(self, c: TColumnSchema) -> str:
         hints_str = " ".join(self.active_hints.get(h, "") for h in self.active_hints.keys() if c.get(h, False) is True)
         column_name = self.capabilities.escape_identifier(c["name"])
@@ -10,7 +10,7 @@ else:
     from psycopg2.sql import SQL, Composed, Composable
 
 from contextlib import contextmanager
-from typing import Any, AnyStr, ClassVar, Iterator, Optional, Sequence
+from typing import IO, Any, AnyStr, ClassVar, Iterator, Optional, Sequence
 
 from dlt.destinations.exceptions import DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
 from dlt.destinations.typing import DBApi, DBApiCursor, DBTransaction
@@ -31,20 +31,31 @@ class Psycopg2SqlClient(SqlClientBase["psycopg2.connection"], DBTransaction):
         self.credentials = credentials
 
     def open_connection(self) -> "psycopg2.connection":
-        self._conn = psycopg2.connect(
-                             dsn=self.credentials.to_native_representation(),
-                             options=f"-c search_path={self.fully_qualified_dataset_name()},public"
-                             )
-        # we'll provide explicit transactions see _reset
-        self._reset_connection()
+        self._conn = self._borrow_connection(self._connect)
         return self._conn
 
     @raise_open_connection_error
     def close_connection(self) -> None:
         if self._conn:
-            self._conn.close()
+            self._return_connection(self._conn)
             self._conn = None
 
+    def _connect(self) -> "psycopg2.connection":
+        conn = psycopg2.connect(
+                             dsn=self.credentials.to_native_representation(),
+                             options=f"-c search_path={self.fully_qualified_dataset_name()},public"
+                             )
+        # we'll provide explicit transactions see _reset
+        self._reset_native_connection(conn)
+        return conn
+
+    def _is_connection_reusable(self, conn: "psycopg2.connection") -> bool:
+        if conn.closed:
+            return False
+        # rolls back pending transaction and resets the session, raises on broken connection
+        self._reset_native_connection(conn)
+        return True
+
     @contextmanager
     def begin_transaction(self) -> Iterator[DBTransaction]:
         try:
@@ -95,6 +106,21 @@ class Psycopg2SqlClient(SqlClientBase["psycopg2.connection"], DBTransaction):
                     self.open_connection()
                 raise outer
 
+    @raise_database_error
+    def copy_from_file(self, copy_sql: str, f: IO[Any]) -> int:
+        """Executes `copy_sql` COPY ... FROM STDIN statement streaming the content of `f`. Returns number of copied rows"""
+        with self._conn.cursor() as curr:
+            try:
+                curr.copy_expert(copy_sql, f)
+                return int(curr.rowcount)
+            except psycopg2.Error as outer:
+                try:
+                    self._reset_connection()
+                except psycopg2.Error:
+                    self.close_connection()
+                    self.open_connection()
+                raise outer
+
     def execute_fragments(self, fragments: Sequence[AnyStr], *args: Any, **kwargs: Any) -> Optional[Sequence[Sequence[Any]]]:
         # compose the statements using psycopg2 library
         composed =  Composed(sql if isinstance(sql, Composable) else SQL(sql) for sql in fragments)
@@ -104,9 +130,13 @@ class Psycopg2SqlClient(SqlClientBase["psycopg2.connection"], DBTransaction):
         return self.capabilities.escape_identifier(self.dataset_name) if escape else self.dataset_name
 
     def _reset_connection(self) -> None:
-        # self._conn.autocommit = True
-        self._conn.reset()
-        self._conn.autocommit = True
+        self._reset_native_connection(self._conn)
+
+    @staticmethod
+    def _reset_native_connection(conn: "psycopg2.connection") -> None:
+        # conn.autocommit = True
+        conn.reset()
+        conn.autocommit = True
 
     @classmethod
     def _make_database_exception(cls, ex: Exception) -> Exception:
@@ -1,5 +1,6 @@
 import platform
 import os
+import posixpath
 
 from dlt.destinations.postgres.sql_client import Psycopg2SqlClient
 
@@ -11,14 +12,17 @@ else:
     import psycopg2
     # from psycopg2.sql import SQL, Composed
 
-from typing import ClassVar, Dict, List, Optional, Sequence, Any
+from typing import ClassVar, Dict, List, Optional, Sequence, Any, cast
 
+from dlt.common import json, logger
 from dlt.common.destination import DestinationCapabilitiesContext
-from dlt.common.destination.reference import NewLoadJob, CredentialsConfiguration
+from dlt.common.destination.reference import NewLoadJob, CredentialsConfiguration, WithReferenceJobsBatch
 from dlt.common.data_types import TDataType
 from dlt.common.schema import TColumnSchema, TColumnHint, Schema
 from dlt.common.schema.typing import TTableSchema, TColumnType
 from dlt.common.configuration.specs import AwsCredentialsWithoutDefaults
+from dlt.common.storages import FileStorage, FilesystemConfiguration, filesystem_from_config
+from dlt.common.utils import uniq_id
 
 from dlt.destinations.insert_job_client import InsertValuesJobClient
 from dlt.destinations.sql_jobs import SqlMergeJob
@@ -27,7 +31,7 @@ from dlt.destinations.job_client_impl import CopyRemoteFileLoadJob, LoadJob
 
 from dlt.destinations.redshift import capabilities
 from dlt.destinations.redshift.configuration import RedshiftClientConfiguration
-from dlt.destinations.job_impl import NewReferenceJob
+from dlt.destinations.job_impl import EmptyLoadJob, NewReferenceJob
 from dlt.destinations.sql_client import SqlClientBase
 from dlt.destinations.type_mapping import TypeMapper
 
@@ -118,37 +122,54 @@ class RedshiftCopyFileLoadJob(CopyRemoteFileLoadJob):
         super().__init__(table, file_path, sql_client, staging_credentials)
 
     def execute(self, table: TTableSchema, bucket_path: str) -> None:
+        ext = os.path.splitext(bucket_path)[1][1:]
+        copy_sql = RedshiftCopyFileLoadJob.make_copy_sql(
+            table, self._sql_client, self.file_name(), bucket_path, ext, self._staging_credentials, self._staging_iam_role
+        )
+        with self._sql_client.begin_transaction():
+            self._sql_client.execute_sql(copy_sql)
 
+    @staticmethod
+    def make_copy_sql(
+        table: TTableSchema,
+        sql_client: SqlClientBase[Any],
+        file_name: str,
+        bucket_path: str,
+        ext: str,
+        staging_credentials: Optional[CredentialsConfiguration] = None,
+        staging_iam_role: str = None,
+        is_manifest: bool = False
+    ) -> str:
+        """Generates COPY statement loading `ext` file(s) from `bucket_path`, which is a manifest listing the files if `is_manifest` is set"""
         # we assume s3 credentials where provided for the staging
         credentials = ""
-        if self._staging_iam_role:
-            credentials = f"IAM_ROLE '{self._staging_iam_role}'"
-        elif self._staging_credentials and isinstance(self._staging_credentials, AwsCredentialsWithoutDefaults):
-            aws_access_key = self._staging_credentials.aws_access_key_id
-            aws_secret_key = self._staging_credentials.aws_secret_access_key
+        if staging_iam_role:
+            credentials = f"IAM_ROLE '{staging_iam_role}'"
+        elif staging_credentials and isinstance(staging_credentials, AwsCredentialsWithoutDefaults):
+            aws_access_key = staging_credentials.aws_access_key_id
+            aws_secret_key = staging_credentials.aws_secret_access_key
             credentials = f"CREDENTIALS 'aws_access_key_id={aws_access_key};aws_secret_access_key={aws_secret_key}'"
         table_name = table["name"]
 
         # get format
-        ext = os.path.splitext(bucket_path)[1][1:]
         file_type = ""
         dateformat = ""
         compression = ""
         if table_schema_has_type(table, "time"):
             raise LoadJobTerminalException(
-                self.file_name(),
+                file_name,
                 f"Redshift cannot load TIME columns from {ext} files. Switch to direct INSERT file format or convert `datetime.time` objects in your data to `str` or `datetime.datetime`"
             )
         if ext == "jsonl":
             if table_schema_has_type(table, "binary"):
-                raise LoadJobTerminalException(self.file_name(), "Redshift cannot load VARBYTE columns from json files. Switch to parquet to load binaries.")
+                raise LoadJobTerminalException(file_name, "Redshift cannot load VARBYTE columns from json files. Switch to parquet to load binaries.")
             file_type = "FORMAT AS JSON 'auto'"
             dateformat = "dateformat 'auto' timeformat 'auto'"
             compression = "GZIP"
         elif ext == "parquet":
             if table_schema_has_type_with_precision(table, "binary"):
                 raise LoadJobTerminalException(
-                    self.file_name(),
+                    file_name,
                     f"Redshift cannot load fixed width VARBYTE columns from {ext} files. Switch to direct INSERT file format or use binary columns without precision."
                 )
             file_type = "PARQUET"
@@ -159,16 +180,17 @@ class RedshiftCopyFileLoadJob(CopyRemoteFileLoadJob):
         else:
             raise ValueError(f"Unsupported file type {ext} for Redshift.")
 
-        with self._sql_client.begin_transaction():
-            dataset_name = self._sql_client.dataset_name
-            # TODO: if we ever support csv here remember to add column names to COPY
-            self._sql_client.execute_sql(f"""
-                COPY {dataset_name}.{table_name}
-                FROM '{bucket_path}'
-                {file_type}
-                {dateformat}
-                {compression}
-                {credentials} MAXERROR 0;""")
+        dataset_name = sql_client.dataset_name
+        manifest = "MANIFEST" if is_manifest else ""
+        # TODO: if we ever support csv here remember to add column names to COPY
+        return f"""
+            COPY {dataset_name}.{table_name}
+            FROM '{bucket_path}'
+            {manifest}
+            {file_type}
+            {dateformat}
+            {compression}
+            {credentials} MAXERROR 0;"""
 
     def exception(self) -> str:
         # this part of code should be never reached
@@ -187,7 +209,7 @@ class RedshiftMergeJob(SqlMergeJob):
         return SqlMergeJob.gen_key_table_clauses(root_table_name, staging_root_table_name, key_clauses, for_delete)
 
 
-class RedshiftClient(InsertValuesJobClient):
+class RedshiftClient(InsertValuesJobClient, WithReferenceJobsBatch):
 
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
 
@@ -217,5 +239,47 @@ class RedshiftClient(InsertValuesJobClient):
             job = RedshiftCopyFileLoadJob(table, file_path, self.sql_client, staging_credentials=self.config.staging_config.credentials, staging_iam_role=self.config.staging_iam_role)
         return job
 
+    def start_reference_jobs_batch(self, table: TTableSchema, file_paths: Sequence[str], load_id: str) -> List[LoadJob]:
+        """Loads all files of the same format with a single COPY from a manifest uploaded to the staging bucket"""
+        staging_config = cast(FilesystemConfiguration, self.config.staging_config)
+        fs_client, _ = filesystem_from_config(staging_config)
+        copy_sql: List[str] = []
+        manifest_paths: List[str] = []
+        try:
+            for ext, references in NewReferenceJob.resolve_references_by_format(file_paths).items():
+                bucket_paths = list(references.values())
+                if len(bucket_paths) == 1:
+                    from_path = bucket_paths[0]
+                else:
+                    # content length is required to load parquet files from a manifest
+                    entries = [
+                        {"url": bucket_path, "mandatory": True, "meta": {"content_length": fs_client.size(bucket_path)}}
+                        for bucket_path in bucket_paths
+                    ]
+                    from_path = posixpath.join(posixpath.dirname(bucket_paths[0]), f"{load_id}.{table['name']}.{uniq_id()}.manifest")
+                    fs_client.pipe_file(from_path, json.dumpb({"entries": entries}))
+                    manifest_paths.append(from_path)
+                copy_sql.append(RedshiftCopyFileLoadJob.make_copy_sql(
+                    table,
+                    self.sql_client,
+                    FileStorage.get_file_name_from_file_path(file_paths[0]),
+                    from_path,
+                    ext,
+                    staging_config.credentials,
+                    self.config.staging_iam_role,
+                    is_manifest=len(bucket_paths) > 1
+                ))
+            # all formats in one transaction so the batch is loaded or retried as a whole
+            with self.sql_client.begin_transaction():
+                for sql in copy_sql:
+                    self.sql_client.execute_sql(sql)
+        finally:
+            if manifest_paths:
+                try:
+                    fs_client.rm(manifest_paths)
+                except Exception:
+                    logger.warning(f"Could not delete Redshift manifests {manifest_paths}")
+        return [EmptyLoadJob.from_file_path(file_path, "completed") for file_path in file_paths]
+
     def _from_db_type(self, pq_t: str, precision: Optional[int], scale: Optional[int]) -> TColumnType:
         return self.type_mapper.from_db_type(pq_t, precision, scale)
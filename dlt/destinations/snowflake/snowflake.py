@@ -2,7 +2,7 @@ from typing import ClassVar, Dict, Optional, Sequence, Tuple, List, Any
 from urllib.parse import urlparse, urlunparse
 
 from dlt.common.destination import DestinationCapabilitiesContext
-from dlt.common.destination.reference import FollowupJob, NewLoadJob, TLoadJobState, LoadJob, CredentialsConfiguration
+from dlt.common.destination.reference import FollowupJob, NewLoadJob, TLoadJobState, LoadJob, CredentialsConfiguration, WithReferenceJobsBatch
 from dlt.common.configuration.specs import AwsCredentialsWithoutDefaults, AzureCredentials, AzureCredentialsWithoutDefaults
 from dlt.common.data_types import TDataType
 from dlt.common.storages.file_storage import FileStorage
@@ -77,76 +77,90 @@ class SnowflakeLoadJob(LoadJob, FollowupJob):
 
         qualified_table_name = client.make_qualified_table_name(table_name)
 
-        # extract and prepare some vars
-        bucket_path = NewReferenceJob.resolve_reference(file_path) if NewReferenceJob.is_reference_job(file_path) else ""
-        file_name = FileStorage.get_file_name_from_file_path(bucket_path) if bucket_path else file_name
-        from_clause = ""
+        if NewReferenceJob.is_reference_job(file_path):
+            # copy a single file from the bucket
+            copy_sql = SnowflakeLoadJob.make_bucket_copy_sql(
+                qualified_table_name, file_path, [NewReferenceJob.resolve_reference(file_path)], stage_name, staging_credentials
+            )
+            with client.begin_transaction():
+                client.execute_sql(copy_sql)
+            return
+
+        # this means we have a local file
+        if not stage_name:
+            # Use implicit table stage by default: "SCHEMA_NAME"."%TABLE_NAME"
+            stage_name = client.make_qualified_table_name('%'+table_name)
+        stage_file_path = f'@{stage_name}/"{load_id}"/{file_name}'
+
+        with client.begin_transaction():
+            # PUT and COPY in one tx
+            client.execute_sql(f'PUT file://{file_path} @{stage_name}/"{load_id}" OVERWRITE = TRUE, AUTO_COMPRESS = FALSE')
+            client.execute_sql(SnowflakeLoadJob._make_copy_sql(qualified_table_name, f"FROM {stage_file_path}", "", "", file_name))
+            if not keep_staged_files:
+                client.execute_sql(f'REMOVE {stage_file_path}')
+
+    @staticmethod
+    def make_bucket_copy_sql(
+        qualified_table_name: str,
+        file_path: str,
+        bucket_paths: Sequence[str],
+        stage_name: Optional[str] = None,
+        staging_credentials: Optional[CredentialsConfiguration] = None
+    ) -> str:
+        """Generates COPY INTO statement loading all `bucket_paths` with FILES clause. Files must be in the same bucket and have the same format"""
+        bucket_url = urlparse(bucket_paths[0])
+        bucket_scheme = bucket_url.scheme
         credentials_clause = ""
-        files_clause = ""
-        stage_file_path = ""
-
-        if bucket_path:
-            bucket_url = urlparse(bucket_path)
-            bucket_scheme = bucket_url.scheme
-            # referencing an external s3/azure stage does not require explicit AWS credentials
-            if bucket_scheme in ["s3", "az", "abfs"] and stage_name:
-                from_clause = f"FROM '@{stage_name}'"
-                files_clause = f"FILES = ('{bucket_url.path.lstrip('/')}')"
-            # referencing an staged files via a bucket URL requires explicit AWS credentials
-            elif bucket_scheme == "s3" and staging_credentials and isinstance(staging_credentials, AwsCredentialsWithoutDefaults):
-                credentials_clause = f"""CREDENTIALS=(AWS_KEY_ID='{staging_credentials.aws_access_key_id}' AWS_SECRET_KEY='{staging_credentials.aws_secret_access_key}')"""
-                from_clause = f"FROM '{bucket_path}'"
-            elif bucket_scheme in ["az", "abfs"] and staging_credentials and isinstance(staging_credentials, AzureCredentialsWithoutDefaults):
-                # Explicit azure credentials are needed to load from bucket without a named stage
-                credentials_clause = f"CREDENTIALS=(AZURE_SAS_TOKEN='?{staging_credentials.azure_storage_sas_token}')"
-                # Converts an az://<container_name>/<path> to azure://<storage_account_name>.blob.core.windows.net/<container_name>/<path>
-                # as required by snowflake
-                _path = "/" + bucket_url.netloc + bucket_url.path
-                bucket_path = urlunparse(
-                    bucket_url._replace(
-                        scheme="azure",
-                        netloc=f"{staging_credentials.azure_storage_account_name}.blob.core.windows.net",
-                        path=_path
-                    )
+        # files are listed relative to the bucket (or container) root
+        files = [urlparse(bucket_path).path.lstrip('/') for bucket_path in bucket_paths]
+
+        # referencing an external s3/azure stage does not require explicit AWS credentials
+        if bucket_scheme in ["s3", "az", "abfs"] and stage_name:
+            from_clause = f"FROM '@{stage_name}'"
+        # referencing an staged files via a bucket URL requires explicit AWS credentials
+        elif bucket_scheme == "s3" and staging_credentials and isinstance(staging_credentials, AwsCredentialsWithoutDefaults):
+            credentials_clause = f"""CREDENTIALS=(AWS_KEY_ID='{staging_credentials.aws_access_key_id}' AWS_SECRET_KEY='{staging_credentials.aws_secret_access_key}')"""
+            from_clause = f"FROM '{bucket_scheme}://{bucket_url.netloc}/'"
+        elif bucket_scheme in ["az", "abfs"] and staging_credentials and isinstance(staging_credentials, AzureCredentialsWithoutDefaults):
+            # Explicit azure credentials are needed to load from bucket without a named stage
+            credentials_clause = f"CREDENTIALS=(AZURE_SAS_TOKEN='?{staging_credentials.azure_storage_sas_token}')"
+            # Converts an az://<container_name>/<path> to azure://<storage_account_name>.blob.core.windows.net/<container_name>/<path>
+            # as required by snowflake
+            container_url = urlunparse(
+                bucket_url._replace(
+                    scheme="azure",
+                    netloc=f"{staging_credentials.azure_storage_account_name}.blob.core.windows.net",
+                    path="/" + bucket_url.netloc + "/"
                 )
-                from_clause = f"FROM '{bucket_path}'"
-            else:
-                # ensure that gcs bucket path starts with gcs://, this is a requirement of snowflake
-                bucket_path = bucket_path.replace("gs://", "gcs://")
-                if not stage_name:
-                    # when loading from bucket stage must be given
-                    raise LoadJobTerminalException(file_path, f"Cannot load from bucket path {bucket_path} without a stage name. See https://dlthub.com/docs/dlt-ecosystem/destinations/snowflake for instructions on setting up the `stage_name`")
-                from_clause = f"FROM @{stage_name}/"
-                files_clause = f"FILES = ('{urlparse(bucket_path).path.lstrip('/')}')"
+            )
+            from_clause = f"FROM '{container_url}'"
         else:
-            # this means we have a local file
             if not stage_name:
-                # Use implicit table stage by default: "SCHEMA_NAME"."%TABLE_NAME"
-                stage_name = client.make_qualified_table_name('%'+table_name)
-            stage_file_path = f'@{stage_name}/"{load_id}"/{file_name}'
-            from_clause = f"FROM {stage_file_path}"
+                # when loading from bucket stage must be given
+                # ensure that gcs bucket path starts with gcs://, this is a requirement of snowflake
+                bucket_path = bucket_paths[0].replace("gs://", "gcs://")
+                raise LoadJobTerminalException(file_path, f"Cannot load from bucket path {bucket_path} without a stage name. See https://dlthub.com/docs/dlt-ecosystem/destinations/snowflake for instructions on setting up the `stage_name`")
+            from_clause = f"FROM @{stage_name}/"
+
+        files_clause = "FILES = (" + ", ".join(f"'{file}'" for file in files) + ")"
+        return SnowflakeLoadJob._make_copy_sql(
+            qualified_table_name, from_clause, files_clause, credentials_clause, FileStorage.get_file_name_from_file_path(bucket_paths[0])
+        )
 
-        # decide on source format, stage_file_path will either be a local file or a bucket path
+    @staticmethod
+    def _make_copy_sql(qualified_table_name: str, from_clause: str, files_clause: str, credentials_clause: str, file_name: str) -> str:
+        # decide on source format, file_name will either be a local file or a bucket path
         source_format = "( TYPE = 'JSON', BINARY_FORMAT = 'BASE64' )"
         if file_name.endswith("parquet"):
             source_format = "(TYPE = 'PARQUET', BINARY_AS_TEXT = FALSE)"
 
-        with client.begin_transaction():
-            # PUT and COPY in one tx if local file, otherwise only copy
-            if not bucket_path:
-                client.execute_sql(f'PUT file://{file_path} @{stage_name}/"{load_id}" OVERWRITE = TRUE, AUTO_COMPRESS = FALSE')
-            client.execute_sql(
-                f"""COPY INTO {qualified_table_name}
+        return f"""COPY INTO {qualified_table_name}
                 {from_clause}
                 {files_clause}
                 {credentials_clause}
                 FILE_FORMAT = {source_format}
                 MATCH_BY_COLUMN_NAME='CASE_INSENSITIVE'
                 """
-            )
-            if stage_file_path and not keep_staged_files:
-                client.execute_sql(f'REMOVE {stage_file_path}')
-
 
     def state(self) -> TLoadJobState:
         return "completed"
@@ -170,7 +184,7 @@ class SnowflakeStagingCopyJob(SqlStagingCopyJob):
         return sql
 
 
-class SnowflakeClient(SqlJobClientWithStaging):
+class SnowflakeClient(SqlJobClientWithStaging, WithReferenceJobsBatch):
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
 
     def __init__(self, schema: Schema, config: SnowflakeClientConfiguration) -> None:
@@ -198,6 +212,19 @@ class SnowflakeClient(SqlJobClientWithStaging):
             )
         return job
 
+    def start_reference_jobs_batch(self, table: TTableSchema, file_paths: Sequence[str], load_id: str) -> List[LoadJob]:
+        qualified_table_name = self.sql_client.make_qualified_table_name(table["name"])
+        staging_credentials = self.config.staging_config.credentials if self.config.staging_config else None
+        # a single COPY INTO for each file format, all in one transaction so the batch is loaded or retried as a whole
+        copy_sql = [
+            SnowflakeLoadJob.make_bucket_copy_sql(qualified_table_name, file_paths[0], list(references.values()), self.config.stage_name, staging_credentials)
+            for references in NewReferenceJob.resolve_references_by_format(file_paths).values()
+        ]
+        with self.sql_client.begin_transaction():
+            for sql in copy_sql:
+                self.sql_client.execute_sql(sql)
+        return [EmptyLoadJob.from_file_path(file_path, "completed") for file_path in file_paths]
+
     def restore_file_load(self, file_path: str) -> LoadJob:
         return EmptyLoadJob.from_file_path(file_path, "completed")
 
@@ -30,22 +30,33 @@ class SnowflakeSqlClient(SqlClientBase[snowflake_lib.SnowflakeConnection], DBTra
         self.credentials = credentials
 
     def open_connection(self) -> snowflake_lib.SnowflakeConnection:
+        self._conn = self._borrow_connection(self._connect)
+        return self._conn
+
+    @raise_open_connection_error
+    def close_connection(self) -> None:
+        if self._conn:
+            self._return_connection(self._conn)
+            self._conn = None
+
+    def _connect(self) -> snowflake_lib.SnowflakeConnection:
         conn_params = self.credentials.to_connector_params()
         # set the timezone to UTC so when loading from file formats that do not have timezones
         # we get dlt expected UTC
         if "timezone" not in conn_params:
             conn_params["timezone"] = "UTC"
-        self._conn = snowflake_lib.connect(
+        return snowflake_lib.connect(
             schema=self.fully_qualified_dataset_name(),
             **conn_params
         )
-        return self._conn
 
-    @raise_open_connection_error
-    def close_connection(self) -> None:
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+    def _is_connection_reusable(self, conn: snowflake_lib.SnowflakeConnection) -> bool:
+        if conn.is_closed():
+            return False
+        # make sure that pooled connection does not continue any transaction
+        conn.rollback()
+        conn.autocommit(True)
+        return True
 
     @contextmanager
     def begin_transaction(self) -> Iterator[DBTransaction]:
@@ -3,13 +3,14 @@ from contextlib import contextmanager
 from functools import wraps
 import inspect
 from types import TracebackType
-from typing import Any, ClassVar, ContextManager, Generic, Iterator, Optional, Sequence, Tuple, Type, AnyStr, List
+from typing import Any, Callable, ClassVar, ContextManager, Generic, Hashable, Iterator, Optional, Sequence, Tuple, Type, AnyStr, List
 
 from dlt.common.typing import TFun
 from dlt.common.destination import DestinationCapabilitiesContext
 
 from dlt.destinations.exceptions import DestinationConnectionError, LoadClientNotConnected
 from dlt.destinations.typing import DBApi, TNativeConn, DBApiCursor, DataFrame, DBTransaction
+from dlt.destinations.connection_pool import ConnectionPool, credentials_pool_key, get_active_pools
 
 
 class SqlClientBase(ABC, Generic[TNativeConn]):
@@ -22,6 +23,7 @@ class SqlClientBase(ABC, Generic[TNativeConn]):
             raise ValueError(dataset_name)
         self.dataset_name = dataset_name
         self.database_name = database_name
+        self._conn_pool: ConnectionPool[TNativeConn] = None
 
     @abstractmethod
     def open_connection(self) -> TNativeConn:
@@ -125,6 +127,33 @@ SELECT 1
             dataset_name = SqlClientBase.make_staging_dataset_name(dataset_name)
         return self.with_alternative_dataset_name(dataset_name)
 
+    def _borrow_connection(self, open_f: Callable[[], TNativeConn]) -> TNativeConn:
+        """Borrows a connection from a pool if connection pools are active (ie. when running in `Load`), otherwise opens a new one with `open_f`"""
+        pools = get_active_pools()
+        if pools is None:
+            return open_f()
+        self._conn_pool = pools.get_pool(self._connection_pool_key(), self._close_native_connection, self._is_connection_reusable)
+        return self._conn_pool.borrow(open_f)
+
+    def _return_connection(self, conn: TNativeConn) -> None:
+        """Returns connection to the pool it was borrowed from or closes it"""
+        if self._conn_pool is None:
+            self._close_native_connection(conn)
+        else:
+            self._conn_pool.return_conn(conn)
+            self._conn_pool = None
+
+    def _connection_pool_key(self) -> Hashable:
+        # connections are opened for a particular destination credentials and dataset
+        return (type(self), credentials_pool_key(self.credentials), self.dataset_name)  # type: ignore[attr-defined]
+
+    def _close_native_connection(self, conn: TNativeConn) -> None:
+        conn.close()  # type: ignore[attr-defined]
+
+    def _is_connection_reusable(self, conn: TNativeConn) -> bool:
+        """Tells if pooled `conn` may be borrowed again. Implementations should also reset the session state"""
+        return True
+
     def _ensure_native_conn(self) -> None:
         if not self.native_connection:
             raise LoadClientNotConnected(type(self).__name__ , self.dataset_name)
@@ -8,6 +8,8 @@ from dlt.common.destination.reference import (
     DestinationClientConfiguration,
 )
 from dlt.common.destination import DestinationCapabilitiesContext
+from dlt.common.arithmetics import DEFAULT_NUMERIC_PRECISION, DEFAULT_NUMERIC_SCALE
+from dlt.common.wei import EVM_DECIMAL_PRECISION
 
 from dlt.destinations.weaviate.weaviate_adapter import weaviate_adapter
 from dlt.destinations.weaviate.configuration import WeaviateClientConfiguration
@@ -29,7 +31,10 @@ def _configure(
 def capabilities() -> DestinationCapabilitiesContext:
     caps = DestinationCapabilitiesContext()
     caps.preferred_loader_file_format = "jsonl"
-    caps.supported_loader_file_formats = ["jsonl"]
+    caps.supported_loader_file_formats = ["jsonl", "parquet"]
+    # used when writing parquet files, decimals are sent as text
+    caps.decimal_precision = (DEFAULT_NUMERIC_PRECISION, DEFAULT_NUMERIC_SCALE)
+    caps.wei_precision = (EVM_DECIMAL_PRECISION, 0)
 
     caps.max_identifier_length = 200
     caps.max_column_identifier_length = 1024
@@ -32,6 +32,8 @@ class WeaviateClientConfiguration(DestinationClientDwhConfiguration):
     batch_workers: int = 1
     batch_consistency: TWeaviateBatchConsistency = "ONE"
     batch_retries: int = 5
+    conversion_workers: int = 0
+    """Number of threads converting rows ahead of the batch, rows are converted in the loading thread if 0"""
 
     conn_timeout: float = 10.0
     read_timeout: float = 3*60.0
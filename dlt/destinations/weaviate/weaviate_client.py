@@ -1,7 +1,13 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import wraps
+from itertools import islice
 from types import TracebackType
 from typing import (
+    Callable,
     ClassVar,
+    Deque,
+    Iterator,
     Optional,
     Sequence,
     List,
@@ -25,12 +31,13 @@ from weaviate.gql.get import GetBuilder
 from weaviate.util import generate_uuid5
 
 from dlt.common import json, pendulum, logger
-from dlt.common.typing import StrAny, TFun
+from dlt.common.json import custom_encode
+from dlt.common.typing import DictStrAny, StrAny, TFun
 from dlt.common.time import ensure_pendulum_datetime
 from dlt.common.schema import Schema, TTableSchema, TSchemaTables, TTableSchemaColumns
 from dlt.common.schema.typing import TColumnSchema, TColumnType
 from dlt.common.schema.utils import get_columns_names_with_prop
-from dlt.common.destination import DestinationCapabilitiesContext
+from dlt.common.destination import DestinationCapabilitiesContext, TLoaderFileFormat
 from dlt.common.destination.reference import (
     TLoadJobState,
     LoadJob,
@@ -39,7 +46,7 @@ from dlt.common.destination.reference import (
 
 )
 from dlt.common.data_types import TDataType
-from dlt.common.storages import FileStorage
+from dlt.common.storages import FileStorage, LoadStorage
 
 from dlt.destinations.weaviate.weaviate_adapter import VECTORIZE_HINT, TOKENIZATION_HINT
 
@@ -142,6 +149,19 @@ def wrap_batch_error(f: TFun) -> TFun:
     return _wrap  # type: ignore
 
 
+TConvertedRows = List[Tuple[DictStrAny, Optional[str]]]
+"""Rows ready to be added to Weaviate batch with their uuids"""
+
+
+def _date_to_str(value: Any) -> str:
+    return str(ensure_pendulum_datetime(value))
+
+
+def _arrow_complex_to_str(value: Any) -> str:
+    # complex values in parquet files written from arrow tables are already serialized json strings
+    return value if isinstance(value, str) else json.dumps(value)
+
+
 class LoadWeaviateJob(LoadJob):
     def __init__(
         self,
@@ -159,22 +179,19 @@ class LoadWeaviateJob(LoadJob):
         self.table_name = table_schema["name"]
         self.class_name = class_name
         self.unique_identifiers = self.list_unique_identifiers(table_schema)
-        self.complex_indices = [
-            i
-            for i, field in schema.get_table_columns(self.table_name).items()
-            if field["data_type"] == "complex"
-        ]
-        self.date_indices = [
-            i
-            for i, field in schema.get_table_columns(self.table_name).items()
-            if field["data_type"] == "date"
-        ]
-        with FileStorage.open_zipsafe_ro(local_path) as f:
-            self.load_batch(f)
+        file_format = LoadStorage.parse_job_file_name(file_name).file_format
+        # converters are resolved once per table and not for every row
+        self.value_converters = self.make_value_converters(schema.get_table_columns(self.table_name), file_format)
+        if file_format == "parquet":
+            with FileStorage.open_zipsafe_ro(local_path, "rb") as f:
+                self.load_batch(self.read_parquet_chunks(f), self.convert_arrow_chunk)
+        else:
+            with FileStorage.open_zipsafe_ro(local_path) as f:
+                self.load_batch(self.read_jsonl_chunks(f), self.convert_jsonl_chunk)
 
     @wrap_weaviate_error
-    def load_batch(self, f: IO[str]) -> None:
-        """Load all the lines from stream `f` in automatic Weaviate batches.
+    def load_batch(self, chunks: Iterator[Any], convert_f: Callable[[Any], TConvertedRows]) -> None:
+        """Load all the chunks of lines or rows from `chunks` converted with `convert_f` in automatic Weaviate batches.
         Weaviate batch supports retries so we do not need to do that.
         """
 
@@ -200,23 +217,82 @@ class LoadWeaviateJob(LoadJob):
             num_workers=self.client_config.batch_workers,
             callback=check_batch_result,
         ) as batch:
-            for line in f:
-                data = json.loads(line)
-                # make complex to strings
-                for key in self.complex_indices:
-                    if key in data:
-                        data[key] = json.dumps(data[key])
-                for key in self.date_indices:
-                    if key in data:
-                        data[key] = str(ensure_pendulum_datetime(data[key]))
-                if self.unique_identifiers:
-                    uuid = self.generate_uuid(
-                        data, self.unique_identifiers, self.class_name
-                    )
-                else:
-                    uuid = None
+            for rows in self.convert_chunks(chunks, convert_f):
+                for data, uuid in rows:
+                    batch.add_data_object(data, self.class_name, uuid=uuid)
 
-                batch.add_data_object(data, self.class_name, uuid=uuid)
+    def convert_chunks(self, chunks: Iterator[Any], convert_f: Callable[[Any], TConvertedRows]) -> Iterator[TConvertedRows]:
+        """Converts `chunks` in order. If `conversion_workers` are set, chunks are converted in a thread pool
+        ahead of the Weaviate batch so conversion overlaps with sending the data.
+        """
+        workers = self.client_config.conversion_workers
+        if workers <= 0:
+            yield from map(convert_f, chunks)
+            return
+        with ThreadPoolExecutor(workers, thread_name_prefix="weaviate_convert") as pool:
+            pending: Deque["Future[TConvertedRows]"] = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(convert_f, chunk))
+                # limit number of converted chunks kept in memory
+                if len(pending) > 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def read_jsonl_chunks(self, f: IO[str]) -> Iterator[List[str]]:
+        chunk_size = self.client_config.batch_size
+        while chunk := list(islice(f, chunk_size)):
+            yield chunk
+
+    def read_parquet_chunks(self, f: IO[bytes]) -> Iterator[Any]:
+        from dlt.common.libs.pyarrow import pyarrow
+
+        yield from pyarrow.parquet.ParquetFile(f).iter_batches(batch_size=self.client_config.batch_size)
+
+    def convert_jsonl_chunk(self, lines: List[str]) -> TConvertedRows:
+        rows: List[DictStrAny] = [json.loads(line) for line in lines]
+        for key, convert_f in self.value_converters.items():
+            for data in rows:
+                if key in data:
+                    data[key] = convert_f(data[key])
+        return self.add_uuids(rows)
+
+    def convert_arrow_chunk(self, record_batch: Any) -> TConvertedRows:
+        # convert values column by column and skip nulls like in the jsonl files
+        columns: Dict[str, List[Any]] = record_batch.to_pydict()
+        for key, convert_f in self.value_converters.items():
+            if key in columns:
+                columns[key] = [None if value is None else convert_f(value) for value in columns[key]]
+        names = list(columns.keys())
+        rows = [
+            {name: value for name, value in zip(names, values) if value is not None}
+            for values in zip(*columns.values())
+        ]
+        return self.add_uuids(rows)
+
+    def add_uuids(self, rows: List[DictStrAny]) -> TConvertedRows:
+        if not self.unique_identifiers:
+            return [(data, None) for data in rows]
+        return [(data, self.generate_uuid(data, self.unique_identifiers, self.class_name)) for data in rows]
+
+    @staticmethod
+    def make_value_converters(columns: TTableSchemaColumns, file_format: TLoaderFileFormat) -> Dict[str, Callable[[Any], Any]]:
+        """Returns converters for the values of columns that cannot be sent to Weaviate as they are stored in a `file_format` file"""
+        converters: Dict[str, Callable[[Any], Any]] = {}
+        for name, column in columns.items():
+            data_type = column["data_type"]
+            if data_type == "complex":
+                # in jsonl files strings are valid complex values and are serialized like any other value
+                converters[name] = _arrow_complex_to_str if file_format == "parquet" else json.dumps
+            elif data_type == "date":
+                converters[name] = _date_to_str
+            elif file_format == "parquet":
+                # parquet values are native python types, encode them like in jsonl files
+                if data_type == "timestamp":
+                    converters[name] = _date_to_str
+                elif data_type in ("time", "decimal", "wei", "binary"):
+                    converters[name] = custom_encode
+        return converters
 
     def list_unique_identifiers(self, table_schema: TTableSchema) -> Sequence[str]:
         if table_schema.get("write_disposition") == "merge":
@@ -52,7 +52,8 @@ def source(
     max_table_nesting: int = None,
     root_key: bool = False,
     schema: Schema = None,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    parallelized: bool = False
 ) -> Callable[TSourceFunParams, DltSource]:
     ...
 
@@ -65,7 +66,8 @@ def source(
     max_table_nesting: int = None,
     root_key: bool = False,
     schema: Schema = None,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    parallelized: bool = False
 ) -> Callable[[Callable[TSourceFunParams, Any]], Callable[TSourceFunParams, DltSource]]:
     ...
 
@@ -77,7 +79,8 @@ def source(
     max_table_nesting: int = None,
     root_key: bool = False,
     schema: Schema = None,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    parallelized: bool = False
 ) -> Any:
     """A decorator that transforms a function returning one or more `dlt resources` into a `dlt source` in order to load it with `dlt`.
 
@@ -113,6 +116,8 @@ def source(
 
         spec (Type[BaseConfiguration], optional): A specification of configuration and secret values required by the source.
 
+        parallelized (bool, optional): If `True`, the generators of all resources in the source are evaluated in the extract thread pool. See `parallelized` in `dlt.resource`. Defaults to False.
+
     Returns:
         `DltSource` instance
     """
@@ -171,6 +176,8 @@ def source(
                 s.max_table_nesting = max_table_nesting
             # enable root propagation
             s.root_key = root_key
+            if parallelized:
+                s.parallelize()
             return s
 
 
@@ -201,7 +208,8 @@ def resource(
     primary_key: TTableHintTemplate[TColumnNames] = None,
     merge_key: TTableHintTemplate[TColumnNames] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    parallelized: bool = False
 ) -> DltResource:
     ...
 
@@ -216,7 +224,8 @@ def resource(
     primary_key: TTableHintTemplate[TColumnNames] = None,
     merge_key: TTableHintTemplate[TColumnNames] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    parallelized: bool = False
 ) -> Callable[[Callable[TResourceFunParams, Any]], DltResource]:
     ...
 
@@ -231,7 +240,8 @@ def resource(
     primary_key: TTableHintTemplate[TColumnNames] = None,
     merge_key: TTableHintTemplate[TColumnNames] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    parallelized: bool = False
 ) -> DltResource:
     ...
 
@@ -248,6 +258,7 @@ def resource(
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
     data_from: TUnboundDltResource = None,
+    parallelized: bool = False
 ) -> Any:
     """When used as a decorator, transforms any generator (yielding) function into a `dlt resource`. When used as a function, it transforms data in `data` argument into a `dlt resource`.
 
@@ -299,6 +310,9 @@ def resource(
 
         data_from (TUnboundDltResource, optional): Allows to pipe data from one resource to another to build multi-step pipelines.
 
+        parallelized (bool, optional): If `True`, the resource generator is evaluated in the extract thread pool so many blocking resources (ie. database cursors or paginated
+        REST APIs) can be extracted in parallel. The items are prefetched into a bounded buffer and yielded in order. Has no effect on transformers. Defaults to False.
+
     Raises:
         ResourceNameMissing: indicates that name of the resource cannot be inferred from the `data` being passed.
         InvalidResourceDataType: indicates that the `data` argument cannot be converted into `dlt resource`
@@ -314,7 +328,10 @@ def resource(
             primary_key=primary_key,
             merge_key=merge_key,
         )
-        return DltResource.from_data(_data, _name, _section, table_template, selected, cast(DltResource, data_from), incremental=incremental)
+        resource = DltResource.from_data(_data, _name, _section, table_template, selected, cast(DltResource, data_from), incremental=incremental)
+        if parallelized:
+            resource.parallelize()
+        return resource
 
 
     def decorator(f: Callable[TResourceFunParams, Any]) -> Callable[TResourceFunParams, DltResource]:
@@ -367,9 +384,9 @@ def resource(
     else:
         # take name from the generator
         source_section: str = None
-        if inspect.isgenerator(data):
+        if inspect.isgenerator(data) or inspect.isasyncgen(data):
             name = name or get_callable_name(data)  # type: ignore
-            func_module = inspect.getmodule(data.gi_frame)
+            func_module = inspect.getmodule(data.gi_frame if inspect.isgenerator(data) else data.ag_frame)
             source_section = _get_source_section_name(func_module)
 
         return make_resource(name, source_section, data)
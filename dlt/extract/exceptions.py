@@ -101,11 +101,6 @@ class InvalidResourceDataType(DltResourceException):
         super().__init__(resource_name, f"Cannot create resource {resource_name} from specified data. " + msg)
 
 
-class InvalidResourceDataTypeAsync(InvalidResourceDataType):
-    def __init__(self, resource_name: str, item: Any,_typ: Type[Any]) -> None:
-        super().__init__(resource_name, item, _typ, "Async iterators and generators are not valid resources. Please use standard iterators and generators that yield Awaitables instead (for example by yielding from async function without await")
-
-
 class InvalidResourceDataTypeBasic(InvalidResourceDataType):
     def __init__(self, resource_name: str, item: Any,_typ: Type[Any]) -> None:
         super().__init__(resource_name, item, _typ, f"Resources cannot be strings or dictionaries but {_typ.__name__} was provided. Please pass your data in a list or as a function yielding items. If you want to process just one data item, enclose it in a list.")
@@ -1,7 +1,11 @@
 import contextlib
 import os
-from typing import ClassVar, List, Set
+from queue import Queue
+from threading import Thread
+from typing import Any, Callable, ClassVar, List, Optional, Set, Tuple, Type
 
+from dlt.common import logger
+from dlt.common.configuration import configspec, with_config
 from dlt.common.configuration.container import Container
 from dlt.common.configuration.resolve import inject_section
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
@@ -11,15 +15,31 @@ from dlt.common.runtime import signals
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
 from dlt.common.utils import uniq_id
 from dlt.common.typing import TDataItems, TDataItem
-from dlt.common.schema import Schema, utils, TSchemaUpdate
+from dlt.common.schema import Schema, utils, TSchemaUpdate, TTableSchemaColumns
 from dlt.common.storages import NormalizeStorageConfiguration, NormalizeStorage, DataItemStorage
-from dlt.common.configuration.specs import known_sections
+from dlt.common.configuration.specs import BaseConfiguration, known_sections
 
 from dlt.extract.decorators import SourceSchemaInjectableContext
 from dlt.extract.exceptions import DataItemRequiredForDynamicTableHints
 from dlt.extract.pipe import PipeIterator
 from dlt.extract.source import DltResource, DltSource
 from dlt.extract.typing import TableNameMeta
+from dlt.extract.utils import is_arrow_item, pa, pd
+
+
+class ArrowExtractorStorage(DataItemStorage):
+    """Writes arrow tables and pandas data frames as parquet files into the extract folder of `extractor_storage`"""
+    def __init__(self, extractor_storage: "ExtractorStorage") -> None:
+        super().__init__("arrow")
+        self.extractor_storage = extractor_storage
+
+    def write_data_item(self, load_id: str, schema_name: str, table_name: str, item: TDataItems, columns: TTableSchemaColumns) -> None:
+        if pd is not None and isinstance(item, pd.DataFrame):
+            item = pa.Table.from_pandas(item, preserve_index=False)
+        super().write_data_item(load_id, schema_name, table_name, item, columns)
+
+    def _get_data_item_path_template(self, load_id: str, schema_name: str, table_name: str) -> str:
+        return self.extractor_storage._get_data_item_path_template(load_id, schema_name, table_name)
 
 
 class ExtractorStorage(DataItemStorage, NormalizeStorage):
@@ -29,13 +49,27 @@ class ExtractorStorage(DataItemStorage, NormalizeStorage):
         # data item storage with jsonl with pua encoding
         super().__init__("puae-jsonl", True, C)
         self.storage.create_folder(ExtractorStorage.EXTRACT_FOLDER, exists_ok=True)
+        self.arrow_storage = ArrowExtractorStorage(self)
+
+    def write_data_item(self, load_id: str, schema_name: str, table_name: str, item: TDataItems, columns: TTableSchemaColumns) -> None:
+        # arrow items are not serialized row by row but written into parquet files
+        if is_arrow_item(item):
+            self.arrow_storage.write_data_item(load_id, schema_name, table_name, item, columns)
+        else:
+            super().write_data_item(load_id, schema_name, table_name, item, columns)
+
+    def close_writers(self, extract_id: str) -> None:
+        super().close_writers(extract_id)
+        self.arrow_storage.close_writers(extract_id)
 
     def create_extract_id(self) -> str:
         extract_id = uniq_id()
         self.storage.create_folder(self._get_extract_path(extract_id))
         return extract_id
 
-    def commit_extract_files(self, extract_id: str, with_delete: bool = True) -> None:
+    def commit_extract_files(self, extract_id: str, with_delete: bool = True, keep_extract_folder: bool = False) -> None:
+        """Moves (or links if `with_delete` is False) the closed files of `extract_id` to the normalize storage. Keeps the extract folder
+        if `keep_extract_folder` is set so extraction can continue"""
         extract_path = self._get_extract_path(extract_id)
         for file in self.storage.list_folder_files(extract_path, to_root=False):
             from_file = os.path.join(extract_path, file)
@@ -45,7 +79,7 @@ class ExtractorStorage(DataItemStorage, NormalizeStorage):
             else:
                 # create hardlink which will act as a copy
                 self.storage.link_hard(from_file, to_file)
-        if with_delete:
+        if with_delete and not keep_extract_folder:
             self.storage.delete_folder(extract_path, recursively=True)
 
     def _get_data_item_path_template(self, load_id: str, schema_name: str, table_name: str) -> str:
@@ -56,6 +90,93 @@ class ExtractorStorage(DataItemStorage, NormalizeStorage):
         return os.path.join(ExtractorStorage.EXTRACT_FOLDER, extract_id)
 
 
+class ThreadedItemWriter:
+    """Writes data items to `storage` in background writer threads so serialization and compression overlap with extraction.
+
+    Tables are sharded between the threads: all the items of a given table are written by the same thread, in the order they were submitted.
+    Each thread has a bounded queue so the extraction is paused when the writers cannot keep up. Items are passed to the writer threads
+    without copying so they must not be modified after being yielded.
+    """
+    def __init__(self, storage: DataItemStorage, threads: int, queue_size: int) -> None:
+        self.storage = storage
+        self._exception: BaseException = None
+        self._queues: List["Queue[Optional[Tuple[Any, ...]]]"] = [Queue(maxsize=queue_size) for _ in range(threads)]
+        self._threads = [Thread(target=self._write_loop, args=(q,), daemon=True, name=f"dlt-extract-writer-{i}") for i, q in enumerate(self._queues)]
+        self._closed = False
+        for thread in self._threads:
+            thread.start()
+
+    def write_data_item(self, load_id: str, schema_name: str, table_name: str, item: TDataItems, columns: TTableSchemaColumns) -> None:
+        self._submit(table_name, (self.storage.write_data_item, load_id, schema_name, table_name, item, columns))
+
+    def write_empty_file(self, load_id: str, schema_name: str, table_name: str, columns: TTableSchemaColumns) -> None:
+        self._submit(table_name, (self.storage.write_empty_file, load_id, schema_name, table_name, columns))
+
+    def flush(self) -> None:
+        """Waits until all the submitted items are written. Raises the first exception from the writer threads"""
+        for q in self._queues:
+            q.join()
+        self._raise_on_writer_exception()
+
+    def close(self) -> None:
+        """Waits until all the submitted items are written and stops the writer threads. Raises the first exception from the writer threads"""
+        if self._closed:
+            return
+        self._closed = True
+        for q in self._queues:
+            q.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._raise_on_writer_exception()
+
+    def __enter__(self) -> "ThreadedItemWriter":
+        return self
+
+    def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # do not mask the original exception, just stop the writers
+            with contextlib.suppress(Exception):
+                self.close()
+
+    def _submit(self, table_name: str, write_op: Tuple[Any, ...]) -> None:
+        self._raise_on_writer_exception()
+        # blocks when the queue is full which creates back pressure on the extraction
+        self._queues[hash(table_name) % len(self._queues)].put(write_op)
+
+    def _write_loop(self, q: "Queue[Optional[Tuple[Any, ...]]]") -> None:
+        while True:
+            write_op = q.get()
+            if write_op is None:
+                q.task_done()
+                break
+            # after a failure drain the queue so the extraction is not blocked
+            if self._exception is None:
+                try:
+                    write_op[0](*write_op[1:])
+                except BaseException as ex:
+                    self._exception = ex
+            q.task_done()
+
+    def _raise_on_writer_exception(self) -> None:
+        if self._exception is not None:
+            raise self._exception
+
+
+@configspec
+class ExtractorConfiguration(BaseConfiguration):
+    writer_threads: int = 0
+    """Number of threads that write the extracted items. Items are written on the main thread if 0"""
+    writer_queue_size: int = 64
+    """Max number of items waiting to be written by a single writer thread"""
+    micro_batch_items: int = 0
+    """Number of extracted data items after which `on_micro_batch` is called, 0 disables micro batches"""
+
+    __section__ = known_sections.EXTRACT
+
+
+@with_config(spec=ExtractorConfiguration)
 def extract(
     extract_id: str,
     source: DltSource,
@@ -64,18 +185,29 @@ def extract(
     *,
     max_parallel_items: int = None,
     workers: int = None,
-    futures_poll_interval: float = None
+    futures_poll_interval: float = None,
+    writer_threads: int = 0,
+    writer_queue_size: int = 64,
+    micro_batch_items: int = 0,
+    on_micro_batch: Callable[[str, TSchemaUpdate], bool] = None
 ) -> TSchemaUpdate:
+    """Extracts `source` into `storage` under `extract_id`. If `on_micro_batch` is provided, it is called each time `micro_batch_items`
+    data items got extracted, with all the items written. It receives the extract id and the partial tables so far and returns False
+    to stop the micro batches.
+    """
 
     dynamic_tables: TSchemaUpdate = {}
     schema = source.schema
     resources_with_items: Set[str] = set()
+    micro_batch_count = 0
+    # writes items in the main thread or in a pool of writer threads
+    writer = ThreadedItemWriter(storage, writer_threads, writer_queue_size) if writer_threads > 0 else contextlib.nullcontext(storage)
 
-    with collector(f"Extract {source.name}"):
+    with collector(f"Extract {source.name}"), writer as item_writer:
 
         def _write_empty_file(table_name: str) -> None:
             table_name = schema.naming.normalize_table_identifier(table_name)
-            storage.write_empty_file(extract_id, schema.name, table_name, None)
+            item_writer.write_empty_file(extract_id, schema.name, table_name, None)
 
         def _write_item(table_name: str, resource_name: str, item: TDataItems) -> None:
             # normalize table name before writing so the name match the name in schema
@@ -84,7 +216,7 @@ def extract(
             table_name = schema.naming.normalize_table_identifier(table_name)
             collector.update(table_name)
             resources_with_items.add(resource_name)
-            storage.write_data_item(extract_id, schema.name, table_name, item, None)
+            item_writer.write_data_item(extract_id, schema.name, table_name, item, None)
 
         def _write_dynamic_table(resource: DltResource, item: TDataItem) -> None:
             table_name = resource._table_name_hint_fun(item)
@@ -110,6 +242,12 @@ def extract(
                 static_table["name"] = table_name
                 dynamic_tables[table_name] = [static_table]
 
+        # items of transformers and parallel resources are still in flight when a micro batch is taken, the state modified by their
+        # parents (ie. incremental cursors) would be loaded before the items themselves
+        if on_micro_batch and any(pipe.has_parent or pipe.parallelized for pipe in source.resources.selected_pipes):
+            logger.info(f"Source {source.name} has transformers or parallel resources, micro batches will not be loaded")
+            on_micro_batch = None
+
         # yield from all selected pipes
         with PipeIterator.from_pipes(source.resources.selected_pipes, max_parallel_items=max_parallel_items, workers=workers, futures_poll_interval=futures_poll_interval) as pipes:
             left_gens = total_gens = len(pipes._sources)
@@ -135,7 +273,7 @@ def extract(
                 else:
                     # get partial table from table template
                     if resource._table_name_hint_fun:
-                        if isinstance(pipe_item.item, List):
+                        if isinstance(pipe_item.item, list):
                             for item in pipe_item.item:
                                 _write_dynamic_table(resource, item)
                         else:
@@ -146,6 +284,21 @@ def extract(
                         _write_static_table(resource, table_name)
                         _write_item(table_name, resource.name, pipe_item.item)
 
+                if on_micro_batch and micro_batch_items > 0:
+                    micro_batch_count += len(pipe_item.item) if isinstance(pipe_item.item, list) else getattr(pipe_item.item, "num_rows", 1)
+                    if micro_batch_count >= micro_batch_items:
+                        micro_batch_count = 0
+                        # same for async and deferred items evaluated in the pools
+                        if len(pipes._futures) > 0:
+                            logger.info(f"Source {source.name} yields async or deferred items, micro batches will not be loaded")
+                            on_micro_batch = None
+                        else:
+                            # all the items must be written before the files are committed
+                            if isinstance(item_writer, ThreadedItemWriter):
+                                item_writer.flush()
+                            if on_micro_batch(extract_id, dynamic_tables) is False:
+                                on_micro_batch = None
+
             # find defined resources that did not yield any pipeitems and create empty jobs for them
             data_tables = {t["name"]: t for t in schema.data_tables()}
             tables_by_resources = utils.group_tables_by_resource(data_tables)
@@ -163,6 +316,10 @@ def extract(
                 # go to 100%
                 collector.update("Resources", left_gens)
 
+            # wait for all items to be written
+            if isinstance(item_writer, ThreadedItemWriter):
+                item_writer.close()
+
         # flush all buffered writers
         storage.close_writers(extract_id)
 
@@ -176,7 +333,8 @@ def extract_with_schema(
     schema: Schema,
     collector: Collector,
     max_parallel_items: int,
-    workers: int
+    workers: int,
+    on_micro_batch: Callable[[str, TSchemaUpdate], bool] = None
 ) -> str:
     # generate extract_id to be able to commit all the sources together later
     extract_id = storage.create_extract_id()
@@ -189,7 +347,7 @@ def extract_with_schema(
                     if resource.write_disposition == "replace":
                         _reset_resource_state(resource._name)
 
-            extractor = extract(extract_id, source, storage, collector, max_parallel_items=max_parallel_items, workers=workers)
+            extractor = extract(extract_id, source, storage, collector, max_parallel_items=max_parallel_items, workers=workers, on_micro_batch=on_micro_batch)
             # iterate over all items in the pipeline and update the schema if dynamic table hints were present
             for _, partials in extractor.items():
                 for partial in partials:
@@ -1,5 +1,5 @@
 import os
-from typing import Generic, TypeVar, Any, Optional, Callable, List, TypedDict, get_args, get_origin, Sequence, Type
+from typing import Generic, TypeVar, Any, Optional, Callable, List, Set, TypedDict, get_args, get_origin, Sequence, Type
 import inspect
 from functools import wraps
 from datetime import datetime  # noqa: I251
@@ -7,7 +7,7 @@ from datetime import datetime  # noqa: I251
 import dlt
 from dlt.common import pendulum, logger
 from dlt.common.json import json
-from dlt.common.jsonpath import compile_path, find_values, JSONPath
+from dlt.common.jsonpath import compile_path, extract_simple_field_names, find_values, JSONPath
 from dlt.common.typing import TDataItem, TDataItems, TFun, extract_inner_type, get_generic_type_argument_from_instance, is_optional_type
 from dlt.common.schema.typing import TColumnNames
 from dlt.common.configuration import configspec, ConfigurationValueError
@@ -18,7 +18,7 @@ from dlt.common.data_types.type_helpers import coerce_from_date_types, coerce_va
 
 from dlt.extract.exceptions import IncrementalUnboundError, PipeException
 from dlt.extract.pipe import Pipe
-from dlt.extract.utils import resolve_column_value
+from dlt.extract.utils import resolve_column_value, is_arrow_item, pa, pd
 from dlt.extract.typing import FilterItem, SupportsPipe, TTableHintTemplate
 
 
@@ -85,6 +85,8 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
             specified range of data. Currently Airflow scheduler is detected: "data_interval_start" and "data_interval_end" are taken from the context and passed Incremental class.
             The values passed explicitly to Incremental will be ignored.
             Note that if logical "end date" is present then also "end_value" will be set which means that resource state is not used and exactly this range of date will be loaded
+        unique_hashes_limit: Optional max number of hashes of items with the current `last_value` kept in state to deduplicate items. Items above the limit are not deduplicated
+            in the next run. By default all hashes are kept.
     """
     cursor_path: str = None
     # TODO: Support typevar here
@@ -98,7 +100,8 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
             last_value_func: Optional[LastValueFunc[TCursorValue]]=max,
             primary_key: Optional[TTableHintTemplate[TColumnNames]] = None,
             end_value: Optional[TCursorValue] = None,
-            allow_external_schedulers: bool = False
+            allow_external_schedulers: bool = False,
+            unique_hashes_limit: Optional[int] = None
     ) -> None:
         self.cursor_path = cursor_path
         if self.cursor_path:
@@ -112,9 +115,15 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         self.resource_name: Optional[str] = None
         self.primary_key: Optional[TTableHintTemplate[TColumnNames]] = primary_key
         self.allow_external_schedulers = allow_external_schedulers
+        self.unique_hashes_limit = unique_hashes_limit
 
         self._cached_state: IncrementalColumnState = None
         """State dictionary cached on first access"""
+        self._unique_hashes: Set[str] = set()
+        """Index of `unique_hashes` in cached state"""
+        self._unique_hashes_limit_reached = False
+        self._cursor_keys: Optional[List[str]] = None
+        """Keys to get the cursor value without jsonpath, set when bound"""
         super().__init__(self.transform)
 
         self.end_out_of_range: bool = False
@@ -139,7 +148,8 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
             last_value_func=self.last_value_func,
             primary_key=self.primary_key,
             end_value=self.end_value,
-            allow_external_schedulers=self.allow_external_schedulers
+            allow_external_schedulers=self.allow_external_schedulers,
+            unique_hashes_limit=self.unique_hashes_limit
         )
 
     def merge(self, other: "Incremental[TCursorValue]") -> "Incremental[TCursorValue]":
@@ -152,10 +162,10 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         >>>
         >>> my_resource(updated=incremental(initial_value='2023-01-01', end_value='2023-02-01'))
         """
-        kwargs = dict(self, last_value_func=self.last_value_func, primary_key=self.primary_key)
+        kwargs = dict(self, last_value_func=self.last_value_func, primary_key=self.primary_key, unique_hashes_limit=self.unique_hashes_limit)
         for key, value in dict(
                 other,
-                last_value_func=other.last_value_func, primary_key=other.primary_key).items():
+                last_value_func=other.last_value_func, primary_key=other.primary_key, unique_hashes_limit=other.unique_hashes_limit).items():
             if value is not None:
                 kwargs[key] = value
         # preserve Generic param information
@@ -236,7 +246,12 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
     def unique_value(self, row: TDataItem) -> str:
         try:
             if self.primary_key:
-                return digest128(json.dumps(resolve_column_value(self.primary_key, row), sort_keys=True))
+                key_value = resolve_column_value(self.primary_key, row)
+                # int keys serialize to the same string without json, the hash stays the same
+                if type(key_value) is int:
+                    return digest128(str(key_value))
+                # compound keys may contain dicts at any level so keys are always sorted
+                return digest128(json.dumps(key_value, sort_keys=True))
             elif self.primary_key is None:
                 return digest128(json.dumps(row, sort_keys=True))
             else:
@@ -248,10 +263,7 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         if row is None:
             return True
 
-        row_values = find_values(self.cursor_path_p, row)
-        if not row_values:
-            raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, row)
-        row_value = row_values[0]
+        row_value = self._get_cursor_value(row)
 
         # For datetime cursor, ensure the value is a timezone aware datetime.
         # The object saved in state will always be a tz aware pendulum datetime so this ensures values are comparable
@@ -279,10 +291,10 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
                 unique_value = self.unique_value(row)
                 # if unique value exists then use it to deduplicate
                 if unique_value:
-                    if unique_value in incremental_state['unique_hashes']:
+                    if unique_value in self._unique_hashes:
                         return False
                     # add new hash only if the record row id is same as current last value
-                    incremental_state['unique_hashes'].append(unique_value)
+                    self._add_unique_hash(unique_value)
                 return True
             # skip the record that is not a last_value or new_value: that record was already processed
             check_values = (row_value,) + ((self.start_value,) if self.start_value is not None else ())
@@ -295,12 +307,205 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
                 return True
         else:
             incremental_state["last_value"] = new_value
+            incremental_state["unique_hashes"] = []
+            self._unique_hashes = set()
+            self._unique_hashes_limit_reached = False
             unique_value = self.unique_value(row)
             if unique_value:
-                incremental_state["unique_hashes"] = [unique_value]
+                self._add_unique_hash(unique_value)
 
         return True
 
+    def _transform_list(self, items: List[TDataItem]) -> Optional[List[TDataItem]]:
+        """Filters list of rows in `items` with the same semantics as `transform` applied to each row. `max` and `min` last value
+           functions are evaluated with plain comparisons instead of calling `last_value_func` several times per row
+        """
+        if self.last_value_func not in (max, min):
+            items = [row for row in items if self.transform(row)]
+            return items or None
+
+        is_max = self.last_value_func is max
+        incremental_state = self._cached_state
+        last_value = incremental_state["last_value"]
+        start_value = self.start_value
+        end_value = self.end_value
+        get_cursor_value = self._get_cursor_value
+        kept: List[TDataItem] = []
+        for row in items:
+            if row is None:
+                kept.append(row)
+                continue
+            row_value = get_cursor_value(row)
+            if isinstance(row_value, datetime):
+                row_value = pendulum.instance(row_value)
+
+            # filter end value ranges exclusively
+            if end_value is not None and (row_value >= end_value if is_max else row_value <= end_value):
+                self.end_out_of_range = True
+                continue
+            if last_value is None or (row_value > last_value if is_max else row_value < last_value):
+                # new last value: drop hashes of the previous one
+                last_value = incremental_state["last_value"] = row_value
+                incremental_state["unique_hashes"] = []
+                self._unique_hashes = set()
+                self._unique_hashes_limit_reached = False
+                unique_value = self.unique_value(row)
+                if unique_value:
+                    self._add_unique_hash(unique_value)
+            elif row_value == last_value:
+                # deduplicate rows with the current last value
+                unique_value = self.unique_value(row)
+                if unique_value:
+                    if unique_value in self._unique_hashes:
+                        continue
+                    self._add_unique_hash(unique_value)
+            # include rows == start_value but exclude "lower"
+            elif start_value is not None and (row_value < start_value if is_max else row_value > start_value):
+                self.start_out_of_range = True
+                continue
+            kept.append(row)
+        return kept or None
+
+    def _get_cursor_value(self, row: TDataItem) -> Any:
+        if self._cursor_keys is not None:
+            try:
+                row_value = row
+                for key in self._cursor_keys:
+                    row_value = row_value[key]
+                return row_value
+            except (KeyError, IndexError, TypeError):
+                # let jsonpath find the value or raise
+                pass
+        row_values = find_values(self.cursor_path_p, row)
+        if not row_values:
+            raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, row)
+        return row_values[0]
+
+    def _transform_arrow(self, item: TDataItems) -> Optional[TDataItems]:
+        """Filters arrow table, record batch or pandas data frame in `item` with the same semantics as `transform` applied to each row"""
+        import numpy as np
+
+        is_df = pd is not None and isinstance(item, pd.DataFrame)
+        table = pa.Table.from_pandas(item, preserve_index=False) if is_df else item
+        # cursor must be a column
+        if not self._cursor_keys or len(self._cursor_keys) != 1 or self._cursor_keys[0] not in table.column_names:
+            raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, item)
+        column = table[self._cursor_keys[0]]
+        if column.null_count > 0:
+            raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, item)
+
+        if self.last_value_func in (max, min):
+            keep = self._arrow_filter_mask(table, column)
+        else:
+            # custom last value functions are evaluated row by row
+            keep = np.array([self.transform(row) for row in table.to_pylist()], dtype=bool)
+
+        if keep.all():
+            return item
+        if not keep.any():
+            return None
+        if is_df:
+            return item[keep]
+        return item.filter(pa.array(keep))
+
+    def _arrow_filter_mask(self, table: Any, column: Any) -> Any:
+        """Computes a mask of rows in arrow `table` to keep and updates the state for `max` and `min` last value functions"""
+        import numpy as np
+
+        def _to_np(value: Any) -> Any:
+            return np.asarray(pa.array([value], type=column.type))[0]
+
+        is_max = self.last_value_func is max
+        values = np.asarray(column)
+        keep = np.ones(len(values), dtype=bool)
+        # filter end value ranges exclusively
+        if self.end_value is not None:
+            end_value = _to_np(self.end_value)
+            keep = values < end_value if is_max else values > end_value
+            if not keep.all():
+                self.end_out_of_range = True
+        # rows out of end range do not change last value
+        in_range_idx = np.flatnonzero(keep)
+        values = values[in_range_idx]
+        if len(values) == 0:
+            return keep
+
+        # compute last value before each row
+        incremental_state = self._cached_state
+        last_value = incremental_state["last_value"]
+        accumulate = np.maximum if is_max else np.minimum
+        last_values = accumulate.accumulate(values)
+        prev_last_values = np.empty_like(last_values)
+        prev_last_values[1:] = last_values[:-1]
+        if last_value is not None:
+            prev_last_values[0] = _to_np(last_value)
+            prev_last_values = accumulate(prev_last_values, prev_last_values[0])
+        else:
+            prev_last_values[0] = values[0]
+        is_new = values > prev_last_values if is_max else values < prev_last_values
+        is_tie = values == prev_last_values
+        if last_value is None:
+            is_new[0], is_tie[0] = True, False
+
+        # exclude rows "lower" than start value
+        if self.start_value is not None:
+            start_value = _to_np(self.start_value)
+            is_out = values < start_value if is_max else values > start_value
+            if is_out.any():
+                self.start_out_of_range = True
+                keep[in_range_idx[is_out]] = False
+
+        # rows with the same last value are deduplicated with unique hashes
+        group = np.cumsum(is_new)
+        final_group = group[-1]
+        new_hashes: List[str] = []
+        if self.primary_key is None or self.primary_key:
+            # compute hashes only in groups that have ties or will be stored in the state
+            hash_groups = np.union1d(group[is_tie], [final_group])
+            hashed_idx = np.flatnonzero((is_new | is_tie) & np.isin(group, hash_groups))
+            # convert only primary key columns to python
+            hash_table = table
+            key_columns = [self.primary_key] if isinstance(self.primary_key, str) else self.primary_key
+            if isinstance(key_columns, (list, tuple)) and set(key_columns).issubset(table.column_names):
+                hash_table = table.select(list(key_columns))
+            current_group = -1
+            group_hashes: Set[str] = None
+            for idx, row in zip(hashed_idx, hash_table.take(pa.array(in_range_idx[hashed_idx])).to_pylist()):
+                if group[idx] != current_group:
+                    current_group = group[idx]
+                    group_hashes = self._unique_hashes if current_group == 0 else set()
+                unique_value = self.unique_value(row)
+                if is_tie[idx] and unique_value in group_hashes:
+                    keep[in_range_idx[idx]] = False
+                elif current_group == 0 and final_group == 0:
+                    self._add_unique_hash(unique_value)
+                else:
+                    group_hashes.add(unique_value)
+                    if current_group == final_group:
+                        new_hashes.append(unique_value)
+
+        if final_group > 0:
+            row_value = column[int(in_range_idx[np.flatnonzero(is_new)[-1]])].as_py()
+            if isinstance(row_value, datetime):
+                row_value = pendulum.instance(row_value)
+            incremental_state["last_value"] = row_value
+            incremental_state["unique_hashes"] = []
+            self._unique_hashes = set()
+            self._unique_hashes_limit_reached = False
+            for unique_value in new_hashes:
+                self._add_unique_hash(unique_value)
+        return keep
+
+    def _add_unique_hash(self, unique_value: str) -> None:
+        # all hashes are indexed so items are deduplicated in the current run
+        self._unique_hashes.add(unique_value)
+        unique_hashes = self._cached_state["unique_hashes"]
+        if self.unique_hashes_limit is None or len(unique_hashes) < self.unique_hashes_limit:
+            unique_hashes.append(unique_value)
+        elif not self._unique_hashes_limit_reached:
+            self._unique_hashes_limit_reached = True
+            logger.warning(f"Incremental on {self.resource_name} with cursor path: {self.cursor_path} keeps {self.unique_hashes_limit} unique hashes of items with last_value {self._cached_state['last_value']} in state. Items above that limit will not be deduplicated in the next run.")
+
     def get_incremental_value_type(self) -> Type[Any]:
         """Infers the type of incremental value from a class of an instance if those preserve the Generic arguments information."""
         return get_generic_type_argument_from_instance(self, self.initial_value)
@@ -371,8 +576,18 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         logger.info(f"Bind incremental on {self.resource_name} with initial_value: {self.initial_value}, start_value: {self.start_value}, end_value: {self.end_value}")
         # cache state
         self._cached_state = self.get_state()
+        self._cursor_keys = extract_simple_field_names(self.cursor_path_p)
+        # index hashes to deduplicate items with the same cursor value in constant time
+        self._unique_hashes = set(self._cached_state["unique_hashes"])
         return self
 
+    def __call__(self, item: TDataItems, meta: Any = None) -> Optional[TDataItems]:
+        if is_arrow_item(item):
+            return self._transform_arrow(item)
+        if isinstance(item, list):
+            return self._transform_list(item)
+        return super().__call__(item, meta)
+
     def __str__(self) -> str:
         return f"Incremental at {id(self)} for resource {self.resource_name} with cursor path: {self.cursor_path} initial {self.initial_value} lv_func {self.last_value_func}"
 
@@ -3,12 +3,12 @@ import types
 import asyncio
 import makefun
 from asyncio import Future
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from copy import copy
-from threading import Thread
-from typing import Any, ContextManager, Optional, Sequence, Union, Callable, Iterable, Iterator, List, NamedTuple, Awaitable, Tuple, Type, TYPE_CHECKING, Literal
+from threading import Condition, Lock, Thread
+from typing import Any, AsyncIterable, AsyncIterator, ContextManager, Deque, Dict, Optional, Sequence, Union, Callable, Iterable, Iterator, List, NamedTuple, Awaitable, Tuple, Type, TYPE_CHECKING, Literal
 
-from dlt.common import sleep
 from dlt.common.configuration import configspec
 from dlt.common.configuration.inject import with_config
 from dlt.common.configuration.specs import BaseConfiguration, ContainerInjectableContext
@@ -100,6 +100,129 @@ class ForkPipe:
             yield ResolvablePipeItem(_it, step, pipe, meta)
 
 
+class AsyncGenIterator(Iterator[Awaitable[TDataItems]]):
+    def __init__(self, gen: Union[AsyncIterator[TDataItems], AsyncIterable[TDataItems]], pipe_name: str) -> None:
+        """Wraps async generator or iterator into an iterator of awaitables, each returning next item.
+
+        Only one item of the async generator may be awaited at a time so a new awaitable is available only when the
+        previous one completed (the iterator is not `busy`). An awaitable that reaches the end of the async generator returns None.
+        """
+        self._gen: AsyncIterator[TDataItems] = gen.__aiter__()
+        self._pipe_name = pipe_name
+        self._loop: asyncio.AbstractEventLoop = None
+        self._lock = Lock()
+        self._closed = False
+        self.busy = False
+        self.exhausted = False
+
+    def __next__(self) -> Awaitable[TDataItems]:
+        if self.exhausted:
+            raise StopIteration()
+        assert not self.busy, "Async generator is already running"
+        self.busy = True
+        return self._next_item()
+
+    def close(self) -> None:
+        """Marks the iterator as exhausted and closes the async generator on the event loop that evaluated it.
+        If an item is being awaited, the generator is closed when the item completes.
+        """
+        with self._lock:
+            self._closed = self.exhausted = True
+            busy = self.busy
+        if self._loop and not busy and inspect.isasyncgen(self._gen) and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._gen.aclose(), self._loop).result()
+
+    async def _next_item(self) -> TDataItems:
+        self._loop = asyncio.get_running_loop()
+        # allow the generator to access resource state
+        set_current_pipe_name(self._pipe_name)
+        try:
+            if self.exhausted:
+                return None
+            return await self._gen.__anext__()
+        except StopAsyncIteration:
+            self.exhausted = True
+            return None
+        finally:
+            with self._lock:
+                close_gen = self._closed
+                if not close_gen:
+                    self.busy = False
+            try:
+                # the iterator was closed while the item was awaited
+                if close_gen and inspect.isasyncgen(self._gen):
+                    await self._gen.aclose()
+            finally:
+                unset_current_pipe_name()
+                self.busy = False
+
+
+class ParallelGenIterator(Iterator[Any]):
+    def __init__(self, gen: Iterator[TDataItems], pipe_name: str, prefetch_items: int) -> None:
+        """Evaluates generator `gen` in a thread pool.
+
+        Yields a callable that, when executed in a pool, fetches up to `prefetch_items` from `gen` into a buffer and then
+        the buffered items. Only one fetch runs at a time so the items keep their order. The iterator is `busy` when it waits for
+        a running fetch to produce items.
+        """
+        self._gen = gen
+        self._pipe_name = pipe_name
+        self._prefetch_items = prefetch_items
+        self._buffer: Deque[TDataItems] = deque()
+        self._lock = Lock()
+        self._closed = False
+        self._running = False
+        self.fetching = False
+        self.exhausted = False
+
+    @property
+    def busy(self) -> bool:
+        return self.fetching and len(self._buffer) == 0
+
+    def __next__(self) -> Any:
+        # start fetching in the background as soon as there's space in the buffer
+        if not self.fetching and not self.exhausted and len(self._buffer) < self._prefetch_items:
+            self.fetching = True
+            return self._fetch
+        if len(self._buffer) > 0:
+            return self._buffer.popleft()
+        assert not self.fetching, "Parallel generator is already running"
+        raise StopIteration()
+
+    def close(self) -> None:
+        """Closes the generator. If the generator is being fetched, it is closed when the fetch stops."""
+        with self._lock:
+            self._closed = True
+            if not self._running and inspect.isgenerator(self._gen):
+                self._gen.close()
+
+    def _fetch(self) -> None:
+        with self._lock:
+            # fetch scheduled before the iterator was closed
+            if self._closed:
+                return
+            self._running = True
+        # allow the generator to access resource state
+        set_current_pipe_name(self._pipe_name)
+        try:
+            while not self._closed and len(self._buffer) < self._prefetch_items:
+                item = next(self._gen)
+                if item is not None:
+                    self._buffer.append(item)
+        except StopIteration:
+            self.exhausted = True
+        except Exception:
+            self.exhausted = True
+            raise
+        finally:
+            unset_current_pipe_name()
+            with self._lock:
+                self._running = False
+                self.fetching = False
+                if self._closed and inspect.isgenerator(self._gen):
+                    self._gen.close()
+
+
 class Pipe(SupportsPipe):
     def __init__(self, name: str, steps: List[TPipeStep] = None, parent: "Pipe" = None) -> None:
         self.name = name
@@ -107,6 +230,8 @@ class Pipe(SupportsPipe):
         self._steps: List[TPipeStep] = []
         self._pipe_id = f"{name}_{id(self)}"
         self.parent = parent
+        self.parallelized = False
+        """Evaluates the generator of the pipe in a thread pool"""
         # add the steps, this will check and mod transformations
         if steps:
             for step in steps:
@@ -218,14 +343,18 @@ class Pipe(SupportsPipe):
             self.ensure_gen_bound()
 
         if self.has_parent:
-            steps = self.parent.full_pipe().steps
+            parent_pipe = self.parent.full_pipe()
+            steps = parent_pipe.steps
+            parallelized = parent_pipe.parallelized
         else:
             steps = []
+            parallelized = self.parallelized
 
         steps.extend(self._steps)
         p = Pipe(self.name, [])
         # set the steps so they are not evaluated again
         p._steps = steps
+        p.parallelized = parallelized
         # return pipe with resolved dependencies
         return p
 
@@ -258,6 +387,9 @@ class Pipe(SupportsPipe):
             # otherwise it must be an iterator
             if isinstance(gen, Iterable):
                 self.replace_gen(iter(gen))
+            # async generators are evaluated item by item on the event loop
+            if isinstance(self.gen, (AsyncIterator, AsyncIterable)):
+                self.replace_gen(AsyncGenIterator(self.gen, self.name))
         else:
             # verify if transformer can be called
             self._ensure_transform_step(self._gen_idx, gen)
@@ -323,7 +455,8 @@ class Pipe(SupportsPipe):
             # this partial wraps transformer and sets a signature that is compatible with pipe transform calls
             _data = makefun.wraps(head, new_sig=inspect.signature(_tx_partial))(_tx_partial)
         else:
-            if inspect.isgeneratorfunction(inspect.unwrap(head)) or inspect.isgenerator(head):
+            unwrapped_head = inspect.unwrap(head)
+            if inspect.isgeneratorfunction(unwrapped_head) or inspect.isgenerator(head) or inspect.isasyncgenfunction(unwrapped_head):
                 # if no arguments then no wrap
                 if len(sig.parameters) == 0:
                     return head
@@ -342,8 +475,8 @@ class Pipe(SupportsPipe):
 
     def _verify_head_step(self, step: TPipeStep) -> None:
         # first element must be Iterable, Iterator or Callable in resource pipe
-        if not isinstance(step, (Iterable, Iterator)) and not callable(step):
-            raise CreatePipeException(self.name, "A head of a resource pipe must be Iterable, Iterator or a Callable")
+        if not isinstance(step, (Iterable, Iterator, AsyncIterable, AsyncIterator)) and not callable(step):
+            raise CreatePipeException(self.name, "A head of a resource pipe must be Iterable, Iterator, async Iterator or a Callable")
 
     def _wrap_transform_step_meta(self, step_no: int, step: TPipeStep) -> TPipeStep:
         # step must be a callable: a transformer or a transformation
@@ -412,6 +545,7 @@ class Pipe(SupportsPipe):
         assert not (new_name and keep_pipe_id), "Cannot keep pipe id when renaming the pipe"
         p = Pipe(new_name or self.name, [], self.parent)
         p._steps = self._steps.copy()
+        p.parallelized = self.parallelized
         # clone shares the id with the original
         if keep_pipe_id:
             p._pipe_id = self._pipe_id
@@ -434,13 +568,22 @@ class PipeIterator(Iterator[PipeItem]):
         futures_poll_interval: float = 0.01
         copy_on_fork: bool = False
         next_item_mode: str = "fifo"
+        parallel_prefetch_items: int = 20
 
         __section__ = "extract"
 
-    def __init__(self, max_parallel_items: int, workers: int, futures_poll_interval: float, next_item_mode: TPipeNextItemMode) -> None:
+    def __init__(
+        self,
+        max_parallel_items: int,
+        workers: int,
+        futures_poll_interval: float,
+        next_item_mode: TPipeNextItemMode,
+        parallel_prefetch_items: int = 20
+    ) -> None:
         self.max_parallel_items = max_parallel_items
         self.workers = workers
         self.futures_poll_interval = futures_poll_interval
+        self.parallel_prefetch_items = parallel_prefetch_items
 
         self._round_robin_index: int = -1
         self._initial_sources_count: int = 0
@@ -448,12 +591,24 @@ class PipeIterator(Iterator[PipeItem]):
         self._async_pool_thread: Thread = None
         self._thread_pool: ThreadPoolExecutor = None
         self._sources: List[SourcePipeItem] = []
-        self._futures: List[FuturePipeItem] = []
+        self._futures: Dict[TItemFuture, FuturePipeItem] = {}
+        # futures are moved here by completion callbacks, in order of completion
+        self._done_futures: Deque[TItemFuture] = deque()
+        self._futures_cond = Condition()
         self._next_item_mode = next_item_mode
 
     @classmethod
     @with_config(spec=PipeIteratorConfiguration)
-    def from_pipe(cls, pipe: Pipe, *, max_parallel_items: int = 20, workers: int = 5, futures_poll_interval: float = 0.01, next_item_mode: TPipeNextItemMode = "fifo") -> "PipeIterator":
+    def from_pipe(
+        cls,
+        pipe: Pipe,
+        *,
+        max_parallel_items: int = 20,
+        workers: int = 5,
+        futures_poll_interval: float = 0.01,
+        next_item_mode: TPipeNextItemMode = "fifo",
+        parallel_prefetch_items: int = 20
+    ) -> "PipeIterator":
         # join all dependent pipes
         if pipe.parent:
             pipe = pipe.full_pipe()
@@ -464,9 +619,9 @@ class PipeIterator(Iterator[PipeItem]):
         if not isinstance(pipe.gen, Iterator):
             raise PipeGenInvalid(pipe.name, pipe.gen)
         # create extractor
-        extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode)
+        extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode, parallel_prefetch_items)
         # add as first source
-        extract._sources.append(SourcePipeItem(pipe.gen, 0, pipe, None))
+        extract._add_source_pipe(pipe)
         cls._initial_sources_count = 1
         return extract
 
@@ -481,11 +636,12 @@ class PipeIterator(Iterator[PipeItem]):
         workers: int = 5,
         futures_poll_interval: float = 0.01,
         copy_on_fork: bool = False,
-        next_item_mode: TPipeNextItemMode = "fifo"
+        next_item_mode: TPipeNextItemMode = "fifo",
+        parallel_prefetch_items: int = 20
     ) -> "PipeIterator":
 
         # print(f"max_parallel_items: {max_parallel_items} workers: {workers}")
-        extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode)
+        extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode, parallel_prefetch_items)
         # clone all pipes before iterating (recursively) as we will fork them (this add steps) and evaluate gens
         pipes = PipeIterator.clone_pipes(pipes)
 
@@ -507,7 +663,7 @@ class PipeIterator(Iterator[PipeItem]):
                     raise PipeGenInvalid(pipe.name, pipe.gen)
                 # add every head as source only once
                 if not any(i.pipe == pipe for i in extract._sources):
-                    extract._sources.append(SourcePipeItem(pipe.gen, 0, pipe, None))
+                    extract._add_source_pipe(pipe)
 
         # reverse pipes for current mode, as we start processing from the back
         if next_item_mode == "fifo":
@@ -538,10 +694,13 @@ class PipeIterator(Iterator[PipeItem]):
                         # no more elements in futures or sources
                         raise StopIteration()
                     else:
-                        sleep(self.futures_poll_interval)
+                        self._wait_for_futures()
                     continue
 
             item = pipe_item.item
+            # async generators (ie. returned by async transformers) are evaluated on the event loop
+            if isinstance(item, (AsyncIterator, AsyncIterable)):
+                item = AsyncGenIterator(item, pipe_item.pipe.name)
             # if item is iterator, then add it as a new source
             if isinstance(item, Iterator):
                 # print(f"adding iterable {item}")
@@ -551,20 +710,21 @@ class PipeIterator(Iterator[PipeItem]):
 
             if isinstance(item, Awaitable) or callable(item):
                 # do we have a free slot or one of the slots is done?
-                if len(self._futures) < self.max_parallel_items or self._next_future() >= 0:
+                if len(self._futures) < self.max_parallel_items or len(self._done_futures) > 0:
                     # check if Awaitable first - awaitable can also be a callable
                     if isinstance(item, Awaitable):
                         future = asyncio.run_coroutine_threadsafe(item, self._ensure_async_pool())
                     elif callable(item):
                         future = self._ensure_thread_pool().submit(item)
                     # print(future)
-                    self._futures.append(FuturePipeItem(future, pipe_item.step, pipe_item.pipe, pipe_item.meta))  # type: ignore
+                    self._futures[future] = FuturePipeItem(future, pipe_item.step, pipe_item.pipe, pipe_item.meta)  # type: ignore
+                    future.add_done_callback(self._on_future_done)
                     # pipe item consumed for now, request a new one
                     pipe_item = None
                     continue
                 else:
                     # print("maximum futures exceeded, waiting")
-                    sleep(self.futures_poll_interval)
+                    self._wait_for_futures()
                 # try same item later
                 continue
 
@@ -607,19 +767,27 @@ class PipeIterator(Iterator[PipeItem]):
             loop.stop()
 
         # stop all futures
-        for f, _, _, _ in self._futures:
+        for f in list(self._futures):
             if not f.done():
                 f.cancel()
         self._futures.clear()
+        with self._futures_cond:
+            self._done_futures.clear()
 
         # close all generators
         for gen, _, _, _ in self._sources:
-            if inspect.isgenerator(gen):
+            if inspect.isgenerator(gen) or isinstance(gen, (AsyncGenIterator, ParallelGenIterator)):
                 gen.close()
         self._sources.clear()
 
         # print("stopping loop")
         if self._async_pool:
+            # let the cancelled items and the closing async generators complete before the loop stops
+            async def _wait_for_tasks() -> None:
+                tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            asyncio.run_coroutine_threadsafe(_wait_for_tasks(), self._async_pool).result()
             self._async_pool.call_soon_threadsafe(stop_background_loop, self._async_pool)
             # print("joining thread")
             self._async_pool_thread.join()
@@ -664,21 +832,31 @@ class PipeIterator(Iterator[PipeItem]):
     def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: types.TracebackType) -> None:
         self.close()
 
-    def _next_future(self) -> int:
-        return next((i for i, val in enumerate(self._futures) if val.item.done()), -1)
+    def _on_future_done(self, future: TItemFuture) -> None:
+        # called from the thread that completed the future
+        with self._futures_cond:
+            self._done_futures.append(future)
+            self._futures_cond.notify()
 
-    def _resolve_futures(self) -> ResolvablePipeItem:
-        # no futures at all
-        if len(self._futures) == 0:
-            return None
+    def _wait_for_futures(self) -> None:
+        """Blocks until any future completes. `futures_poll_interval` is used as a timeout so the caller may re-check other sources"""
+        with self._futures_cond:
+            if len(self._done_futures) == 0:
+                self._futures_cond.wait(self.futures_poll_interval)
 
+    def _resolve_futures(self) -> ResolvablePipeItem:
         # anything done?
-        idx = self._next_future()
-        if idx == -1:
-            # nothing done
-            return None
-
-        future, step, pipe, meta = self._futures.pop(idx)
+        with self._futures_cond:
+            if len(self._done_futures) == 0:
+                # nothing done
+                return None
+            future = self._done_futures.popleft()
+
+        # future may be already removed when iterator was closed
+        future_item = self._futures.pop(future, None)
+        if future_item is None:
+            return self._resolve_futures()
+        _, step, pipe, meta = future_item
 
         if future.cancelled():
             # get next future
@@ -691,6 +869,9 @@ class PipeIterator(Iterator[PipeItem]):
             raise ResourceExtractionError(pipe.name, future, str(ex), "future") from ex
 
         item = future.result()
+        # async generators return None when exhausted
+        if item is None:
+            return self._resolve_futures()
         if isinstance(item, DataItemWithMeta):
             return ResolvablePipeItem(item.data, step, pipe, item.meta)
         else:
@@ -706,9 +887,15 @@ class PipeIterator(Iterator[PipeItem]):
         # no more sources to iterate
         if len(self._sources) == 0:
             return None
+        # get items from last added iterator, this makes the overall Pipe as close to FIFO as possible
+        # async generators waiting for their current item are skipped so other sources can progress
+        source_idx = len(self._sources) - 1
+        while self._is_source_busy(source_idx):
+            source_idx -= 1
+            if source_idx < 0:
+                return None
         try:
-            # get items from last added iterator, this makes the overall Pipe as close to FIFO as possible
-            gen, step, pipe, meta = self._sources[-1]
+            gen, step, pipe, meta = self._sources[source_idx]
             # print(f"got {pipe.name} {pipe._pipe_id}")
             # register current pipe name during the execution of gen
             set_current_pipe_name(pipe.name)
@@ -727,7 +914,7 @@ class PipeIterator(Iterator[PipeItem]):
                     return ResolvablePipeItem(item, step, pipe, meta)
         except StopIteration:
             # remove empty iterator and try another source
-            self._sources.pop()
+            self._sources.pop(source_idx)
             return self._get_source_item()
         except (PipelineException, ExtractorException, DltSourceException, PipeException):
             raise
@@ -746,8 +933,15 @@ class PipeIterator(Iterator[PipeItem]):
             # print(f"got {pipe.name} {pipe._pipe_id}")
             # register current pipe name during the execution of gen
             item = None
+            busy_count = 0
             while item is None:
                 self._round_robin_index = (self._round_robin_index + 1) % sources_count
+                if self._is_source_busy(self._round_robin_index):
+                    # all sources are async generators waiting for their items
+                    busy_count += 1
+                    if busy_count == sources_count:
+                        return None
+                    continue
                 gen, step, pipe, meta = self._sources[self._round_robin_index]
                 set_current_pipe_name(pipe.name)
                 item = next(gen)
@@ -774,6 +968,17 @@ class PipeIterator(Iterator[PipeItem]):
         except Exception as ex:
             raise ResourceExtractionError(pipe.name, gen, str(ex), "generator") from ex
 
+    def _add_source_pipe(self, pipe: Pipe) -> None:
+        gen = pipe.gen
+        # parallelized generators are evaluated in the thread pool
+        if pipe.parallelized and not isinstance(gen, AsyncGenIterator):
+            gen = ParallelGenIterator(gen, pipe.name, self.parallel_prefetch_items)  # type: ignore[arg-type]
+        self._sources.append(SourcePipeItem(gen, 0, pipe, None))
+
+    def _is_source_busy(self, idx: int) -> bool:
+        gen = self._sources[idx].item
+        return isinstance(gen, (AsyncGenIterator, ParallelGenIterator)) and gen.busy
+
     @staticmethod
     def clone_pipes(pipes: Sequence[Pipe]) -> List[Pipe]:
         """This will clone pipes and fix the parent/dependent references"""
@@ -23,7 +23,7 @@ from dlt.extract.schema import DltResourceSchema, TTableSchemaTemplate
 from dlt.extract.incremental import Incremental, IncrementalResourceWrapper
 from dlt.extract.exceptions import (
     InvalidTransformerDataTypeGeneratorFunctionRequired, InvalidParentResourceDataType, InvalidParentResourceIsAFunction, InvalidResourceDataType, InvalidResourceDataTypeFunctionNotAGenerator, InvalidResourceDataTypeIsNone, InvalidTransformerGeneratorFunction,
-    DataItemRequiredForDynamicTableHints, InvalidResourceDataTypeAsync, InvalidResourceDataTypeBasic,
+    DataItemRequiredForDynamicTableHints, InvalidResourceDataTypeBasic,
     InvalidResourceDataTypeMultiplePipes, ParametrizedResourceUnbound, ResourceNameMissing, ResourceNotATransformer, ResourcesNotFoundError, SourceExhausted, DeletingResourcesNotSupported)
 
 
@@ -80,7 +80,7 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             name = name or get_callable_name(data)
 
         # if generator, take name from it
-        if inspect.isgenerator(data):
+        if inspect.isgenerator(data) or inspect.isasyncgen(data):
             name = name or get_callable_name(data)  # type: ignore
 
         # name is mandatory
@@ -88,8 +88,6 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             raise ResourceNameMissing()
 
         # several iterable types are not allowed and must be excluded right away
-        if isinstance(data, (AsyncIterator, AsyncIterable)):
-            raise InvalidResourceDataTypeAsync(name, data, type(data))
         if isinstance(data, (str, dict)):
             raise InvalidResourceDataTypeBasic(name, data, type(data))
 
@@ -99,8 +97,8 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             DltResource._ensure_valid_transformer_resource(name, data)
             parent_pipe = DltResource._get_parent_pipe(name, data_from)
 
-        # create resource from iterator, iterable or generator function
-        if isinstance(data, (Iterable, Iterator)) or callable(data):
+        # create resource from iterator, iterable, async iterator or generator function
+        if isinstance(data, (Iterable, Iterator, AsyncIterable, AsyncIterator)) or callable(data):
             pipe = Pipe.from_data(name, data, parent=parent_pipe)
             return cls(pipe, table_schema_template, selected, incremental=incremental, section=section)
         else:
@@ -239,6 +237,19 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             self._pipe.insert_step(FilterItem(item_filter), insert_at)
         return self
 
+    def parallelize(self) -> "DltResource":
+        """Evaluates the resource generator in the extract thread pool so it runs in parallel with other resources.
+
+        The generator is advanced in the pool and the items are prefetched into a bounded buffer. The items are still yielded in order.
+        It is a no-op for transformers.
+
+        Returns:
+            "DltResource": returns self
+        """
+        if not self.is_transformer:
+            self._pipe.parallelized = True
+        return self
+
     def add_limit(self, max_items: int) -> "DltResource":  # noqa: A003
         """Adds a limit `max_items` to the resource pipe
 
@@ -266,9 +277,29 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
                 if inspect.isgenerator(gen):
                     gen.close()
             return
+
+        async def _async_gen_wrap(gen: TPipeStep) -> Any:
+            """Wrap an async generator to take the first `max_items` records"""
+            count = 0
+            if inspect.isfunction(gen):
+                gen = gen()
+            try:
+                async for i in gen:  # type: ignore
+                    yield i
+                    count += 1
+                    if count == max_items:
+                        return
+            finally:
+                if inspect.isasyncgen(gen):
+                    await gen.aclose()
+
         # transformers should be limited by their input, so we only limit non-transformers
         if not self.is_transformer:
-            self._pipe.replace_gen(_gen_wrap(self._pipe.gen))
+            gen = self._pipe.gen
+            if inspect.isasyncgen(gen) or inspect.isasyncgenfunction(inspect.unwrap(gen)):
+                self._pipe.replace_gen(_async_gen_wrap(gen))
+            else:
+                self._pipe.replace_gen(_gen_wrap(gen))
         return self
 
     def add_step(self, item_transform: ItemTransformFunctionWithMeta[TDataItems], insert_at: int = None) -> "DltResource":  # noqa: A003
@@ -720,6 +751,16 @@ class DltSource(Iterable[TDataItem]):
         else:
             raise ValueError(strategy)
 
+    def parallelize(self) -> "DltSource":
+        """Evaluates all selected resources in the source that are not transformers in the extract thread pool.
+
+        Returns:
+            "DltSource": returns self
+        """
+        for resource in self.resources.selected.values():
+            resource.parallelize()
+        return self
+
     def add_limit(self, max_items: int) -> "DltSource":  # noqa: A003
         """Adds a limit `max_items` yielded from all selected resources in the source that are not transformers.
 
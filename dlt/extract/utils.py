@@ -4,12 +4,20 @@ from collections.abc import Mapping as C_Mapping
 from dlt.common.exceptions import MissingDependencyException
 from dlt.extract.typing import TTableHintTemplate, TDataItem, TFunHintTemplate
 from dlt.common.schema.typing import TColumnNames, TAnySchemaColumns, TTableSchemaColumns
-from dlt.common.typing import TDataItem
+from dlt.common.typing import TDataItem, TDataItems
 
 try:
     from dlt.common.libs import pydantic
 except MissingDependencyException:
     pydantic = None
+try:
+    from dlt.common.libs.pyarrow import pyarrow as pa
+except MissingDependencyException:
+    pa = None
+try:
+    import pandas as pd
+except ModuleNotFoundError:
+    pd = None
 
 
 def resolve_column_value(column_hint: TTableHintTemplate[TColumnNames], item: TDataItem) -> Union[Any, List[Any]]:
@@ -22,6 +30,11 @@ def resolve_column_value(column_hint: TTableHintTemplate[TColumnNames], item: TD
     return [item[k] for k in columns]
 
 
+def is_arrow_item(item: TDataItems) -> bool:
+    """Tells if `item` is an arrow table, record batch or pandas data frame"""
+    return (pa is not None and isinstance(item, (pa.Table, pa.RecordBatch))) or (pd is not None and isinstance(item, pd.DataFrame))
+
+
 def ensure_table_schema_columns(columns: TAnySchemaColumns) -> TTableSchemaColumns:
     """Convert supported column schema types to a column dict which
     can be used in resource schema.
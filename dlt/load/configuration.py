@@ -14,6 +14,12 @@ class LoaderConfiguration(PoolRunnerConfiguration):
     """when True, raises on terminally failed jobs immediately"""
     raise_on_max_retries: int = 5
     """When gt 0 will raise when job reaches raise_on_max_retries"""
+    job_poll_interval: float = 1.0
+    """How often (seconds) the state of running jobs is polled. New jobs are started as soon as any worker becomes free"""
+    pool_connections: bool = False
+    """When True, destination connections are reused across load jobs"""
+    connection_idle_timeout: float = 60.0
+    """Pooled connections idle for more than that many seconds are closed"""
     _load_storage_config: LoadStorageConfiguration = None
 
     if TYPE_CHECKING:
@@ -2,13 +2,17 @@ import contextlib
 from copy import copy
 from functools import reduce
 import datetime  # noqa: 251
-from typing import Dict, List, Optional, Tuple, Set, Iterator
-from multiprocessing.pool import ThreadPool
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Set, Iterator, Sequence, cast
+from multiprocessing.pool import ThreadPool, AsyncResult
 import os
 
-from dlt.common import sleep, logger
+from dlt.common import logger
+from dlt.common.runtime import signals
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
+from dlt.common.configuration.container import Container
 from dlt.common.pipeline import LoadInfo, SupportsPipeline
 from dlt.common.schema.utils import get_child_tables, get_top_level_table, get_write_disposition
 from dlt.common.storages.load_storage import LoadPackageInfo, ParsedLoadJobFileName, TJobState
@@ -20,9 +24,10 @@ from dlt.common.exceptions import TerminalValueError, DestinationTerminalExcepti
 from dlt.common.schema import Schema
 from dlt.common.schema.typing import TTableSchema, TWriteDisposition
 from dlt.common.storages import LoadStorage
-from dlt.common.destination.reference import DestinationClientDwhConfiguration, FollowupJob, JobClientBase, WithStagingDataset, DestinationReference, LoadJob, NewLoadJob, TLoadJobState, DestinationClientConfiguration
+from dlt.common.destination.reference import DestinationClientDwhConfiguration, FollowupJob, JobClientBase, WithStagingDataset, WithReferenceJobsBatch, DestinationReference, LoadJob, NewLoadJob, TLoadJobState, DestinationClientConfiguration
 
-from dlt.destinations.job_impl import EmptyLoadJob
+from dlt.destinations.job_impl import EmptyLoadJob, NewReferenceJob
+from dlt.destinations.connection_pool import ConnectionPoolsContext
 from dlt.destinations.exceptions import LoadJobUnknownTableException
 
 from dlt.load.configuration import LoaderConfiguration
@@ -53,6 +58,8 @@ class Load(Runnable[ThreadPool]):
         self.load_storage: LoadStorage = self.create_storage(is_storage_owner)
         self._processed_load_ids: Dict[str, str] = {}
         """Load ids to dataset name"""
+        self._slots_utilization: Dict[str, List[float]] = {}
+        """Load ids to fraction of package load time each worker slot was busy"""
 
 
     def create_storage(self, is_storage_owner: bool) -> LoadStorage:
@@ -100,6 +107,20 @@ class Load(Runnable[ThreadPool]):
         else:
             yield
 
+    @contextlib.contextmanager
+    def maybe_with_connection_pools(self) -> Iterator[None]:
+        """Lets sql clients reuse destination connections across jobs if `pool_connections` is set. Pooled connections are closed on exit"""
+        if not self.config.pool_connections:
+            yield
+            return
+        # each worker holds a connection while loading, one more for the main thread
+        pools = ConnectionPoolsContext(max_size=self.config.workers + 1, idle_timeout=self.config.connection_idle_timeout)
+        try:
+            with Container().injectable_context(pools):
+                yield
+        finally:
+            pools.close()
+
     @staticmethod
     @workermethod
     def w_spool_job(self: "Load", file_path: str, load_id: str, schema: Schema) -> Optional[LoadJob]:
@@ -128,24 +149,30 @@ class Load(Runnable[ThreadPool]):
         self.load_storage.start_job(load_id, job.file_name())
         return job
 
-    def spool_new_jobs(self, load_id: str, schema: Schema) -> Tuple[int, List[LoadJob]]:
-        # TODO: validate file type, combine files, finalize etc., this is client specific, jsonl for single table
-        # can just be combined, insert_values must be finalized and then combined
-        # use thread based pool as jobs processing is mostly I/O and we do not want to pickle jobs
-        # TODO: combine files by providing a list of files pertaining to same table into job, so job must be
-        # extended to accept a list
-        load_files = self.load_storage.list_new_jobs(load_id)[:self.config.workers]
-        file_count = len(load_files)
-        if file_count == 0:
-            logger.info(f"No new jobs found in {load_id}")
-            return 0, []
-        logger.info(f"Will load {file_count}, creating jobs")
-        param_chunk = [(id(self), file, load_id, schema) for file in load_files]
-        # exceptions should not be raised, None as job is a temporary failure
-        # other jobs should not be affected
-        jobs: List[LoadJob] = self.pool.starmap(Load.w_spool_job, param_chunk)
-        # remove None jobs and check the rest
-        return file_count, [job for job in jobs if job is not None]
+    @staticmethod
+    @workermethod
+    def w_spool_jobs_batch(self: "Load", file_paths: Sequence[str], load_id: str, schema: Schema) -> List[LoadJob]:
+        """Starts reference jobs in `file_paths`, all belonging to the same table, with a single operation. See `WithReferenceJobsBatch`"""
+        jobs: List[LoadJob] = None
+        try:
+            with self.get_destination_client(schema) as job_client:
+                table = self.get_load_table(schema, file_paths[0])
+                logger.info(f"Will load {len(file_paths)} reference files with table name {table['name']} in a single batch")
+                if table["write_disposition"] not in ["append", "replace", "merge"]:
+                    raise LoadClientUnsupportedWriteDisposition(table["name"], table["write_disposition"], file_paths[0])
+                with self.maybe_with_staging_dataset(job_client, table):
+                    full_paths = [self.load_storage.storage.make_full_path(file_path) for file_path in file_paths]
+                    jobs = cast(WithReferenceJobsBatch, job_client).start_reference_jobs_batch(table, full_paths, load_id)
+        except (DestinationTerminalException, TerminalValueError):
+            # none of the files can be loaded
+            logger.exception(f"Terminal problem when adding batch of jobs {file_paths}")
+            jobs = [EmptyLoadJob.from_file_path(file_path, "failed", pretty_format_exception()) for file_path in file_paths]
+        except (DestinationTransientException, Exception):
+            logger.exception(f"Temporary problem when adding batch of jobs {file_paths}")
+            jobs = [EmptyLoadJob.from_file_path(file_path, "retry", pretty_format_exception()) for file_path in file_paths]
+        for job in jobs:
+            self.load_storage.start_job(load_id, job.file_name())
+        return jobs
 
     def retrieve_jobs(self, client: JobClientBase, load_id: str, staging_client: JobClientBase = None) -> Tuple[int, List[LoadJob]]:
         jobs: List[LoadJob] = []
@@ -218,7 +245,10 @@ class Load(Runnable[ThreadPool]):
             jobs = jobs + starting_job.create_followup_jobs(state)
         return jobs
 
-    def complete_jobs(self, load_id: str, jobs: List[LoadJob], schema: Schema) -> List[LoadJob]:
+    def complete_jobs(self, load_id: str, jobs: List[LoadJob], schema: Schema, on_completed: Callable[[LoadJob], None] = None) -> List[LoadJob]:
+        """Moves jobs that are no longer running to completed, failed or new (retried) jobs and returns the running jobs.
+           `on_completed` is called for each job that frees its slot, whatever the final state
+        """
         remaining_jobs: List[LoadJob] = []
         logger.info(f"Will complete {len(jobs)} for {load_id}")
         for ii in range(len(jobs)):
@@ -261,6 +291,8 @@ class Load(Runnable[ThreadPool]):
                 self.collector.update("Jobs")
                 if state == "failed":
                     self.collector.update("Jobs", 1, message="WARNING: Some of the jobs failed!", label="Failed")
+            if state != "running" and on_completed:
+                on_completed(job)
 
         return remaining_jobs
 
@@ -297,6 +329,10 @@ class Load(Runnable[ThreadPool]):
         # initialize analytical storage ie. create dataset required by passed schema
         job_client: JobClientBase
         with self.get_destination_client(schema) as job_client:
+            # reference jobs from the staging destination are loaded in batches if destination supports it
+            reference_jobs_batch = 0
+            if self.staging_destination and isinstance(job_client, WithReferenceJobsBatch):
+                reference_jobs_batch = job_client.max_reference_jobs_batch
             expected_update = self.load_storage.begin_schema_update(load_id)
             if expected_update is not None:
                 # update the default dataset
@@ -333,11 +369,9 @@ class Load(Runnable[ThreadPool]):
             else:
                 jobs_count, jobs = self.retrieve_jobs(job_client, load_id)
 
-        if not jobs:
-            # jobs count is a total number of jobs including those that could not be initialized
-            jobs_count, jobs = self.spool_new_jobs(load_id, schema)
+        new_job_files = self.load_storage.list_new_jobs(load_id)
         # if there are no existing or new jobs we complete the package
-        if jobs_count == 0:
+        if jobs_count == 0 and len(new_job_files) == 0:
             self.complete_package(load_id, schema, False)
             return
         # update counter we only care about the jobs that are scheduled to be loaded
@@ -348,11 +382,35 @@ class Load(Runnable[ThreadPool]):
         self.collector.update("Jobs", no_completed_jobs, total_jobs)
         if no_failed_jobs > 0:
             self.collector.update("Jobs", no_failed_jobs, message="WARNING: Some of the jobs failed!", label="Failed")
+        # sliding window: a new job is started as soon as any of the worker slots frees up
+        # jobs that were retried in this run go back to new jobs and must not be picked up again
+        spooled_files: Set[ParsedLoadJobFileName] = set(job.job_file_info()._replace(retry_count=0) for job in jobs)
+        spooling_jobs: List["AsyncResult[Any]"] = []
+        slot_freed = threading.Event()
+        # time spent with given number of slots busy, used to compute slots utilization
+        slots_busy_time = [0.0] * (self.config.workers + 1)
+        busy_slots = 0
+        tick = time.monotonic()
         # loop until all jobs are processed
         while True:
             try:
-                remaining_jobs = self.complete_jobs(load_id, jobs, schema)
-                if len(remaining_jobs) == 0:
+                # clear before collecting so completions happening from now on will wake the loop
+                slot_freed.clear()
+                jobs.extend(self.collect_spooled_jobs(spooling_jobs))
+                # a job leaving the slot wakes the loop so the slot is refilled right away, polling is only a safety net
+                jobs = self.complete_jobs(load_id, jobs, schema, lambda _: slot_freed.set())
+                free_slots = self.config.workers - len(jobs) - len(spooling_jobs)
+                if free_slots > 0:
+                    spooling_jobs.extend(
+                        self.start_new_jobs(load_id, schema, free_slots, spooled_files, lambda _: slot_freed.set(), reference_jobs_batch)
+                    )
+                now = time.monotonic()
+                slots_busy_time[busy_slots] += now - tick
+                tick = now
+                busy_slots = min(len(jobs) + len(spooling_jobs), self.config.workers)
+                if len(jobs) == 0 and len(spooling_jobs) == 0:
+                    self._slots_utilization[load_id] = self._compute_slots_utilization(slots_busy_time)
+                    logger.info(f"Workers slots utilization in {load_id}: {self._slots_utilization[load_id]}")
                     # get package status
                     package_info = self.load_storage.get_load_package_info(load_id)
                     # possibly raise on failed jobs
@@ -367,15 +425,95 @@ class Load(Runnable[ThreadPool]):
                             if r_c > 0 and r_c % self.config.raise_on_max_retries == 0:
                                 raise LoadClientJobRetry(load_id, new_job.job_file_info.job_id(), r_c, self.config.raise_on_max_retries)
                     break
-                # process remaining jobs again
-                jobs = remaining_jobs
-                # this will raise on signal
-                sleep(1)
+                # wake up when any job finished starting or poll running jobs again. this will raise on signal
+                signals.raise_if_signalled()
+                slot_freed.wait(self.config.job_poll_interval)
+                signals.raise_if_signalled()
             except LoadClientJobFailed:
                 # the package is completed and skipped
                 self.complete_package(load_id, schema, True)
                 raise
 
+    def start_new_jobs(
+        self,
+        load_id: str,
+        schema: Schema,
+        max_jobs: int,
+        spooled_files: Set[ParsedLoadJobFileName],
+        on_started: Callable[[Any], None] = None,
+        reference_jobs_batch: int = 0
+    ) -> List["AsyncResult[Any]"]:
+        """Starts at most `max_jobs` new jobs in the pool without waiting for them to start. Files already present in `spooled_files` are skipped
+           so jobs that were retried are not picked up again in the same run. `on_started` is called from the worker thread when job starts.
+
+           If `reference_jobs_batch` is set, reference jobs of a table are started in batches of up to that many files, once all the files
+           of that table were uploaded to the staging destination. Each batch takes a single slot.
+        """
+        new_jobs = self.load_storage.list_new_jobs(load_id)
+        pending_tables: Set[str] = set()
+        if reference_jobs_batch:
+            # tables with files not yet on the staging destination
+            for file in new_jobs + self.load_storage.list_started_jobs(load_id):
+                if self.is_staging_destination_job(file):
+                    pending_tables.add(LoadStorage.parse_job_file_name(file).table_name)
+        # each started job or batch of jobs is a list of files
+        to_start: List[List[str]] = []
+        batches: Dict[str, List[str]] = {}
+        for file in new_jobs:
+            # identify file regardless of its retry count
+            file_info = LoadStorage.parse_job_file_name(file)
+            file_key = file_info._replace(retry_count=0)
+            if file_key in spooled_files:
+                continue
+            is_batched = reference_jobs_batch > 0 and NewReferenceJob.is_reference_job(file)
+            if is_batched:
+                if file_info.table_name in pending_tables:
+                    continue
+                batch = batches.get(file_info.table_name)
+                if batch is not None and len(batch) < reference_jobs_batch:
+                    batch.append(file)
+                    spooled_files.add(file_key)
+                    continue
+            if len(to_start) == max_jobs:
+                continue
+            to_start.append([file])
+            if is_batched:
+                batches[file_info.table_name] = to_start[-1]
+            spooled_files.add(file_key)
+
+        started: List["AsyncResult[Any]"] = []
+        for files in to_start:
+            if reference_jobs_batch > 0 and NewReferenceJob.is_reference_job(files[0]):
+                logger.info(f"Will start new batch of jobs for files {files}")
+                started.append(self.pool.apply_async(Load.w_spool_jobs_batch, (id(self), files, load_id, schema), callback=on_started, error_callback=on_started))
+            else:
+                logger.info(f"Will start new job for file {files[0]}")
+                started.append(self.pool.apply_async(Load.w_spool_job, (id(self), files[0], load_id, schema), callback=on_started, error_callback=on_started))
+        return started
+
+    @staticmethod
+    def collect_spooled_jobs(spooling_jobs: List["AsyncResult[Any]"]) -> List[LoadJob]:
+        """Removes jobs that finished starting from `spooling_jobs` and returns them. Batches of jobs are flattened. Exceptions from the workers are re-raised"""
+        ready = [spooling_job for spooling_job in spooling_jobs if spooling_job.ready()]
+        for spooling_job in ready:
+            spooling_jobs.remove(spooling_job)
+        jobs: List[LoadJob] = []
+        for result in (spooling_job.get() for spooling_job in ready):
+            if isinstance(result, list):
+                jobs.extend(result)
+            elif result is not None:
+                jobs.append(result)
+        return jobs
+
+    @staticmethod
+    def _compute_slots_utilization(slots_busy_time: Sequence[float]) -> List[float]:
+        """Computes fraction of the total time each of the slots was busy from a time spent with given number of busy slots"""
+        total_time = sum(slots_busy_time)
+        if total_time == 0:
+            return [0.0] * (len(slots_busy_time) - 1)
+        # slot with index i is busy whenever more than i slots are busy
+        return [round(sum(slots_busy_time[i + 1:]) / total_time, 3) for i in range(len(slots_busy_time) - 1)]
+
     def run(self, pool: ThreadPool) -> TRunMetrics:
         # store pool
         self.pool = pool
@@ -397,7 +535,8 @@ class Load(Runnable[ThreadPool]):
         # TODO: another place where tracing must be refactored
         self._processed_load_ids[load_id] = None
         with self.collector(f"Load {schema.name} in {load_id}"):
-            self.load_single_package(load_id, schema)
+            with self.maybe_with_connection_pools():
+                self.load_single_package(load_id, schema)
 
         return TRunMetrics(False, len(self.load_storage.list_packages()))
 
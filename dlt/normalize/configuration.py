@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from dlt.common.configuration import configspec
 from dlt.common.destination import DestinationCapabilitiesContext
@@ -9,6 +9,9 @@ from dlt.common.storages import LoadStorageConfiguration, NormalizeStorageConfig
 @configspec
 class NormalizeConfiguration(PoolRunnerConfiguration):
     pool_type: TPoolType = "process"
+    chunks_per_worker: int = 2  # files are split into that many chunks per worker, free workers pick up the remaining chunks
+    file_part_min_bytes: Optional[int] = None  # uncompressed extracted files larger than that are split into parts normalized in parallel, None disables splitting
+    merge_job_files_max_bytes: Optional[int] = None  # job files of the same table and format are merged into files up to that size, None disables merging
     destination_capabilities: DestinationCapabilitiesContext = None  # injectable
     _schema_storage_config: SchemaStorageConfiguration
     _normalize_storage_config: NormalizeStorageConfiguration
@@ -22,6 +25,9 @@ class NormalizeConfiguration(PoolRunnerConfiguration):
             self,
             pool_type: TPoolType = "process",
             workers: int = None,
+            chunks_per_worker: int = 2,
+            file_part_min_bytes: Optional[int] = None,
+            merge_job_files_max_bytes: Optional[int] = None,
             _schema_storage_config: SchemaStorageConfiguration = None,
             _normalize_storage_config: NormalizeStorageConfiguration = None,
             _load_storage_config: LoadStorageConfiguration = None
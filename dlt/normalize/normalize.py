@@ -1,25 +1,35 @@
 import os
-from typing import Any, Callable, List, Dict, Sequence, Tuple, Set
-from multiprocessing.pool import AsyncResult, Pool as ProcessPool
-
-from dlt.common import pendulum, json, logger, sleep
+import heapq
+import math
+import pickle
+import shutil
+import tempfile
+from collections import deque
+from queue import Empty, Queue
+from copy import copy
+from typing import IO, Any, Callable, Deque, Iterator, List, Dict, NamedTuple, Optional, Sequence, Tuple, Set, Union
+from multiprocessing.pool import Pool as ProcessPool
+
+from dlt.common import pendulum, json, logger
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.configuration.container import Container
 from dlt.common.destination import DestinationCapabilitiesContext, TLoaderFileFormat
-from dlt.common.json import custom_pua_decode
+from dlt.common.json import custom_pua_decode, may_have_pua
 from dlt.common.runners import TRunMetrics, Runnable
 from dlt.common.runtime import signals
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
-from dlt.common.schema.typing import TStoredSchema, TTableSchemaColumns
+from dlt.common.schema import utils
+from dlt.common.schema.typing import TStoredSchema, TTableSchemaColumns, TPartialTableSchema
 from dlt.common.schema.utils import merge_schema_updates
 from dlt.common.storages.exceptions import SchemaNotFoundError
-from dlt.common.storages import NormalizeStorage, SchemaStorage, LoadStorage, LoadStorageConfiguration, NormalizeStorageConfiguration
+from dlt.common.storages import FileStorage, NormalizeStorage, SchemaStorage, LoadStorage, LoadStorageConfiguration, NormalizeStorageConfiguration
 from dlt.common.typing import TDataItem
+from dlt.common.data_types import TDataType
 from dlt.common.schema import TSchemaUpdate, Schema
-from dlt.common.schema.exceptions import CannotCoerceColumnException
+from dlt.common.schema.exceptions import CannotCoerceColumnException, CannotCoerceNullException
 from dlt.common.pipeline import NormalizeInfo
-from dlt.common.utils import chunks, TRowCount, merge_row_count, increase_row_count
+from dlt.common.utils import chunks, uniq_id, TRowCount, merge_row_count, increase_row_count
 
 from dlt.normalize.configuration import NormalizeConfiguration
 
@@ -31,7 +41,34 @@ TMapFuncType = Callable[[Schema, str, Sequence[str]], TMapFuncRV]  # input param
 TWorkerRV = Tuple[List[TSchemaUpdate], int, List[str], TRowCount]
 
 
+class ExtractedFilePart(NamedTuple):
+    """Part `part_no` of `parts_count` contiguous parts of the extracted file, a whole file has single part. Parts of jsonl files are
+    byte ranges of the uncompressed content, parts of parquet files are ranges of row groups"""
+    file_name: str
+    part_no: int = 0
+    parts_count: int = 1
+
+
+class SchemaSnapshot(NamedTuple):
+    """Reference to a compiled schema pickled into `file_path` by the main process and the schema updates accepted after the snapshot was taken.
+    Worker processes load the snapshot once and then only apply the `deltas` they have not seen yet"""
+    schema_name: str
+    snapshot_id: str
+    file_path: str
+    deltas: Sequence[TSchemaUpdate] = ()
+    version_hash: str = None
+    """Content hash of the schema in the snapshot, lets workers kept between runs reuse a schema with the same content"""
+
+
+# schemas restored from snapshots in this worker process: schema name -> (snapshot id, snapshot version hash, schema, number of applied deltas)
+_W_SCHEMA_CACHE: Dict[str, Tuple[str, str, Schema, int]] = {}
+
+
 class Normalize(Runnable[ProcessPool]):
+    SCHEMA_SNAPSHOT_FILE_NAME = "schema_snapshot.%s.pickle"
+    """Temporary files with the schema shared with the worker processes, kept outside of the load package"""
+    SCHEMA_SNAPSHOT_MAX_DELTAS = 64
+    """A new schema snapshot is taken when more schema updates were accepted since the last one"""
 
     @with_config(spec=NormalizeConfiguration, sections=(known_sections.NORMALIZE,))
     def __init__(self, collector: Collector = NULL_COLLECTOR, schema_storage: SchemaStorage = None, config: NormalizeConfiguration = config.value) -> None:
@@ -70,9 +107,9 @@ class Normalize(Runnable[ProcessPool]):
             normalize_storage_config: NormalizeStorageConfiguration,
             loader_storage_config: LoadStorageConfiguration,
             destination_caps: DestinationCapabilitiesContext,
-            stored_schema: TStoredSchema,
+            stored_schema: Union[TStoredSchema, SchemaSnapshot],
             load_id: str,
-            extracted_items_files: Sequence[str],
+            extracted_items_files: Sequence[ExtractedFilePart],
         ) -> TWorkerRV:
 
         schema_updates: List[TSchemaUpdate] = []
@@ -81,24 +118,42 @@ class Normalize(Runnable[ProcessPool]):
 
         # process all files with data items and write to buffered item storage
         with Container().injectable_context(destination_caps):
-            schema = Schema.from_stored_schema(stored_schema)
+            schema, applied_deltas = Normalize._w_get_schema(stored_schema)
             load_storage = LoadStorage(False, destination_caps.preferred_loader_file_format, LoadStorage.ALL_SUPPORTED_FILE_FORMATS, loader_storage_config)
+            # arrow tables are written directly as parquet if destination expects parquet files
+            arrow_load_storage: LoadStorage = None
+            if destination_caps.preferred_loader_file_format == "parquet":
+                arrow_load_storage = LoadStorage(False, "arrow", LoadStorage.ALL_SUPPORTED_FILE_FORMATS, loader_storage_config)
             normalize_storage = NormalizeStorage(False, normalize_storage_config)
 
             try:
                 root_tables: Set[str] = set()
                 populated_root_tables: Set[str] = set()
-                for extracted_items_file in extracted_items_files:
+                for extracted_items_file, part_no, parts_count in extracted_items_files:
                     line_no: int = 0
                     root_table_name = NormalizeStorage.parse_normalize_file_name(extracted_items_file).table_name
-                    root_tables.add(root_table_name)
-                    logger.debug(f"Processing extracted items in {extracted_items_file} in load_id {load_id} with table name {root_table_name} and schema {schema.name}")
-                    with normalize_storage.storage.open_file(extracted_items_file) as f:
-                        # enumerate jsonl file line by line
+                    # only the first part of a file writes empty jobs
+                    if part_no == 0:
+                        root_tables.add(root_table_name)
+                    logger.debug(f"Processing extracted items in {extracted_items_file} (part {part_no} of {parts_count}) in load_id {load_id} with table name {root_table_name} and schema {schema.name}")
+                    is_arrow_file = NormalizeStorage.is_arrow_file(extracted_items_file)
+                    with normalize_storage.storage.open_file(extracted_items_file, "rb") as f:
                         items_count = 0
-                        for line_no, line in enumerate(f):
-                            items: List[TDataItem] = json.loads(line)
-                            partial_update, items_count, r_counts = Normalize._w_normalize_chunk(load_storage, schema, load_id, root_table_name, items)
+                        if is_arrow_file:
+                            # enumerate parquet file by row groups
+                            lines = Normalize._w_read_arrow_row_groups(f, part_no, parts_count, as_arrow=arrow_load_storage is not None)
+                        else:
+                            # enumerate jsonl file line by line, only uncompressed files are split so parts are ranges of on-disk bytes
+                            start, end = 0, None
+                            if parts_count > 1:
+                                file_size = os.path.getsize(normalize_storage.storage.make_full_path(extracted_items_file))
+                                start, end = Normalize._get_part_range(file_size, part_no, parts_count)
+                            lines = Normalize._w_read_jsonl_lines(f, start, end)
+                        for line_no, items, decode_pua in lines:
+                            if is_arrow_file and arrow_load_storage:
+                                partial_update, items_count, r_counts = Normalize._w_normalize_arrow_chunk(arrow_load_storage, schema, load_id, root_table_name, items)
+                            else:
+                                partial_update, items_count, r_counts = Normalize._w_normalize_chunk(load_storage, schema, load_id, root_table_name, items, decode_pua)
                             schema_updates.append(partial_update)
                             total_items += items_count
                             merge_row_count(row_counts, r_counts)
@@ -121,13 +176,144 @@ class Normalize(Runnable[ProcessPool]):
                 raise
             finally:
                 load_storage.close_writers(load_id)
+                if arrow_load_storage:
+                    arrow_load_storage.close_writers(load_id)
+
+        # keep the schema for the next task only if it was not modified here, the main process may reject our updates
+        if isinstance(stored_schema, SchemaSnapshot) and not any(schema_updates):
+            _W_SCHEMA_CACHE[schema.name] = (stored_schema.snapshot_id, stored_schema.version_hash, schema, applied_deltas)
 
         logger.info(f"Processed total {total_items} items in {len(extracted_items_files)} files")
 
-        return schema_updates, total_items, load_storage.closed_files(), row_counts
+        closed_files = load_storage.closed_files()
+        if arrow_load_storage:
+            closed_files.extend(arrow_load_storage.closed_files())
+        return schema_updates, total_items, closed_files, row_counts
+
+    @staticmethod
+    def _w_get_schema(stored_schema: Union[TStoredSchema, SchemaSnapshot]) -> Tuple[Schema, int]:
+        """Restores schema from a stored schema or a snapshot. Snapshots are loaded once per worker process and then brought up to date
+        with deltas. Returns the schema and the number of deltas applied to it"""
+        if not isinstance(stored_schema, SchemaSnapshot):
+            return Schema.from_stored_schema(stored_schema), 0
+        # take the schema out of the cache so it is never shared by threads or reused after a failed task
+        cached = _W_SCHEMA_CACHE.pop(stored_schema.schema_name, None)
+        if cached and cached[0] == stored_schema.snapshot_id:
+            _, _, schema, applied_deltas = cached
+        elif cached and cached[3] == 0 and cached[1] and cached[1] == stored_schema.version_hash:
+            # snapshot from another run (ie. in a persistent pool) with the content of the cached schema
+            schema, applied_deltas = cached[2], 0
+        else:
+            # snapshot contains compiled schema object so the settings and normalizers are not configured again
+            with open(stored_schema.file_path, "rb") as f:
+                schema = pickle.load(f)
+            applied_deltas = 0
+        for schema_update in stored_schema.deltas[applied_deltas:]:
+            for table_updates in schema_update.values():
+                for partial_table in table_updates:
+                    schema.update_schema(partial_table)
+        return schema, len(stored_schema.deltas)
+
+    @staticmethod
+    def _w_read_jsonl_lines(f: IO[bytes], start: int, end: Optional[int]) -> Iterator[Tuple[int, List[TDataItem], bool]]:
+        """Reads lines of binary `f` that start at byte offsets from `start` up to but excluding `end`, until the end of file if `end` is None"""
+        if start > 0:
+            # the line that contains byte at `start - 1` belongs to the previous part
+            f.seek(start - 1)
+            f.readline()
+        pos = f.tell()
+        line_no = 0
+        while end is None or pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            # values are decoded only if there are any PUA type markers in the line
+            yield line_no, json.loadb(line), may_have_pua(line)
+            line_no += 1
+
+    @staticmethod
+    def _get_part_range(size: int, part_no: int, parts_count: int) -> Tuple[int, Optional[int]]:
+        """Returns start and end of `part_no` of `parts_count` contiguous parts of `size` items, end of the last part is None"""
+        start = size * part_no // parts_count
+        end = None if part_no == parts_count - 1 else size * (part_no + 1) // parts_count
+        return start, end
+
+    @staticmethod
+    def _w_read_arrow_row_groups(f: IO[Any], part_no: int, parts_count: int, as_arrow: bool) -> Iterator[Tuple[int, Any, bool]]:
+        from dlt.common.libs.pyarrow import pyarrow
+
+        parquet_file = pyarrow.parquet.ParquetFile(f)
+        # each part gets a contiguous range of row groups
+        start, end = Normalize._get_part_range(parquet_file.num_row_groups, part_no, parts_count)
+        for row_group_no in range(start, parquet_file.num_row_groups if end is None else end):
+            table = parquet_file.read_row_group(row_group_no)
+            # arrow tables are converted to rows if destination does not load parquet, rows contain no PUA encoded values
+            yield row_group_no, table if as_arrow else table.to_pylist(), False
 
     @staticmethod
-    def _w_normalize_chunk(load_storage: LoadStorage, schema: Schema, load_id: str, root_table_name: str, items: List[TDataItem]) -> Tuple[TSchemaUpdate, int, TRowCount]:
+    def _w_normalize_arrow_chunk(load_storage: LoadStorage, schema: Schema, load_id: str, root_table_name: str, item: Any) -> Tuple[TSchemaUpdate, int, TRowCount]:
+        """Infers schema from arrow `item`, adds dlt columns and writes it without converting into Python objects"""
+        from dlt.common.libs.pyarrow import pyarrow, py_arrow_to_table_schema_columns, columns_to_arrow_schema, cast_to_arrow_schema, generate_dlt_ids
+
+        schema_update: TSchemaUpdate = {}
+        table_name = schema.naming.normalize_table_identifier(root_table_name)
+        # normalize column names
+        item = item.rename_columns([schema.naming.normalize_identifier(name) for name in item.column_names])
+        # add dlt columns, they are not nullable
+        if "_dlt_load_id" not in item.column_names:
+            load_id_column = pyarrow.repeat(pyarrow.scalar(load_id, type=pyarrow.string()), item.num_rows)
+            item = item.append_column(pyarrow.field("_dlt_load_id", pyarrow.string(), nullable=False), load_id_column)
+        if "_dlt_id" not in item.column_names:
+            item = item.append_column(pyarrow.field("_dlt_id", pyarrow.string(), nullable=False), generate_dlt_ids(item.num_rows))
+        # find new columns and existing columns with hints only
+        table = schema.tables.get(table_name) or utils.new_table(table_name)
+        new_columns: TTableSchemaColumns = {}
+        coerced_columns: List[Tuple[str, TDataType, TDataType]] = []
+        for col_name, arrow_column in py_arrow_to_table_schema_columns(item.schema).items():
+            existing_column = table["columns"].get(col_name)
+            if existing_column and existing_column.get("data_type"):
+                if not existing_column.get("nullable", True) and item.column(col_name).null_count > 0:
+                    raise CannotCoerceNullException(table_name, col_name)
+                if existing_column["data_type"] != arrow_column["data_type"]:
+                    coerced_columns.append((col_name, arrow_column["data_type"], existing_column["data_type"]))
+                continue
+            column = schema.infer_column_hints(col_name, arrow_column["data_type"])
+            for prop in ("precision", "scale"):
+                if prop in arrow_column:
+                    column[prop] = arrow_column[prop]  # type: ignore[literal-required]
+            if existing_column:
+                column = utils.merge_columns(copy(existing_column), column)
+            new_columns[col_name] = column
+        if new_columns:
+            partial_table: TPartialTableSchema = copy(table)
+            partial_table["columns"] = new_columns
+            schema.update_schema(partial_table)
+            schema_update[table_name] = [partial_table]
+        # cast to the types in schema so all files of the table have the same arrow schema
+        columns = schema.get_table_columns(table_name)
+        caps = Container()[DestinationCapabilitiesContext]
+        try:
+            item = cast_to_arrow_schema(item, columns_to_arrow_schema(columns, caps))
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError):
+            # data type of an existing column could not be changed
+            if not coerced_columns:
+                raise
+            col_name, from_type, to_type = coerced_columns[0]
+            raise CannotCoerceColumnException(table_name, col_name, from_type, to_type, None)
+        load_storage.write_data_item(load_id, schema.name, table_name, item, columns)
+        signals.raise_if_signalled()
+        return schema_update, item.num_rows, {table_name: item.num_rows}
+
+    @staticmethod
+    def _w_normalize_chunk(
+        load_storage: LoadStorage,
+        schema: Schema,
+        load_id: str,
+        root_table_name: str,
+        items: List[TDataItem],
+        decode_pua: bool = True
+    ) -> Tuple[TSchemaUpdate, int, TRowCount]:
         column_schemas: Dict[str, TTableSchemaColumns] = {}  # quick access to column schema for writers below
         schema_update: TSchemaUpdate = {}
         schema_name = schema.name
@@ -141,8 +327,10 @@ class Normalize(Runnable[ProcessPool]):
                 # do not process empty rows
                 if row:
                     # decode pua types
-                    for k, v in row.items():
-                        row[k] = custom_pua_decode(v)  # type: ignore
+                    if decode_pua:
+                        for k, v in row.items():
+                            if isinstance(v, str):
+                                row[k] = custom_pua_decode(v)  # type: ignore
                     # coerce row of values into schema table, generating partial table with new columns if any
                     row, partial_table = schema.coerce_row(table_name, parent_table, row)
                     # theres a new table or new columns in existing table
@@ -192,58 +380,125 @@ class Normalize(Runnable[ProcessPool]):
             l_idx = idx + 1
         return chunk_files
 
+    @staticmethod
+    def group_worker_files_by_size(
+        files: Sequence[str],
+        sizes: Sequence[int],
+        no_groups: int,
+        file_part_min_bytes: int = None,
+        splittable: Sequence[bool] = None
+    ) -> List[List[ExtractedFilePart]]:
+        """Splits `files` into at most `no_groups` groups with similar total size. Files larger than `file_part_min_bytes` are split into
+        parts so several workers may process them. Parts are not smaller than `file_part_min_bytes` and there are no more parts than groups.
+        If `splittable` is provided, only files marked with True are split.
+        """
+        if not files:
+            return []
+        # bytes each group should get in perfect balance
+        group_size = sum(sizes) / no_groups
+        parts: List[Tuple[int, ExtractedFilePart]] = []
+        for file_no, (file, size) in enumerate(zip(files, sizes)):
+            parts_count = 1
+            if file_part_min_bytes and size > file_part_min_bytes and (splittable is None or splittable[file_no]):
+                parts_count = min(math.ceil(size / max(group_size, file_part_min_bytes)), no_groups)
+            parts.extend((size // parts_count, ExtractedFilePart(file, part_no, parts_count)) for part_no in range(parts_count))
+        # assign largest parts first, each to the group with the least bytes
+        parts.sort(key=lambda p: (-p[0], p[1]))
+        groups: List[List[ExtractedFilePart]] = [[] for _ in range(min(no_groups, len(parts)))]
+        groups_heap = [(0, idx) for idx in range(len(groups))]
+        for size, part in parts:
+            group_bytes, idx = heapq.heappop(groups_heap)
+            groups[idx].append(part)
+            heapq.heappush(groups_heap, (group_bytes + size, idx))
+        # process files in each group in order so the same tables are next to each other
+        for group in groups:
+            group.sort()
+        return groups
+
     def map_parallel(self, schema: Schema, load_id: str, files: Sequence[str]) -> TMapFuncRV:
-        workers = self.pool._processes  # type: ignore
-        chunk_files = self.group_worker_files(files, workers)
-        schema_dict: TStoredSchema = schema.to_dict()
-        config_tuple = (self.normalize_storage.config, self.load_storage.config, self.config.destination_capabilities, schema_dict)
-        param_chunk = [[*config_tuple, load_id, files] for files in chunk_files]
-        tasks: List[Tuple[AsyncResult[TWorkerRV], List[Any]]] = []
+        workers: int = self.pool._processes  # type: ignore
+        # balance by the on-disk size of the extracted files
+        full_paths = [self.normalize_storage.storage.make_full_path(file) for file in files]
+        sizes = [os.path.getsize(path) for path in full_paths]
+        # gzip files cannot be seeked without decompressing everything before the part so they are never split
+        splittable = [NormalizeStorage.is_arrow_file(file) or not FileStorage.is_gzipped(path) for file, path in zip(files, full_paths)]
+        chunk_files = self.group_worker_files_by_size(
+            files, sizes, workers * self.config.chunks_per_worker, self.config.file_part_min_bytes, splittable
+        )
+        # create more chunks than workers so free workers pick up the remaining chunks
+        pending_chunks: Deque[Sequence[ExtractedFilePart]] = deque(chunk_files)
+        # workers report results and exceptions via callbacks
+        completed: "Queue[Tuple[List[Any], bool, Any]]" = Queue()
+        running_count = 0
         row_counts: TRowCount = {}
 
         # return stats
         schema_updates: List[TSchemaUpdate] = []
+        # schema is sent to the workers as a snapshot file and schema updates accepted after it was taken
+        # snapshots are written to a temp folder so they never end up in a load package, even if normalize crashes
+        snapshots_dir = tempfile.mkdtemp(prefix="dlt_schema_snapshots_")
+        snapshot: SchemaSnapshot = None
+
+        def _take_snapshot() -> SchemaSnapshot:
+            # each snapshot goes to a new file, tasks with previous snapshots may still be waiting for a worker
+            snapshot_id = uniq_id()
+            snapshot_path = os.path.join(snapshots_dir, Normalize.SCHEMA_SNAPSHOT_FILE_NAME % snapshot_id)
+            version_hash = schema.version_hash
+            with open(snapshot_path, "wb") as f:
+                pickle.dump(schema, f, pickle.HIGHEST_PROTOCOL)
+            return SchemaSnapshot(schema.name, snapshot_id, snapshot_path, [], version_hash)
+
+        def _submit_chunk(chunk_files: Sequence[ExtractedFilePart]) -> None:
+            # chunk is normalized against the most recent schema so fewer schema updates conflict
+            chunk_snapshot = snapshot._replace(deltas=list(snapshot.deltas))
+            params = [self.normalize_storage.config, self.load_storage.config, self.config.destination_capabilities, chunk_snapshot, load_id, chunk_files]
+            self.pool.apply_async(
+                Normalize.w_normalize_files,
+                params,
+                callback=lambda result: completed.put((params, True, result)),
+                error_callback=lambda ex: completed.put((params, False, ex))
+            )
 
-        # push all tasks to queue
-        for params in param_chunk:
-            pending: AsyncResult[TWorkerRV] = self.pool.apply_async(Normalize.w_normalize_files, params)
-            tasks.append((pending, params))
-
-        while len(tasks) > 0:
-            sleep(0.3)
-            # operate on copy of the list
-            for task in list(tasks):
-                pending, params = task
-                if pending.ready():
-                    if pending.successful():
-                        result: TWorkerRV = pending.get()
-                        try:
-                            # gather schema from all manifests, validate consistency and combine
-                            self.update_schema(schema, result[0])
-                            schema_updates.extend(result[0])
-                            # update metrics
-                            self.collector.update("Files", len(result[2]))
-                            self.collector.update("Items", result[1])
-                            # merge row counts
-                            merge_row_count(row_counts, result[3])
-                        except CannotCoerceColumnException as exc:
-                            # schema conflicts resulting from parallel executing
-                            logger.warning(f"Parallel schema update conflict, retrying task ({str(exc)}")
-                            # delete all files produced by the task
-                            for file in result[2]:
-                                os.remove(file)
-                            # schedule the task again
-                            schema_dict = schema.to_dict()
-                            # TODO: it's time for a named tuple
-                            params[3] = schema_dict
-                            retry_pending: AsyncResult[TWorkerRV] = self.pool.apply_async(Normalize.w_normalize_files, params)
-                            tasks.append((retry_pending, params))
-                        # remove finished tasks
-                        tasks.remove(task)
-                    else:
-                        # raise the exception
-                        pending.get()
-                        raise AssertionError("unreachable code: pending.get must raise")
+        try:
+            snapshot = _take_snapshot()
+            while pending_chunks or running_count > 0:
+                # keep all workers busy
+                while pending_chunks and running_count < workers:
+                    _submit_chunk(pending_chunks.popleft())
+                    running_count += 1
+                try:
+                    params, successful, result = completed.get(timeout=1.0)
+                except Empty:
+                    signals.raise_if_signalled()
+                    continue
+                running_count -= 1
+                if not successful:
+                    raise result
+                try:
+                    # gather schema from all manifests, validate consistency and combine
+                    self.update_schema(schema, result[0])
+                    schema_updates.extend(result[0])
+                    # send accepted updates to the workers with the next tasks
+                    snapshot.deltas.extend(update for update in result[0] if update)
+                    if len(snapshot.deltas) > Normalize.SCHEMA_SNAPSHOT_MAX_DELTAS:
+                        snapshot = _take_snapshot()
+                    # update metrics
+                    self.collector.update("Files", len(result[2]))
+                    self.collector.update("Items", result[1])
+                    # merge row counts
+                    merge_row_count(row_counts, result[3])
+                except CannotCoerceColumnException as exc:
+                    # schema conflicts resulting from parallel executing
+                    logger.warning(f"Parallel schema update conflict, retrying task ({str(exc)}")
+                    # delete all files produced by the task
+                    for file in result[2]:
+                        os.remove(file)
+                    # updates could be partially applied to the schema so workers must get a new snapshot
+                    snapshot = _take_snapshot()
+                    # schedule the chunk again, it will get the current schema
+                    pending_chunks.appendleft(params[5])
+        finally:
+            shutil.rmtree(snapshots_dir, ignore_errors=True)
 
         return schema_updates, row_counts
 
@@ -254,7 +509,7 @@ class Normalize(Runnable[ProcessPool]):
             self.config.destination_capabilities,
             schema.to_dict(),
             load_id,
-            files,
+            [ExtractedFilePart(file) for file in files],
         )
         self.update_schema(schema, result[0])
         self.collector.update("Files", len(result[2]))
@@ -271,6 +526,10 @@ class Normalize(Runnable[ProcessPool]):
             logger.info(f"Saving schema {schema_name} with version {schema.version}, writing manifest files")
             # schema is updated, save it to schema volume
             self.schema_storage.save_schema(schema)
+        # merge small job files so fewer load jobs are created
+        if self.config.merge_job_files_max_bytes:
+            removed_count = self.load_storage.merge_temp_job_files(load_id, self.config.merge_job_files_max_bytes)
+            logger.info(f"Merged job files in {load_id}, {removed_count} job files less")
         # save schema to temp load folder
         self.load_storage.save_temp_schema(schema, load_id)
         # save schema updates even if empty
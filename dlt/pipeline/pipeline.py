@@ -1,6 +1,7 @@
 import contextlib
 import os
 import datetime  # noqa: 251
+from copy import deepcopy
 from contextlib import contextmanager
 from functools import wraps
 from collections.abc import Sequence as C_Sequence
@@ -18,7 +19,7 @@ from dlt.common.exceptions import (DestinationLoadingViaStagingNotSupported, Des
                                    MissingDependencyException, DestinationUndefinedEntity, DestinationIncompatibleLoaderFileFormatException)
 from dlt.common.normalizers import explicit_normalizers, import_normalizers
 from dlt.common.runtime import signals, initialize_runtime
-from dlt.common.schema.typing import TColumnNames, TColumnSchema, TSchemaTables, TWriteDisposition, TAnySchemaColumns
+from dlt.common.schema.typing import TColumnNames, TColumnSchema, TSchemaTables, TSchemaUpdate, TWriteDisposition, TAnySchemaColumns
 from dlt.common.storages.load_storage import LoadJobInfo, LoadPackageInfo
 from dlt.common.typing import TFun, TSecretValue, is_optional_type
 from dlt.common.runners import pool_runner as runner
@@ -50,7 +51,7 @@ from dlt.pipeline.trace import PipelineTrace, PipelineStepTrace, load_trace, mer
 from dlt.pipeline.typing import TPipelineStep
 from dlt.pipeline.state_sync import STATE_ENGINE_VERSION, load_state_from_destination, merge_state_if_changed, migrate_state, state_resource, json_encode_state, json_decode_state
 
-from dlt.common.schema.utils import normalize_schema_name
+from dlt.common.schema.utils import get_write_disposition, normalize_schema_name
 
 
 def with_state_sync(may_extract_state: bool = False) -> Callable[[TFun], TFun]:
@@ -101,8 +102,8 @@ def with_runtime_trace(f: TFun) -> TFun:
             self._trace = trace = start_trace(cast(TPipelineStep, f.__name__), self)
 
         try:
-            # start a trace step for wrapped function
-            if trace:
+            # start a trace step for wrapped function, steps of micro batches are reported by `run`
+            if trace and not self._is_loading_micro_batch:
                 trace_step = start_trace_step(trace, cast(TPipelineStep, f.__name__), self)
 
             step_info = f(self, *args, **kwargs)
@@ -213,6 +214,9 @@ class Pipeline(SupportsPipeline):
         self._trace: PipelineTrace = None
         self._last_trace: PipelineTrace = None
         self._state_restored: bool = False
+        self._micro_batch_load_args: Tuple[TLoaderFileFormat, TDestinationReferenceArg, str, Any] = None
+        self._micro_batch_load_infos: List[LoadInfo] = []
+        self._is_loading_micro_batch: bool = False
 
         initialize_runtime(self.runtime_config)
         # initialize pipeline working dir
@@ -287,6 +291,9 @@ class Pipeline(SupportsPipeline):
                 for extract_id in extract_ids:
                     storage.commit_extract_files(extract_id)
                 return ExtractInfo(describe_extract_data(data))
+        except PipelineStepFailed:
+            # normalize or load of a micro batch failed
+            raise
         except Exception as exc:
             # TODO: provide metrics from extractor
             raise PipelineStepFailed(self, "extract", exc, ExtractInfo(describe_extract_data(data))) from exc
@@ -437,7 +444,7 @@ class Pipeline(SupportsPipeline):
 
             schema (Schema, optional): An explicit `Schema` object in which all table schemas will be grouped. By default `dlt` takes the schema from the source (if passed in `data` argument) or creates a default one itself.
 
-            loader_file_format (Literal["jsonl", "insert_values", "parquet"], optional). The file format the loader will use to create the load package. Not all file_formats are compatible with all destinations. Defaults to the preferred file format of the selected destination.
+            loader_file_format (Literal["jsonl", "insert_values", "csv", "parquet"], optional). The file format the loader will use to create the load package. Not all file_formats are compatible with all destinations. Defaults to the preferred file format of the selected destination.
 
         Raises:
             PipelineStepFailed when a problem happened during `extract`, `normalize` or `load` steps.
@@ -465,9 +472,17 @@ class Pipeline(SupportsPipeline):
 
         # extract from the source
         if data is not None:
-            self.extract(data, table_name=table_name, write_disposition=write_disposition, columns=columns, primary_key=primary_key, schema=schema)
-            self.normalize(loader_file_format=loader_file_format)
-            return self.load(destination, dataset_name, credentials=credentials)
+            # micro batches of extracted data may be normalized and loaded while the extraction is still running
+            self._micro_batch_load_args = (loader_file_format, destination, dataset_name, credentials)
+            self._micro_batch_load_infos = []
+            try:
+                self.extract(data, table_name=table_name, write_disposition=write_disposition, columns=columns, primary_key=primary_key, schema=schema)
+                self._micro_batch_load_args = None
+                self.normalize(loader_file_format=loader_file_format)
+                return self.load(destination, dataset_name, credentials=credentials)
+            finally:
+                self._micro_batch_load_args = None
+                self._micro_batch_load_infos = []
         else:
             return None
 
@@ -854,8 +869,16 @@ class Pipeline(SupportsPipeline):
         source_schema = source.schema
         source_schema.update_normalizers()
 
-        extract_id = extract_with_schema(storage, source, source_schema, self.collector, max_parallel_items, workers)
+        on_micro_batch: Callable[[str, TSchemaUpdate], bool] = None
+        if self._micro_batch_load_args is not None:
+            def on_micro_batch(extract_id: str, dynamic_tables: TSchemaUpdate) -> bool:
+                return self._load_micro_batch(storage, source_schema, extract_id, dynamic_tables)
 
+        extract_id = extract_with_schema(storage, source, source_schema, self.collector, max_parallel_items, workers, on_micro_batch)
+        self._update_pipeline_schema(source_schema)
+        return extract_id
+
+    def _update_pipeline_schema(self, source_schema: Schema) -> None:
         # if source schema does not exist in the pipeline
         if source_schema.name not in self._schema_storage:
             # save schema into the pipeline
@@ -878,7 +901,54 @@ class Pipeline(SupportsPipeline):
                 pipeline_schema.normalize_table_identifiers(table)
             )
 
-        return extract_id
+    def _load_micro_batch(self, storage: ExtractorStorage, source_schema: Schema, extract_id: str, dynamic_tables: TSchemaUpdate) -> bool:
+        """Commits the files extracted so far, normalizes and loads them together with the current pipeline state. Called by `run` while the
+        source is being extracted. Returns False if tables with replace write disposition were extracted, those must be loaded in a single package.
+        """
+        # apply table hints collected so far, extract_with_schema will apply them again when extraction ends
+        table_names: List[str] = []
+        for partials in dynamic_tables.values():
+            for partial in partials:
+                partial = source_schema.normalize_table_identifiers(partial)
+                source_schema.update_schema(partial)
+                table_names.append(partial["name"])
+        if any(get_write_disposition(source_schema.tables, table_name) == "replace" for table_name in table_names):
+            logger.info(f"Source {source_schema.name} extracts tables with replace write disposition, micro batches will not be loaded")
+            return False
+
+        storage.close_writers(extract_id)
+        storage.commit_extract_files(extract_id, keep_extract_folder=True)
+        self._update_pipeline_schema(source_schema)
+        self._extract_micro_batch_state()
+
+        loader_file_format, destination, dataset_name, credentials = self._micro_batch_load_args
+        self._is_loading_micro_batch = True
+        try:
+            self.normalize(loader_file_format=loader_file_format)
+            self._micro_batch_load_infos.append(self.load(destination, dataset_name, credentials=credentials))
+        finally:
+            self._is_loading_micro_batch = False
+        return True
+
+    def _extract_micro_batch_state(self) -> None:
+        """Extracts and saves the state being modified by the extraction so each micro batch is loaded together with the matching state.
+        The state matches the data because `extract` disables micro batches for transformers and parallel resources and when async items are in flight.
+        """
+        state = self._container[StateInjectableContext].state
+        self._props_to_state(state)
+        current_state = deepcopy(state)
+        current_state.pop("_local")
+        backup_state = self._get_state()
+        local_state = backup_state.pop("_local")
+        merged_state = merge_state_if_changed(backup_state, current_state)
+        if merged_state:
+            if self.config.restore_from_destination:
+                self._extract_state(merged_state)
+                local_state["_last_extracted_at"] = state["_local"]["_last_extracted_at"] = pendulum.now()
+            # keep the version of the state that is still being modified so it is not bumped again
+            state["_state_version"] = merged_state["_state_version"]
+            merged_state["_local"] = local_state
+            self._save_state(merged_state)
 
     def _get_destination_client_initial_config(self, destination: DestinationReference = None, credentials: Any = None, as_staging: bool = False) -> DestinationClientConfiguration:
         destination = destination or self.destination
@@ -1098,7 +1168,15 @@ class Pipeline(SupportsPipeline):
         started_at: datetime.datetime = None
         if self._trace:
             started_at = self._trace.started_at
-        return load.get_load_info(self, started_at)
+        info = load.get_load_info(self, started_at)
+        # packages loaded in micro batches are reported together with the last package
+        if self._micro_batch_load_infos and not self._is_loading_micro_batch:
+            info = info._replace(
+                loads_ids=[load_id for i in self._micro_batch_load_infos for load_id in i.loads_ids] + info.loads_ids,
+                load_packages=[package for i in self._micro_batch_load_infos for package in i.load_packages] + info.load_packages,
+                first_run=self._micro_batch_load_infos[0].first_run
+            )
+        return info
 
     def _get_state(self) -> TPipelineState:
         try:
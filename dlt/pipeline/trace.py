@@ -185,7 +185,8 @@ def end_trace_step(trace: PipelineTrace, step: PipelineStepTrace, pipeline: Supp
     # saves runtime trace of the pipeline
     if isinstance(step_info, PipelineStepFailed):
         step_exception = str(step_info)
-        step_info = step_info.step_info
+        # a micro batch normalized or loaded during extract fails with the info of its own step
+        step_info = step_info.step_info if step_info.step == step.step else None
     elif isinstance(step_info, Exception):
         step_exception = str(step_info)
         if step_info.__context__:
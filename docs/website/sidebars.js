@@ -74,6 +74,7 @@ const sidebars = {
             'dlt-ecosystem/file-formats/jsonl',
             'dlt-ecosystem/file-formats/parquet',
             'dlt-ecosystem/file-formats/insert-format',
+            'dlt-ecosystem/file-formats/csv',
           ]
         },
         {
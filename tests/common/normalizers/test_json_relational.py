@@ -7,6 +7,7 @@ from dlt.common.utils import digest128, uniq_id
 from dlt.common.schema import Schema
 from dlt.common.schema.utils import new_table
 
+from dlt.common.normalizers.json import relational
 from dlt.common.normalizers.json.relational import RelationalNormalizerConfigPropagation, DataItemNormalizer as RelationalNormalizer, DLT_ID_LENGTH_BYTES, TDataItemRow
 # _flatten, _get_child_row_hash, _normalize_row, normalize_data_item,
 
@@ -90,6 +91,40 @@ def test_preserve_complex_value_with_hint(norm: RelationalNormalizer) -> None:
     assert "value__complex" not in flattened_row
 
 
+def test_flatten_paths_cache_invalidated_on_schema_change(norm: RelationalNormalizer) -> None:
+    row = {"value": {"complex": True}, "other": 1}
+    flattened_row, _ = norm._flatten("with_complex", row, 0)  # type: ignore[arg-type]
+    assert flattened_row["value__complex"] is True  # type: ignore[typeddict-item]
+    assert len(norm._flatten_paths["with_complex"]) == 3
+    norm._flatten("other_table", row, 0)  # type: ignore[arg-type]
+    # cached paths are used
+    cached_paths = norm._flatten_paths["with_complex"]
+    norm._flatten("with_complex", row, 0)  # type: ignore[arg-type]
+    assert norm._flatten_paths["with_complex"] is cached_paths
+
+    # column becomes complex, only paths of the changed table are dropped
+    norm.schema.update_schema(new_table("with_complex", columns=[{"name": "value", "data_type": "complex"}]))
+    assert "with_complex" not in norm._flatten_paths
+    assert len(norm._flatten_paths["other_table"]) == 3
+    flattened_row, _ = norm._flatten("with_complex", row, 0)  # type: ignore[arg-type]
+    assert flattened_row["value"] == {"complex": True}  # type: ignore[typeddict-item]
+
+    # settings change drops the whole cache
+    norm.schema._compile_settings()
+    assert norm._flatten_paths == {}
+
+
+def test_flatten_paths_cache_evicts_least_recently_used(norm: RelationalNormalizer, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(relational, "FLATTEN_PATHS_CACHE_SIZE", 3)
+    norm._flatten("table", {"a": 1, "b": 2, "c": 3}, 0)  # type: ignore[arg-type]
+    # "a" is used again so "b" is evicted when "d" is added
+    norm._flatten("table", {"a": 1, "d": 4}, 0)  # type: ignore[arg-type]
+    assert [path_key[1] for path_key in norm._flatten_paths["table"]] == ["c", "a", "d"]
+    flattened_row, _ = norm._flatten("table", {"b": {"x": 1}}, 0)  # type: ignore[arg-type]
+    assert flattened_row == {"b__x": 1}
+    assert len(norm._flatten_paths["table"]) == 3
+
+
 def test_child_table_linking(norm: RelationalNormalizer) -> None:
     row = {
         "f": [{
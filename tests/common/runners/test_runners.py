@@ -139,3 +139,58 @@ def test_pool_runner_process_methods(method) -> None:
     )
     assert runs_count == 1
     assert [v[0] for v in r.rv] == list(range(4))
+
+
+@pytest.mark.parametrize('pool_type', ["thread", "process"])
+def test_persistent_pool_reused(pool_type: TPoolType) -> None:
+    pools = []
+
+    def _remember_pool(pool) -> runner.TRunMetrics:
+        pools.append(pool)
+        return runner.TRunMetrics(True, 0)
+
+    config = ThreadPoolConfiguration(pool_type=pool_type, workers=2, persistent_pool=True)
+    try:
+        runner.run_pool(config, _remember_pool)
+        runner.run_pool(config, _remember_pool)
+        assert pools[0] is pools[1]
+        assert pools[0]._state == "RUN"
+        # another pool is used for a different number of workers, the first one is kept
+        runner.run_pool(ThreadPoolConfiguration(pool_type=pool_type, workers=3, persistent_pool=True), _remember_pool)
+        assert pools[2] is not pools[1]
+        assert pools[2]._processes == 3
+        assert pools[1]._state == "RUN"
+        # pool is not kept after failed run
+        with pytest.raises(DltException):
+            runner.run_pool(ThreadPoolConfiguration(pool_type=pool_type, workers=3, persistent_pool=True), failing_run)
+        assert pools[2]._state != "RUN"
+        runner.run_pool(ThreadPoolConfiguration(pool_type=pool_type, workers=3, persistent_pool=True), _remember_pool)
+        assert pools[3] is not pools[2]
+        # non persistent pool is created for each run
+        runner.run_pool(ThreadPoolConfiguration(pool_type=pool_type, workers=3), _remember_pool)
+        assert pools[4] is not pools[3]
+        assert pools[4]._state != "RUN"
+    finally:
+        runner.close_persistent_pools()
+    assert pools[1]._state != "RUN"
+    assert pools[3]._state != "RUN"
+
+
+def test_borrowed_persistent_pool_not_terminated() -> None:
+    config = ThreadPoolConfiguration(pool_type="thread", workers=2, persistent_pool=True)
+    pool = runner.borrow_persistent_pool(config)
+    try:
+        # failed run discards the pool that is still used by another run
+        with pytest.raises(DltException):
+            runner.run_pool(config, failing_run)
+        assert pool._state == "RUN"
+        assert pool.apply(lambda: 1) == 1
+        new_pool = runner.borrow_persistent_pool(config)
+        assert new_pool is not pool
+        runner.return_persistent_pool(new_pool)
+        runner.close_persistent_pools()
+        assert new_pool._state != "RUN"
+    finally:
+        runner.return_persistent_pool(pool)
+    # terminated when the last user returns it
+    assert pool._state != "RUN"
@@ -174,6 +174,64 @@ def test_coerce_row_iso_timestamp(schema: Schema) -> None:
     assert new_columns[0]["name"] == "timestamp__v_text"
 
 
+def test_coerce_row_with_plan(schema: Schema) -> None:
+    row = {"id": 1, "name": "a", "value": "1.5", "ts": pendulum.parse("2021-01-01T00:00:00Z"), "note": None}
+    new_row, new_table = schema.coerce_row("event_user", None, row)
+    schema.update_schema(new_table)
+    # no plans after schema change
+    assert "event_user" not in schema._row_plans
+    new_row_2, new_table = schema.coerce_row("event_user", None, row)
+    assert new_table is None
+    assert new_row_2 == new_row
+    # plan created for the row shape
+    assert len(schema._row_plans["event_user"]) == 1
+    plan = next(iter(schema._row_plans["event_user"].values()))
+    assert plan[0] == ("id", schema.get_table_columns("event_user")["id"], "bigint", None)
+    assert plan[4] == ("note", None, None, None)
+
+    # coerced with plan
+    new_row_3, new_table = schema.coerce_row("event_user", None, {"id": 2, "name": "b", "value": "3.0", "ts": pendulum.parse("2022-01-01T00:00:00Z"), "note": None})
+    assert new_table is None
+    assert new_row_3 == {"id": 2, "name": "b", "value": "3.0", "ts": pendulum.parse("2022-01-01T00:00:00Z")}
+    assert len(schema._row_plans["event_user"]) == 1
+
+    # value that cannot be coerced falls back to full coercion and creates variant
+    schema.coerce_row("event_user", None, {"id": 1, "name": "a", "value": 1.5, "ts": "2022-01-01T00:00:00Z", "note": None})
+    _, new_table = schema.coerce_row("event_user", None, {"id": 1, "name": "a", "value": 1.5, "ts": "not a date", "note": None})
+    assert "ts__v_text" in new_table["columns"]
+    schema.update_schema(new_table)
+    assert "event_user" not in schema._row_plans
+
+    # not null hint set on existing column invalidates the plan
+    schema.coerce_row("event_user", None, row)
+    schema.coerce_row("event_user", None, row)
+    assert "event_user" in schema._row_plans
+    schema.update_schema(utils.new_table("event_user", columns=[utils.new_column("note", "text", nullable=False)]))
+    with pytest.raises(CannotCoerceNullException):
+        schema.coerce_row("event_user", None, row)
+
+
+def test_coerce_row_with_plan_columns_modified_in_place(schema: Schema) -> None:
+    row = {"id": 1, "value": "1.5", "note": None}
+    _, new_table = schema.coerce_row("event_user", None, row)
+    schema.update_schema(new_table)
+    schema.update_schema(utils.new_table("event_user", columns=[utils.new_column("note", "text")]))
+    assert schema.coerce_row("event_user", None, row) == ({"id": 1, "value": "1.5"}, None)
+    assert "event_user" in schema._row_plans
+
+    # data type changed in place
+    schema.get_table_columns("event_user")["value"]["data_type"] = "double"
+    assert schema.coerce_row("event_user", None, row) == ({"id": 1, "value": 1.5}, None)
+    assert schema.coerce_row("event_user", None, row) == ({"id": 1, "value": 1.5}, None)
+    # column replaced in place
+    schema.tables["event_user"]["columns"]["id"] = utils.new_column("id", "text")
+    assert schema.coerce_row("event_user", None, row) == ({"id": "1", "value": 1.5}, None)
+    # column made not nullable in place
+    schema.tables["event_user"]["columns"]["note"]["nullable"] = False
+    with pytest.raises(CannotCoerceNullException):
+        schema.coerce_row("event_user", None, row)
+
+
 def test_shorten_variant_column(schema: Schema) -> None:
     schema.naming.max_length = 9
     _add_preferred_types(schema)
@@ -41,6 +41,32 @@ def test_content_hash() -> None:
     assert utils.generate_version_hash(eth_v4) != hash2
 
 
+def test_version_hash_after_table_modified() -> None:
+    schema = Schema.from_dict(load_yml_case("schemas/eth/ethereum_schema_v4"))  # type: ignore[arg-type]
+    version = schema.version
+    # tables modified via update_schema
+    schema.update_schema(utils.new_table("blocks", columns=[{"name": "new_col", "data_type": "text"}]))
+    assert schema.version == version + 1
+    assert schema.version_hash == utils.generate_version_hash(schema.to_dict())
+    # tables modified in place after access
+    version_hash = schema.version_hash
+    schema.get_table("blocks")["write_disposition"] = "replace"
+    assert schema.version_hash != version_hash
+    version_hash = schema.version_hash
+    schema.get_table_columns("blocks")["new_col"]["nullable"] = False
+    assert schema.version_hash != version_hash
+    version_hash = schema.version_hash
+    schema.tables["blocks"]["description"] = "blocks table"
+    assert schema.version_hash != version_hash
+    assert schema.version_hash == utils.generate_version_hash(schema.to_dict())
+    # table reference kept from before to_dict is modified later
+    table = schema.tables["blocks"]
+    schema.to_dict()
+    version_hash = schema.version_hash
+    table["columns"]["new_col"]["data_type"] = "bigint"
+    assert schema.version_hash != version_hash
+
+
 def test_bump_version_no_stored_hash() -> None:
     eth_v3: TStoredSchema = load_yml_case("schemas/eth/ethereum_schema_v3")
     assert "version_hash" not in eth_v3
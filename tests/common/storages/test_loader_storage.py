@@ -1,13 +1,16 @@
 import os
+import gzip
 import pytest
 from pathlib import Path
-from typing import Sequence, Tuple
+from typing import List, Sequence, Tuple
 
 from dlt.common import sleep, json, pendulum
-from dlt.common.schema import Schema, TSchemaTables
+from dlt.common.data_writers import DataWriter
+from dlt.common.destination import DestinationCapabilitiesContext
+from dlt.common.schema import Schema, TSchemaTables, TTableSchemaColumns
 from dlt.common.storages.load_storage import LoadPackageInfo, LoadStorage, ParsedLoadJobFileName, TJobState
 from dlt.common.configuration import resolve_configuration
-from dlt.common.storages import LoadStorageConfiguration
+from dlt.common.storages import FileStorage, LoadStorageConfiguration
 from dlt.common.storages.exceptions import LoadPackageNotFound, NoMigrationPathException
 from dlt.common.typing import StrAny
 from dlt.common.utils import uniq_id
@@ -237,6 +240,86 @@ def test_unknown_migration_path() -> None:
         LoadStorage(False, "jsonl", LoadStorage.ALL_SUPPORTED_FILE_FORMATS)
 
 
+@pytest.mark.parametrize("file_format,compression", [("jsonl", False), ("jsonl", True), ("insert_values", False), ("insert_values", True), ("csv", False), ("csv", True), ("parquet", False)])
+def test_merge_temp_job_files(storage: LoadStorage, file_format: str, compression: bool) -> None:
+    load_id = uniq_id()
+    storage.create_temp_load_package(load_id)
+    # an empty file followed by four files with two rows, fixed file ids keep this order when merging
+    files = [write_temp_job_file(storage, load_id, file_format, [], compression, file_id="a0000")]
+    files.extend(write_temp_job_file(storage, load_id, file_format, [{"id": i * 2, "value": "a"}, {"id": i * 2 + 1}], compression, file_id=f"b000{i}") for i in range(4))
+    sizes = [os.path.getsize(storage.storage.make_full_path(f)) for f in files]
+    # large files are not merged
+    assert storage.merge_temp_job_files(load_id, min(sizes)) == 0
+    # the empty file is merged first: with one file if it has a header, otherwise with two files
+    removed_count = storage.merge_temp_job_files(load_id, max(sizes) * 2)
+    assert removed_count == (3 if sizes[0] == 0 else 2)
+    merged_files = storage.storage.list_folder_files(os.path.join(load_id, LoadStorage.NEW_JOBS_FOLDER))
+    assert len(merged_files) == 5 - removed_count
+    assert all(LoadStorage.parse_job_file_name(f).table_name == "items" for f in merged_files)
+    assert sorted(id_ for f in merged_files for id_ in read_temp_job_file_ids(storage, f)) == list(range(8))
+    # merge all files into one
+    assert storage.merge_temp_job_files(load_id, sum(sizes) * 2) == len(merged_files) - 1
+    merged_files = storage.storage.list_folder_files(os.path.join(load_id, LoadStorage.NEW_JOBS_FOLDER))
+    assert len(merged_files) == 1
+    assert sorted(read_temp_job_file_ids(storage, merged_files[0])) == list(range(8))
+    assert FileStorage.is_gzipped(storage.storage.make_full_path(merged_files[0])) is compression
+
+
+def test_merge_temp_job_files_different_columns(storage: LoadStorage) -> None:
+    load_id = uniq_id()
+    storage.create_temp_load_package(load_id)
+    write_temp_job_file(storage, load_id, "insert_values", [{"id": 1, "value": "a"}])
+    write_temp_job_file(storage, load_id, "insert_values", [{"id": 2}], columns=["id"])
+    write_temp_job_file(storage, load_id, "csv", [{"id": 1, "value": "a"}])
+    write_temp_job_file(storage, load_id, "csv", [{"id": 2}], columns=["id"])
+    write_temp_job_file(storage, load_id, "parquet", [{"id": 1, "value": "a"}])
+    write_temp_job_file(storage, load_id, "parquet", [{"id": 2}], columns=["id"])
+    # files with different columns or arrow schema are not merged
+    assert storage.merge_temp_job_files(load_id, 1024 * 1024) == 0
+
+
+def write_temp_job_file(storage: LoadStorage, load_id: str, file_format: str, rows: Sequence[StrAny], compression: bool = False, columns: Sequence[str] = ("id", "value"), file_id: str = None) -> str:
+    table: TTableSchemaColumns = {
+        "id": {"name": "id", "data_type": "bigint", "nullable": False},
+        "value": {"name": "value", "data_type": "text", "nullable": True}
+    }
+    table = {k: v for k, v in table.items() if k in columns}
+    file_name = os.path.join(load_id, LoadStorage.NEW_JOBS_FOLDER, f"items.{file_id or uniq_id(5)}.0.{file_format}")
+    format_spec = DataWriter.data_format_from_file_format(file_format)  # type: ignore[arg-type]
+    mode = "wb" if format_spec.is_binary_format else "wt"
+    open_f = gzip.open if compression else open
+    with open_f(storage.storage.make_full_path(file_name), mode) as f:  # type: ignore[operator]
+        writer = DataWriter.from_file_format(file_format, f, DestinationCapabilitiesContext.generic_capabilities())  # type: ignore[arg-type]
+        if rows:
+            writer.write_all(table, rows)
+        else:
+            writer.write_header(table)
+            writer.write_footer()
+    return file_name
+
+
+def read_temp_job_file_ids(storage: LoadStorage, file_name: str) -> List[int]:
+    file_path = storage.storage.make_full_path(file_name)
+    if file_name.endswith(".parquet"):
+        from dlt.common.libs.pyarrow import pyarrow
+
+        return pyarrow.parquet.read_table(file_path).column("id").to_pylist()  # type: ignore[no-any-return]
+    with FileStorage.open_zipsafe_ro(file_path, "r", encoding="utf-8") as f:
+        if file_name.endswith(".jsonl"):
+            return [json.loads(line)["id"] for line in f]
+        if file_name.endswith(".csv"):
+            # single header line followed by rows
+            assert f.readline() == '"id","value"\n'
+            return [int(line.split(",")[0]) for line in f]
+        # single insert statement with rows separated by ",\n"
+        header, values_mark, values = f.readline(), f.readline(), f.read()
+        assert header.startswith("INSERT INTO {}(") and values_mark == "VALUES\n"
+        if not values:
+            return []
+        assert values.endswith(";") and values.count(";") == 1
+        return [int(row.split(",")[0][1:]) for row in values[:-1].split(",\n")]
+
+
 def start_loading_file(s: LoadStorage, content: Sequence[StrAny]) -> Tuple[str, str]:
     load_id = uniq_id()
     s.create_temp_load_package(load_id)
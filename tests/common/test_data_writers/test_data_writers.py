@@ -1,4 +1,5 @@
 import io
+import csv
 import pytest
 from typing import Iterator
 
@@ -6,8 +7,8 @@ from dlt.common import pendulum, json
 from dlt.common.typing import AnyFun
 # from dlt.destinations.postgres import capabilities
 from dlt.destinations.redshift import capabilities as redshift_caps
-from dlt.common.data_writers.escape import escape_redshift_identifier, escape_bigquery_identifier, escape_redshift_literal, escape_postgres_literal, escape_duckdb_literal
-from dlt.common.data_writers.writers import DataWriter, InsertValuesWriter, JsonlWriter, ParquetDataWriter
+from dlt.common.data_writers.escape import escape_redshift_identifier, escape_bigquery_identifier, escape_redshift_literal, escape_postgres_literal, escape_duckdb_literal, escape_postgres_csv_value
+from dlt.common.data_writers.writers import DataWriter, InsertValuesWriter, JsonlWriter, ParquetDataWriter, CsvWriter
 
 from tests.common.utils import load_json_case, row_to_column_schemas
 
@@ -73,6 +74,33 @@ def test_date_insert_writer(insert_writer: _StringIOWriter) -> None:
     assert lines[2] == "('1974-08-11');"
 
 
+def test_csv_writer() -> None:
+    rows = load_json_case("weird_rows")
+    rows.append({"idx": 100, "str": "", "bytes": b"bytes", "date": pendulum.date(1974, 8, 11), "complex": {"a": "b,\"c\""}, "bool": True})
+    columns = row_to_column_schemas(rows[-1])
+    columns.update(row_to_column_schemas(rows[0]))
+    with io.StringIO() as f:
+        writer = CsvWriter(f)
+        writer.write_all(columns, rows)
+        content = f.getvalue()
+    lines = list(csv.reader(io.StringIO(content)))
+    assert lines[0] == list(columns.keys())
+    assert len(lines) == len(rows) + 1
+    for row, line in zip(rows, lines[1:]):
+        assert line[list(columns).index("str")] == (row.get("str") or "")
+    # missing values are NULL, empty string is quoted
+    assert content.split("\n")[-2] == '100,"",\\x6279746573,1974-08-11,"{""a"":""b,\\""c\\""""}",true'
+
+
+def test_csv_value_escape() -> None:
+    assert escape_postgres_csv_value(None) == ""
+    assert escape_postgres_csv_value("") == '""'
+    assert escape_postgres_csv_value('a "quoted",\n value') == '"a ""quoted"",\n value"'
+    assert escape_postgres_csv_value(False) == "false"
+    assert escape_postgres_csv_value(pendulum.from_timestamp(1658928602.575267)) == "2022-07-27T13:30:02.575267+00:00"
+    assert escape_postgres_csv_value(b"bytes") == "\\x6279746573"
+
+
 @pytest.mark.skip("not implemented")
 def test_unicode_insert_writer_postgres() -> None:
     # implements tests for the postgres encoding -> same cases as redshift
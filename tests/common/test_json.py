@@ -6,7 +6,8 @@ import pytest
 
 from dlt.common import json, Decimal, pendulum
 from dlt.common.arithmetics import numeric_default_context
-from dlt.common.json import _DECIMAL, _WEI, custom_pua_decode, _orjson, _simplejson, SupportsJson, _DATETIME
+from dlt.common.wei import Wei
+from dlt.common.json import _DECIMAL, _WEI, custom_pua_decode, custom_pua_encode, may_have_pua, _orjson, _simplejson, SupportsJson, _DATETIME
 
 from tests.utils import autouse_test_storage, TEST_STORAGE_ROOT
 from tests.cases import JSON_TYPED_DICT, JSON_TYPED_DICT_DECODED, JSON_TYPED_DICT_NESTED, JSON_TYPED_DICT_NESTED_DECODED
@@ -250,6 +251,33 @@ def test_json_typed_encode(json_impl: SupportsJson) -> None:
     assert d_d == JSON_TYPED_DICT_DECODED
 
 
+@pytest.mark.parametrize("json_impl", _JSON_IMPL)
+def test_may_have_pua(json_impl: SupportsJson) -> None:
+    assert may_have_pua(json_impl.typed_dumps(JSON_TYPED_DICT)) is True
+    assert may_have_pua(json_impl.typed_dumpb(JSON_TYPED_DICT)) is True
+    plain_doc = {"str": "string 🦆 \uF025 \uF02E", "int": 1, "list": ["a", 1.5, None]}
+    assert may_have_pua(json_impl.typed_dumps(plain_doc)) is False
+    assert may_have_pua(json_impl.typed_dumpb(plain_doc)) is False
+    # documents without markers are not decoded
+    assert json_impl.typed_loads(json_impl.typed_dumps(plain_doc)) == plain_doc
+    assert json_impl.typed_loadb(json_impl.typed_dumpb(plain_doc)) == plain_doc
+
+
+def test_custom_pua_encode_subclasses() -> None:
+    class _DateTime(pendulum.DateTime):
+        pass
+
+    dt = pendulum.now()
+    sub_dt = _DateTime(2023, 1, 1, tzinfo=pendulum.UTC)
+    # exact types and subclasses are encoded the same way
+    assert custom_pua_encode(dt) == _DATETIME + dt.isoformat()
+    assert custom_pua_encode(sub_dt) == _DATETIME + sub_dt.isoformat()
+    assert custom_pua_encode(Wei(1)) == _WEI + "1"
+    assert custom_pua_encode(Decimal("1.1")) == _DECIMAL + "1.1"
+    # characters outside of the PUA decoders range are not decoded
+    assert custom_pua_decode("\uF02Eabc") == "\uF02Eabc"
+
+
 def test_load_and_compare_all_impls() -> None:
     with open(json_case_path("rasa_event_bot_metadata"), "rb") as f:
         content_b = f.read()
@@ -1,7 +1,12 @@
+import asyncio
+import pytest
+from typing import List
+
 import dlt
 from dlt.common import json
+from dlt.common.schema import TSchemaUpdate
 from dlt.common.storages import NormalizeStorageConfiguration
-from dlt.extract.extract import ExtractorStorage, extract
+from dlt.extract.extract import ExtractorStorage, ThreadedItemWriter, extract
 from dlt.extract.source import DltResource, DltSource
 
 from tests.utils import clean_test_storage
@@ -72,3 +77,116 @@ def test_extract_select_tables() -> None:
 
     schema = expect_tables(table_name_with_lambda)
     assert "table_name_with_lambda" not in schema.tables
+
+
+@pytest.mark.parametrize("writer_threads", [1, 3])
+def test_extract_with_writer_threads(writer_threads: int) -> None:
+    clean_test_storage()
+
+    @dlt.resource(table_name=lambda i: f"table_{i % 5}")
+    def many_tables(_range):
+        for i in range(_range):
+            yield i
+
+    source = DltSource("threaded", "module", dlt.Schema("threaded"), [many_tables(100)])
+    storage = ExtractorStorage(NormalizeStorageConfiguration())
+    extract_id = storage.create_extract_id()
+    # use small queues to exercise the back pressure
+    schema_update = extract(extract_id, source, storage, writer_threads=writer_threads, writer_queue_size=2)
+    assert len(schema_update) == 5
+    storage.commit_extract_files(extract_id)
+    assert len(storage.list_files_to_normalize_sorted()) == 5
+    # items of each table are written in order
+    for t in range(5):
+        expect_extracted_file(storage, "threaded", f"table_{t}", json.dumps(list(range(t, 100, 5))))
+
+
+@pytest.mark.parametrize("writer_threads", [0, 2])
+def test_extract_micro_batches(writer_threads: int) -> None:
+    clean_test_storage()
+
+    @dlt.resource
+    def pages():
+        for page in range(7):
+            yield list(range(page * 5, page * 5 + 5))
+
+    source = DltSource("micro", "module", dlt.Schema("micro"), [pages()])
+    storage = ExtractorStorage(NormalizeStorageConfiguration())
+    extract_id = storage.create_extract_id()
+    committed: List[List[str]] = []
+
+    def on_micro_batch(_extract_id: str, dynamic_tables: TSchemaUpdate) -> bool:
+        assert _extract_id == extract_id
+        assert "pages" in dynamic_tables
+        # files may be committed while extraction continues
+        storage.close_writers(extract_id)
+        storage.commit_extract_files(extract_id, keep_extract_folder=True)
+        committed.append(storage.list_files_to_normalize_sorted())
+        # stop after two micro batches
+        return len(committed) < 2
+
+    extract(extract_id, source, storage, writer_threads=writer_threads, micro_batch_items=10, on_micro_batch=on_micro_batch)
+    assert [len(files) for files in committed] == [1, 2]
+    storage.commit_extract_files(extract_id)
+    files = storage.list_files_to_normalize_sorted()
+    assert len(files) == 3
+    # all items extracted in order, split between the micro batches
+    rows = [row for file in files for line in storage.storage.load(file).splitlines() for row in json.loads(line)]
+    assert sorted(rows) == list(range(35))
+
+
+def test_extract_micro_batches_disabled_with_items_in_flight() -> None:
+    clean_test_storage()
+
+    @dlt.resource
+    def pages():
+        for page in range(7):
+            yield list(range(page * 5, page * 5 + 5))
+
+    @dlt.transformer
+    def page_details(items):
+        yield [{"id": item} for item in items]
+
+    @dlt.resource
+    def async_pages():
+        async def _page(page: int):
+            await asyncio.sleep(0.05)
+            return list(range(page * 5, page * 5 + 5))
+
+        for page in range(7):
+            yield _page(page)
+
+    micro_batches: List[str] = []
+
+    def on_micro_batch(_extract_id: str, dynamic_tables: TSchemaUpdate) -> bool:
+        micro_batches.append(_extract_id)
+        return True
+
+    storage = ExtractorStorage(NormalizeStorageConfiguration())
+    # items of the transformer are extracted after its parent yielded them
+    pages_ = pages()
+    source = DltSource("micro", "module", dlt.Schema("micro"), [pages_, pages_ | page_details])
+    extract(storage.create_extract_id(), source, storage, micro_batch_items=10, on_micro_batch=on_micro_batch)
+    # async items are still evaluated when the micro batch is due
+    source = DltSource("micro", "module", dlt.Schema("micro"), [async_pages()])
+    extract(storage.create_extract_id(), source, storage, micro_batch_items=10, on_micro_batch=on_micro_batch)
+    assert micro_batches == []
+
+
+def test_threaded_writer_raises_writer_exception() -> None:
+    clean_test_storage()
+    storage = ExtractorStorage(NormalizeStorageConfiguration())
+    extract_id = storage.create_extract_id()
+
+    def _fail(*args, **kwargs):
+        raise ValueError("writer failed")
+
+    storage.write_data_item = _fail  # type: ignore[assignment]
+    writer = ThreadedItemWriter(storage, 2, 1)
+    with pytest.raises(ValueError):
+        with writer:
+            # writers keep draining the queues after the failure so submitting does not block
+            for i in range(20):
+                writer.write_data_item(extract_id, "schema", "table", i, None)
+    # threads are stopped
+    assert not any(t.is_alive() for t in writer._threads)
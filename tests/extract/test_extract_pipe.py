@@ -49,6 +49,98 @@ def test_next_item_mode() -> None:
     assert [pi.item for pi in _l] == [1, 11, 20, 2, 12, 21, 55, 56, 77, 88, 89, 13, 3, 14, 4, 15]
 
 
+@pytest.mark.parametrize("next_item_mode", ["fifo", "round_robin"])
+def test_async_gen_sources_overlap(next_item_mode: str) -> None:
+
+    async def async_gen(name: str):
+        for i in range(5):
+            await asyncio.sleep(0.1)
+            yield f"{name}_{i}"
+
+    def sync_gen():
+        yield from range(3)
+
+    pipes = [Pipe.from_data("a", async_gen("a")), Pipe.from_data("b", async_gen("b")), Pipe.from_data("sync", sync_gen())]
+    start_ts = time.time()
+    _l = _f_items(list(PipeIterator.from_pipes(pipes, next_item_mode=next_item_mode)))
+    # both async generators are evaluated concurrently, sequential evaluation takes at least 1 second
+    assert time.time() - start_ts < 0.9
+    assert sorted(_l, key=str) == sorted([f"a_{i}" for i in range(5)] + [f"b_{i}" for i in range(5)] + [0, 1, 2], key=str)
+    # items of each generator keep their order
+    assert [i for i in _l if str(i).startswith("a_")] == [f"a_{i}" for i in range(5)]
+    assert [i for i in _l if str(i).startswith("b_")] == [f"b_{i}" for i in range(5)]
+
+
+def test_async_gen_transformer() -> None:
+
+    async def async_tx(item: int):
+        await asyncio.sleep(0.01)
+        yield item
+        # None is not yielded
+        yield None
+        yield item * 10
+
+    parent = Pipe.from_data("data", [1, 2, 3])
+    _l = _f_items(list(PipeIterator.from_pipe(Pipe.from_data("tx", async_tx, parent=parent))))
+    assert sorted(_l) == [1, 2, 3, 10, 20, 30]
+    assert _l.index(1) < _l.index(10)
+
+
+def test_futures_wake_up_iterator() -> None:
+
+    def deferred_gen():
+        for i in range(200):
+            yield dlt.defer(lambda i=i: i)()
+
+    async def _next_item(i: int) -> int:
+        await asyncio.sleep(0.01)
+        return i
+
+    def awaitable_gen():
+        for i in range(100):
+            yield _next_item(i)
+
+    start_ts = time.time()
+    # the iterator is woken up when a future completes, without waiting for the poll interval
+    pipes = [Pipe.from_data("deferred", deferred_gen()), Pipe.from_data("awaitable", awaitable_gen())]
+    _l = _f_items(list(PipeIterator.from_pipes(pipes, max_parallel_items=5, futures_poll_interval=5.0)))
+    assert time.time() - start_ts < 4.0
+    assert sorted(_l) == sorted(list(range(200)) + list(range(100)))
+
+
+@pytest.mark.parametrize("next_item_mode", ["fifo", "round_robin"])
+def test_parallelized_pipes(next_item_mode: str) -> None:
+
+    def blocking_gen(name: str):
+        for i in range(5):
+            sleep(0.1)
+            yield f"{name}_{i}"
+            # None items are skipped
+            yield None
+
+    def get_pipes():
+        pipes = [Pipe.from_data(name, blocking_gen(name)) for name in ["a", "b", "c"]]
+        for pipe in pipes:
+            pipe.parallelized = True
+        return pipes
+
+    start_ts = time.time()
+    _l = _f_items(list(PipeIterator.from_pipes(get_pipes(), next_item_mode=next_item_mode, parallel_prefetch_items=2)))
+    # generators are evaluated in parallel, sequential evaluation takes at least 1.5 seconds
+    assert time.time() - start_ts < 1.2
+    assert len(_l) == 15
+    # items of each generator keep their order
+    for name in ["a", "b", "c"]:
+        assert [i for i in _l if i.startswith(name)] == [f"{name}_{i}" for i in range(5)]
+
+    # parallelized flag is preserved when cloning and creating full pipe
+    pipe = get_pipes()[0]
+    assert pipe._clone().parallelized is True
+    tx_pipe = Pipe.from_data("tx", lambda item: item.upper(), parent=pipe)
+    assert tx_pipe.full_pipe().parallelized is True
+    assert _f_items(list(PipeIterator.from_pipe(tx_pipe))) == [f"A_{i}" for i in range(5)]
+
+
 def test_rotation_on_none() -> None:
 
     global gen_1_started
@@ -628,6 +720,63 @@ def test_close_on_sync_exception() -> None:
     assert_pipes_closed(raise_gen, long_gen)
 
 
+def test_close_on_async_gen_exception() -> None:
+
+    async def long_gen():
+        global close_pipe_got_exit, close_pipe_yielding
+
+        # will be closed by PipeIterator
+        try:
+            close_pipe_yielding = True
+            for i in range(0, 10000):
+                yield i
+            close_pipe_yielding = False
+        except GeneratorExit:
+            close_pipe_got_exit = True
+
+    def raise_gen(item: int):
+        if item == 10:
+            raise RuntimeError("we fail")
+        yield item
+
+    assert_pipes_closed(raise_gen, long_gen)
+
+
+def test_close_on_parallelized_gen_exception() -> None:
+
+    def long_gen():
+        global close_pipe_got_exit, close_pipe_yielding
+
+        # will be closed by PipeIterator
+        try:
+            close_pipe_yielding = True
+            for i in range(0, 10000):
+                yield i
+            close_pipe_yielding = False
+        except GeneratorExit:
+            close_pipe_got_exit = True
+
+    def raise_gen(item: int):
+        if item == 10:
+            raise RuntimeError("we fail")
+        yield item
+
+    global close_pipe_got_exit, close_pipe_yielding
+    close_pipe_got_exit = False
+    close_pipe_yielding = False
+
+    endless = Pipe.from_data("endless", long_gen())
+    endless.parallelized = True
+    with PipeIterator.from_pipe(Pipe.from_data("failing", raise_gen, parent=endless)) as pit:
+        with pytest.raises(ResourceExtractionError) as py_ex:
+            list(pit)
+        assert isinstance(py_ex.value.__cause__, RuntimeError)
+    assert pit._sources == []
+    # generator got closed in the thread pool while still yielding
+    assert close_pipe_got_exit is True
+    assert close_pipe_yielding is True
+
+
 def assert_pipes_closed(raise_gen, long_gen) -> None:
     global close_pipe_got_exit, close_pipe_yielding
 
@@ -16,8 +16,11 @@ from dlt.common.pipeline import StateInjectableContext, resource_state
 from dlt.common.schema.schema import Schema
 from dlt.common.utils import uniq_id, digest128, chunks
 from dlt.common.json import json
+from dlt.common.libs.pyarrow import pyarrow as pa
+import pandas as pd
 
 from dlt.extract.source import DltSource
+from dlt.pipeline.exceptions import PipelineStepFailed
 from dlt.sources.helpers.transform import take_first
 from dlt.extract.incremental import IncrementalCursorPathMissing, IncrementalPrimaryKeyMissing
 
@@ -105,6 +108,36 @@ def test_unique_keys_are_deduplicated() -> None:
     assert rows == [(1, 'a'), (2, 'b'), (3, 'c'), (3, 'd'), (3, 'e'), (3, 'f'), (4, 'g')]
 
 
+def test_unique_hashes_limit() -> None:
+    @dlt.resource(primary_key='id')
+    def some_data(created_at=dlt.sources.incremental('created_at', unique_hashes_limit=3)):
+        # many items with the same cursor value
+        yield [{'created_at': 1, 'id': i} for i in range(5)]
+        # duplicates in the same run are removed
+        yield [{'created_at': 1, 'id': i} for i in range(5)]
+
+    p = dlt.pipeline(pipeline_name=uniq_id())
+    p.extract(some_data())
+    s = p.state["sources"][p.default_schema_name]['resources']['some_data']['incremental']['created_at']
+    assert s['unique_hashes'] == [digest128(str(i)) for i in range(3)]
+
+    # items above the limit are not deduplicated in the next run
+    assert [item["id"] for item in some_data()] == [3, 4]
+
+
+def test_primary_key_hash_compatible() -> None:
+    # cheaper primary key hashes are identical to previous json hashes
+    inc = dlt.sources.incremental('created_at', primary_key='id')
+    for key_value in [1, "a", 1.5, True, None, "ąę\"x"]:
+        assert inc.unique_value({"id": key_value}) == digest128(json.dumps(key_value, sort_keys=True))
+    inc = dlt.sources.incremental('created_at', primary_key=('id', 'other'))
+    assert inc.unique_value({"id": 1, "other": "a"}) == digest128(json.dumps([1, "a"], sort_keys=True))
+    # dicts nested in compound keys are hashed with sorted keys
+    row = {"id": 1, "other": {"b": 1, "a": 2}}
+    assert inc.unique_value(row) == digest128(json.dumps([1, {"a": 2, "b": 1}], sort_keys=True))
+    assert inc.unique_value(row) == inc.unique_value({"id": 1, "other": {"a": 2, "b": 1}})
+
+
 def test_unique_rows_by_hash_are_deduplicated() -> None:
     @dlt.resource
     def some_data(created_at=dlt.sources.incremental('created_at')):
@@ -965,3 +998,108 @@ def test_allow_external_schedulers() -> None:
     r.add_step(dlt.sources.incremental("updated_at"))
     r.incremental.allow_external_schedulers = True
     assert len(list(test_type_2())) == 2
+
+
+def _to_item_format(item_type: str, rows: Any) -> Any:
+    if item_type == "arrow":
+        return pa.Table.from_pylist(rows)
+    if item_type == "pandas":
+        return pd.DataFrame(rows)
+    return rows
+
+
+def _item_ids(items: Any) -> Any:
+    ids = []
+    for item in items:
+        if isinstance(item, pa.Table):
+            ids.extend(item["id"].to_pylist())
+        elif isinstance(item, pd.DataFrame):
+            ids.extend(item["id"].tolist())
+        else:
+            ids.append(item["id"])
+    return ids
+
+
+@pytest.mark.parametrize("item_type", ["object", "arrow", "pandas"])
+def test_batch_items_filtered_and_deduplicated(item_type: str) -> None:
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental("created_at", initial_value=2, end_value=10)):
+        yield _to_item_format(item_type, [
+            {"created_at": 1, "id": 0}, {"created_at": 2, "id": 1}, {"created_at": 3, "id": 2},
+            {"created_at": 3, "id": 3}, {"created_at": 3, "id": 2}, {"created_at": 10, "id": 9}
+        ])
+        assert created_at.start_out_of_range is True
+        assert created_at.end_out_of_range is True
+        # all items filtered out
+        yield _to_item_format(item_type, [{"created_at": 0, "id": 5}])
+
+    p = dlt.pipeline(pipeline_name=uniq_id())
+    # rows below start value and above end value are removed, duplicates with the same cursor value removed
+    assert _item_ids(some_data()) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("item_type", ["object", "arrow", "pandas"])
+def test_batch_items_deduplicated_across_runs(item_type: str) -> None:
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental("created_at")):
+        if created_at.last_value is None:
+            yield _to_item_format(item_type, [{"created_at": 1, "id": 1}, {"created_at": 3, "id": 2}, {"created_at": 3, "id": 3}])
+        else:
+            yield _to_item_format(item_type, [{"created_at": 3, "id": 2}, {"created_at": 3, "id": 3}, {"created_at": 3, "id": 4}, {"created_at": 2, "id": 5}, {"created_at": 4, "id": 6}])
+
+    p = dlt.pipeline(pipeline_name=uniq_id())
+    p.extract(some_data())
+    s = p.state["sources"][p.default_schema_name]["resources"]["some_data"]["incremental"]["created_at"]
+    assert s["last_value"] == 3
+    assert s["unique_hashes"] == [digest128("2"), digest128("3")]
+
+    # rows below last value are filtered out
+    assert _item_ids(some_data()) == [4, 6]
+    p.extract(some_data())
+    s = p.state["sources"][p.default_schema_name]["resources"]["some_data"]["incremental"]["created_at"]
+    assert s["last_value"] == 4
+    assert s["unique_hashes"] == [digest128("6")]
+
+
+@pytest.mark.parametrize("item_type", ["object", "arrow", "pandas"])
+def test_batch_items_custom_last_value_func(item_type: str) -> None:
+    @dlt.resource
+    def some_data(created_at=dlt.sources.incremental("created_at", last_value_func=lambda values: max(values) if values else None)):
+        yield _to_item_format(item_type, [{"created_at": 1, "id": 1}, {"created_at": 3, "id": 2}, {"created_at": 3, "id": 2}])
+
+    p = dlt.pipeline(pipeline_name=uniq_id())
+    assert _item_ids(some_data()) == [1, 2]
+
+
+@pytest.mark.parametrize("last_value_func", [max, min])
+def test_list_items_same_as_single_items(last_value_func: Any) -> None:
+    import random
+    rnd = random.Random(42)
+    pages = [[{"created_at": rnd.randint(0, 20), "id": rnd.randint(0, 10)} for _ in range(50)] for _ in range(4)]
+
+    def filter_pages(filter_lists: bool) -> Any:
+        incremental = dlt.sources.incremental("created_at", initial_value=10, end_value=18 if last_value_func is max else 2, last_value_func=last_value_func, primary_key="id")
+        incremental.resource_name = "some_data"
+        incremental._cached_state = {"initial_value": 10, "last_value": 10, "unique_hashes": []}
+        incremental.start_value = 10
+        incremental._cursor_keys = ["created_at"]
+        incremental._unique_hashes = set()
+        if filter_lists:
+            kept = [incremental(page) for page in pages]
+        else:
+            kept = [[row for row in page if incremental.transform(row)] or None for page in pages]
+        return kept, incremental._cached_state, incremental.start_out_of_range, incremental.end_out_of_range
+
+    # the bulk path for lists keeps the same rows and state as filtering row by row
+    assert filter_pages(True) == filter_pages(False)
+
+
+def test_batch_items_cursor_must_be_column() -> None:
+    @dlt.resource
+    def some_data(created_at=dlt.sources.incremental("data.created_at")):
+        yield pa.Table.from_pylist([{"data": {"created_at": 1}}])
+
+    p = dlt.pipeline(pipeline_name=uniq_id())
+    with pytest.raises(PipelineStepFailed) as py_ex:
+        p.extract(some_data())
+    assert isinstance(py_ex.value.__context__, IncrementalCursorPathMissing)
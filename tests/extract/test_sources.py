@@ -1,3 +1,5 @@
+import asyncio
+import time
 import itertools
 from typing import Iterator
 
@@ -9,7 +11,7 @@ from dlt.common.exceptions import PipelineStateNotAvailable
 from dlt.common.pipeline import StateInjectableContext, source_state
 from dlt.common.schema import Schema
 from dlt.common.typing import TDataItems
-from dlt.extract.exceptions import InvalidParentResourceDataType, InvalidParentResourceIsAFunction, InvalidTransformerDataTypeGeneratorFunctionRequired, InvalidTransformerGeneratorFunction, ParametrizedResourceUnbound, ResourcesNotFoundError
+from dlt.extract.exceptions import InvalidParentResourceDataType, InvalidParentResourceIsAFunction, InvalidTransformerDataTypeGeneratorFunctionRequired, InvalidTransformerGeneratorFunction, ParametrizedResourceUnbound, ResourceExtractionError, ResourcesNotFoundError
 from dlt.extract.pipe import Pipe
 from dlt.extract.typing import FilterItem, MapItem
 from dlt.extract.source import DltResource, DltSource
@@ -761,6 +763,94 @@ def test_limit_source() -> None:
     assert list(infinite_source().add_limit(2)) == ['A', 'A', 0, 'A', 'A', 'A', 1] * 3
 
 
+def test_async_gen_resource() -> None:
+
+    @dlt.resource
+    async def async_pages(n_pages: int = 3):
+        for page in range(n_pages):
+            await asyncio.sleep(0.01)
+            yield [{"page": page, "idx": idx} for idx in range(2)]
+
+    @dlt.transformer(data_from=async_pages)
+    async def async_details(page):
+        for item in page:
+            await asyncio.sleep(0.01)
+            yield {"details": item["idx"]}
+
+    assert [i["page"] for i in async_pages(2)] == [0, 0, 1, 1]
+    # async generator object as data
+    assert len(list(dlt.resource(async_pages._pipe.gen(1), name="pages_obj"))) == 2
+    assert len(list(async_details)) == 6
+    # limit the pages
+    assert [i["page"] for i in async_pages().add_limit(2)] == [0, 0, 1, 1]
+    assert [i["page"] for i in async_pages(10).add_limit(1)] == [0, 0]
+
+
+def test_async_gen_resource_closed_while_awaited() -> None:
+    closed = []
+
+    @dlt.resource
+    async def slow_pages():
+        try:
+            for page in range(3):
+                await asyncio.sleep(0.5)
+                yield page
+        finally:
+            closed.append(True)
+
+    @dlt.resource
+    def failing():
+        for item in range(3):
+            time.sleep(0.05)
+            yield item
+        raise RuntimeError("failing")
+
+    @dlt.source
+    def pages_source():
+        return slow_pages, failing
+
+    # the async generator is still awaiting its first item when extraction fails
+    with pytest.raises(ResourceExtractionError):
+        list(pages_source())
+    assert closed == [True]
+
+
+def test_parallelized_resource() -> None:
+    import threading
+
+    @dlt.resource(parallelized=True)
+    def threaded_gen(n: int = 3):
+        for i in range(n):
+            yield {"i": i, "thread": threading.current_thread().name}
+
+    @dlt.transformer(data_from=threaded_gen)
+    def tx(item):
+        yield item["i"] * 10
+
+    r = threaded_gen(5)
+    assert r._pipe.parallelized is True
+    items = list(r)
+    assert [i["i"] for i in items] == list(range(5))
+    assert all(i["thread"] != threading.current_thread().name for i in items)
+    # transformer is evaluated in the main thread, its parent generator in the pool
+    assert tx._pipe.parallelized is False
+    assert list(tx) == [0, 10, 20]
+
+    @dlt.resource
+    def main_thread_gen():
+        yield threading.current_thread().name
+
+    assert list(main_thread_gen()) == [threading.current_thread().name]
+
+    @dlt.source(parallelized=True)
+    def parallel_source():
+        return main_thread_gen, tx
+
+    source = parallel_source()
+    assert source.main_thread_gen._pipe.parallelized is True
+    assert list(source.main_thread_gen) != [threading.current_thread().name]
+
+
 def test_source_state() -> None:
 
     @dlt.source
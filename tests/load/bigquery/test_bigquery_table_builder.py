@@ -1,6 +1,8 @@
+import os
 import pytest
 import sqlfluff
 from copy import deepcopy
+from typing import Any, List, Sequence
 
 from dlt.common.utils import custom_environ, uniq_id
 from dlt.common.schema import Schema
@@ -8,9 +10,10 @@ from dlt.common.schema.utils import new_table
 from dlt.common.configuration import resolve_configuration
 from dlt.common.configuration.specs import GcpServiceAccountCredentialsWithoutDefaults
 
-from dlt.destinations.bigquery.bigquery import BigQueryClient
+from dlt.destinations.bigquery.bigquery import BigQueryClient, BigQueryLoadJob
 from dlt.destinations.bigquery.configuration import BigQueryClientConfiguration
 from dlt.destinations.exceptions import DestinationSchemaWillNotUpdate
+from dlt.destinations.job_impl import NewReferenceJob
 
 from tests.load.utils import TABLE_UPDATE
 
@@ -122,3 +125,42 @@ def test_double_partition_exception(gcp_client: BigQueryClient) -> None:
     with pytest.raises(DestinationSchemaWillNotUpdate) as excc:
         gcp_client._get_table_update_sql("event_test_table", mod_update, False)
     assert excc.value.columns == ["`col4`", "`col5`"]
+
+
+def test_reference_jobs_batch_shares_job(gcp_client: BigQueryClient, monkeypatch: Any) -> None:
+    bucket_paths = [f"gs://bucket/dataset/event_test_table/{name}" for name in ["a.parquet", "b.jsonl", "c.parquet"]]
+    file_paths = [
+        NewReferenceJob(f"event_test_table.{uniq_id()}.0.{os.path.splitext(bucket_path)[1][1:]}", "running", remote_path=bucket_path).new_file_path()
+        for bucket_path in bucket_paths
+    ]
+    started_jobs: List[Any] = []
+
+    class _LoadJob:
+        def __init__(self, job_id: str, source_uris: Sequence[str]) -> None:
+            self.job_id = job_id
+            self.source_uris = source_uris
+
+    def _create_load_job(table: Any, file_path: str, bucket_paths: Sequence[str] = None) -> Any:
+        started_jobs.append(_LoadJob(BigQueryLoadJob.get_job_id_from_file_path(file_path), bucket_paths))
+        return started_jobs[-1]
+
+    monkeypatch.setattr(gcp_client, "_create_load_job", _create_load_job)
+    jobs = gcp_client.start_reference_jobs_batch(new_table("event_test_table"), file_paths, "load_id")
+
+    # one load job per file format, the job id comes from the first file of the format
+    assert [job.source_uris for job in started_jobs] == [[bucket_paths[0], bucket_paths[2]], [bucket_paths[1]]]
+    assert [job.bq_load_job for job in jobs] == [started_jobs[0], started_jobs[1], started_jobs[0]]  # type: ignore[attr-defined]
+    assert [job.poll_job for job in jobs] == [True, True, False]  # type: ignore[attr-defined]
+    # shared job id is stored with each reference
+    assert [NewReferenceJob.get_reference_job_id(file_path) for file_path in file_paths] == [
+        started_jobs[0].job_id, started_jobs[1].job_id, started_jobs[0].job_id
+    ]
+    assert [NewReferenceJob.resolve_reference(file_path) for file_path in file_paths] == bucket_paths
+
+    # restored jobs are retrieved by the stored job id
+    class _Client:
+        def get_job(self, job_id: str) -> Any:
+            return next(job for job in started_jobs if job.job_id == job_id)
+
+    monkeypatch.setattr(gcp_client.sql_client, "_client", _Client())
+    assert gcp_client._retrieve_load_job(file_paths[2]) is started_jobs[0]
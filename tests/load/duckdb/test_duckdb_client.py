@@ -1,14 +1,17 @@
 import os
 import pytest
-from typing import Iterator, cast
+from typing import Any, Iterator, cast
 
 import dlt
+from dlt.common.configuration.container import Container
 from dlt.common.configuration.resolve import resolve_configuration
 from dlt.common.configuration.utils import get_resolved_traces
+from dlt.common.utils import uniq_id
 
 from dlt.destinations.duckdb.configuration import DUCK_DB_NAME, DuckDbClientConfiguration, DuckDbCredentials, DEFAULT_DUCK_DB_NAME
 
 from tests.load.pipeline.utils import drop_pipeline, assert_table
+from tests.pipeline.utils import assert_load_info
 from tests.utils import patch_home_dir, autouse_test_storage, preserve_environ, TEST_STORAGE_ROOT
 
 @pytest.fixture(autouse=True)
@@ -225,3 +228,57 @@ def test_default_duckdb_dataset_name() -> None:
 def delete_quack_db() -> None:
     if os.path.isfile(DEFAULT_DUCK_DB_NAME):
         os.remove(DEFAULT_DUCK_DB_NAME)
+
+
+@pytest.mark.parametrize("pool_connections", (True, False))
+def test_load_reuses_pooled_connections(pool_connections: bool, monkeypatch) -> None:
+    from dlt.destinations.duckdb.sql_client import DuckDbSqlClient
+
+    os.environ["LOAD__POOL_CONNECTIONS"] = str(pool_connections)
+    os.environ["LOAD__WORKERS"] = "2"
+    p = dlt.pipeline(pipeline_name="pooled_" + uniq_id(), destination="duckdb")
+    # a load job for each table
+    p.extract([dlt.resource([{"id": i}], name=f"table_{i}") for i in range(10)])
+    p.normalize()
+
+    opened = []
+    connect = DuckDbSqlClient._connect
+
+    def _connect(self: DuckDbSqlClient) -> Any:
+        opened.append(self)
+        return connect(self)
+
+    monkeypatch.setattr(DuckDbSqlClient, "_connect", _connect)
+    info = p.load()
+    assert_load_info(info)
+    if pool_connections:
+        # at most one connection per worker and one for the main thread
+        assert len(opened) <= 3
+    else:
+        assert len(opened) > 10
+
+
+def test_clients_of_database_share_pool() -> None:
+    from dlt.destinations.connection_pool import ConnectionPoolsContext
+    from dlt.destinations.duckdb.sql_client import DuckDbSqlClient
+
+    db_path = os.path.abspath(os.path.join(TEST_STORAGE_ROOT, "pooled.duckdb"))
+    credentials = resolve_configuration(DuckDbCredentials(db_path))
+    other_credentials = resolve_configuration(DuckDbCredentials(db_path))
+    pools = ConnectionPoolsContext()
+    with Container().injectable_context(pools):
+        client = DuckDbSqlClient("test_dataset", credentials)
+        other_client = DuckDbSqlClient("test_dataset", other_credentials)
+        # clients with equal database path share a pool
+        assert client._connection_pool_key() == other_client._connection_pool_key()
+        assert client._connection_pool_key() != DuckDbSqlClient("other_dataset", credentials)._connection_pool_key()
+        with client:
+            conn = client.native_connection
+        # pooled cursor of the first credentials is reused by the client with other credentials
+        with other_client:
+            assert other_client.native_connection is conn
+            assert other_client.execute_sql("SELECT 1")[0][0] == 1
+        pools.close()
+    # cursor was returned to the credentials that opened it
+    assert not hasattr(credentials, "_conn")
+    assert not hasattr(other_credentials, "_conn")
@@ -5,10 +5,13 @@ import pytest
 
 from dlt.common.utils import digest128, uniq_id
 from dlt.common.storages import LoadStorage, FileStorage
+from dlt.common.configuration.container import Container
 
+from dlt.destinations.connection_pool import ConnectionPoolsContext
 from dlt.destinations.filesystem.filesystem import LoadFilesystemJob, FilesystemDestinationClientConfiguration
 
-from tests.load.filesystem.utils import perform_load
+from tests.load.filesystem.utils import perform_load, setup_loader
+from tests.load.utils import FILE_BUCKET, MEMORY_BUCKET, prepare_load_package
 from tests.utils import clean_test_storage, init_test_logging
 from tests.utils import preserve_environ, autouse_test_storage
 
@@ -136,3 +139,43 @@ def test_append_write_disposition(layout: str, all_buckets_env: str) -> None:
                 for f in files:
                     paths.append(posixpath.join(basedir, f))
             assert list(sorted(paths)) == expected_files
+
+
+def test_replace_truncates_files_in_single_rm(monkeypatch) -> None:
+    os.environ['DESTINATION__FILESYSTEM__BUCKET_URL'] = MEMORY_BUCKET
+    dataset_name = 'test_' + uniq_id()
+    with perform_load(dataset_name, NORMALIZED_FILES, write_disposition='replace'):
+        load = setup_loader(dataset_name)
+        _, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES, 'replace')
+        with load.get_destination_client(schema) as client:
+            rm_calls = []
+            fs_rm = client.fs_client.rm
+
+            def _rm(path, *args, **kwargs):
+                rm_calls.append(path)
+                return fs_rm(path, *args, **kwargs)
+
+            monkeypatch.setattr(client.fs_client, "rm", _rm)
+            client.initialize_storage(truncate_tables=["event_user", "event_loop_interrupted"])
+            # both table files deleted with one call
+            assert len(rm_calls) == 1
+            assert len(rm_calls[0]) == 2
+            assert not any(client.fs_client.exists(path) for path in rm_calls[0])
+
+
+def test_filesystem_shared_in_connection_pools() -> None:
+    os.environ['DESTINATION__FILESYSTEM__BUCKET_URL'] = FILE_BUCKET
+    load = setup_loader('test_' + uniq_id())
+    _, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES, 'append')
+    pools = ConnectionPoolsContext()
+    with Container().injectable_context(pools):
+        with load.get_destination_client(schema) as client:
+            fs = client._fs
+        # filesystem is returned and borrowed again by the next client
+        with load.get_destination_client(schema) as client:
+            assert client._fs is fs
+        assert len(pools.get_pool(client._filesystem_pool_key(), None, None)) == 1
+    # without pools new filesystem is created
+    with load.get_destination_client(schema) as client:
+        assert client._fs is not fs
+        assert client._fs_pool is None
@@ -4,16 +4,21 @@ import pytest
 
 from dlt.common import pendulum, Wei
 from dlt.common.configuration.resolve import resolve_configuration, ConfigFieldMissingException
+from dlt.common.data_writers.writers import DataWriter
+from dlt.common.schema.utils import new_table
+from dlt.common.storages.load_storage import ParsedLoadJobFileName
 from dlt.common.storages import FileStorage
 from dlt.common.utils import uniq_id
 
 from dlt.destinations.postgres.configuration import PostgresCredentials
-from dlt.destinations.postgres.postgres import PostgresClient
+from dlt.destinations.postgres.postgres import PostgresClient, PostgresCsvCopyJob
+from dlt.load import Load
 from dlt.destinations.postgres.sql_client import psycopg2
 
 from tests.utils import TEST_STORAGE_ROOT, delete_test_storage, skipifpypy, preserve_environ
 from tests.load.utils import expect_load_file, prepare_table, yield_client_with_storage
 from tests.common.configuration.utils import environment
+from tests.cases import TABLE_UPDATE, TABLE_ROW_ALL_DATA_TYPES, assert_all_data_types_row
 
 
 @pytest.fixture
@@ -79,3 +84,25 @@ def test_wei_value(client: PostgresClient, file_storage: FileStorage) -> None:
     insert_sql = "INSERT INTO {}(_dlt_id, _dlt_root_id, sender_id, timestamp, parse_data__metadata__rasa_x_id)\nVALUES\n"
     insert_values = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', '{str(pendulum.now())}', {Wei.from_int256(2*256-1, 78)});"
     expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name)
+
+
+def test_csv_copy_all_data_types(client: PostgresClient, file_storage: FileStorage) -> None:
+    table_name = "all_types" + uniq_id()
+    client.schema.update_schema(new_table(table_name, columns=TABLE_UPDATE))
+    client.schema.bump_version()
+    client.update_stored_schema()
+    # write empty strings and all data types, second row with columns in different order
+    row = dict(TABLE_ROW_ALL_DATA_TYPES)
+    rows = [row, {"col5_null": "", **dict(reversed(row.items()))}]
+    file_name = ParsedLoadJobFileName(table_name, uniq_id(), 0, "csv").job_id()
+    with file_storage.open_file(file_name, "wt") as f:
+        DataWriter.from_file_format("csv", f).write_all({c["name"]: c for c in TABLE_UPDATE}, rows)
+    job = client.start_file_load(Load.get_load_table(client.schema, file_name), file_storage.make_full_path(file_name), uniq_id())
+    assert isinstance(job, PostgresCsvCopyJob)
+    assert job.state() == "completed"
+    qualified_name = client.sql_client.make_qualified_table_name(table_name)
+    db_rows = client.sql_client.execute_sql(f"SELECT * FROM {qualified_name} ORDER BY col5_null NULLS FIRST")
+    assert len(db_rows) == 2
+    assert_all_data_types_row(db_rows[0])
+    # empty string is not NULL
+    assert db_rows[1][[c["name"] for c in TABLE_UPDATE].index("col5_null")] == ""
@@ -1,12 +1,19 @@
+import os
 import pytest
 import sqlfluff
 from copy import deepcopy
+from contextlib import nullcontext
+from typing import Any, List
 
+from dlt.common import json
 from dlt.common.utils import uniq_id, custom_environ, digest128
 from dlt.common.schema import Schema
+from dlt.common.schema.utils import new_table
 from dlt.common.configuration import resolve_configuration
+from dlt.common.storages import FilesystemConfiguration, filesystem
 
-from dlt.destinations.redshift.redshift import RedshiftClient
+from dlt.destinations.job_impl import NewReferenceJob
+from dlt.destinations.redshift.redshift import RedshiftClient, RedshiftCopyFileLoadJob
 from dlt.destinations.redshift.configuration import RedshiftClientConfiguration, RedshiftCredentials
 
 from tests.load.utils import TABLE_UPDATE
@@ -103,3 +110,55 @@ def test_create_table_with_hints(client: RedshiftClient) -> None:
     # no hints
     assert '"col3" boolean  NOT NULL' in sql
     assert '"col4" timestamp with time zone  NOT NULL' in sql
+
+
+def test_copy_sql_from_manifest(client: RedshiftClient) -> None:
+    table = new_table("event_test_table", columns=[{"name": "col1", "data_type": "bigint", "nullable": False}])
+    sql = RedshiftCopyFileLoadJob.make_copy_sql(
+        table, client.sql_client, "a.reference", "s3://bucket/dataset/event.manifest", "parquet", staging_iam_role="arn:aws:iam::1:role/r", is_manifest=True
+    )
+    assert f"COPY {client.sql_client.dataset_name}.event_test_table" in sql
+    assert "FROM 's3://bucket/dataset/event.manifest'" in sql
+    assert "MANIFEST" in sql
+    assert "PARQUET" in sql
+    assert "IAM_ROLE 'arn:aws:iam::1:role/r'" in sql
+    # single file is copied directly
+    sql = RedshiftCopyFileLoadJob.make_copy_sql(table, client.sql_client, "a.reference", "s3://bucket/dataset/a.jsonl", "jsonl")
+    assert "MANIFEST" not in sql
+    assert "FORMAT AS JSON 'auto'" in sql
+
+
+def test_reference_jobs_batch_copies_from_manifest(client: RedshiftClient, monkeypatch: Any) -> None:
+    bucket_url = "memory:///redshift_" + uniq_id()
+    client.config.staging_config = FilesystemConfiguration(bucket_url=bucket_url)
+    fs_client, _ = filesystem(bucket_url)
+    bucket_paths = [f"{bucket_url}/event_test_table/{name}" for name in ["a.parquet", "b.parquet", "c.jsonl"]]
+    file_paths = []
+    for bucket_path in bucket_paths:
+        fs_client.pipe_file(bucket_path, b"data")
+        file_name = f"event_test_table.{uniq_id()}.0.{os.path.splitext(bucket_path)[1][1:]}"
+        file_paths.append(NewReferenceJob(file_name, "running", remote_path=bucket_path).new_file_path())
+
+    executed_sql: List[str] = []
+    manifests: List[Any] = []
+
+    def _execute_sql(sql: str) -> None:
+        executed_sql.append(sql)
+        if "MANIFEST" in sql:
+            manifest_path = sql.split("FROM '")[1].split("'")[0]
+            manifests.append(json.loadb(fs_client.cat_file(manifest_path)))
+
+    monkeypatch.setattr(client.sql_client, "execute_sql", _execute_sql)
+    monkeypatch.setattr(client.sql_client, "begin_transaction", nullcontext)
+    table = new_table("event_test_table", columns=[{"name": "col1", "data_type": "bigint", "nullable": False}])
+    jobs = client.start_reference_jobs_batch(table, file_paths, "load_id")
+
+    assert [job.state() for job in jobs] == ["completed"] * 3
+    # one COPY per file format, parquet files copied from a manifest
+    assert len(executed_sql) == 2
+    assert manifests == [{"entries": [
+        {"url": bucket_path, "mandatory": True, "meta": {"content_length": 4}} for bucket_path in bucket_paths[:2]
+    ]}]
+    assert f"FROM '{bucket_paths[2]}'" in executed_sql[1]
+    # manifest is deleted
+    assert not any(path.endswith(".manifest") for path in fs_client.ls(f"{bucket_url}/event_test_table", detail=False))
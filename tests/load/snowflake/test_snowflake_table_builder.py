@@ -5,9 +5,10 @@ import sqlfluff
 
 from dlt.common.utils import uniq_id
 from dlt.common.schema import Schema
-from dlt.destinations.snowflake.snowflake import SnowflakeClient
+from dlt.common.configuration.specs import AwsCredentialsWithoutDefaults, AzureCredentialsWithoutDefaults
+from dlt.destinations.snowflake.snowflake import SnowflakeClient, SnowflakeLoadJob
 from dlt.destinations.snowflake.configuration import SnowflakeClientConfiguration, SnowflakeCredentials
-from dlt.destinations.exceptions import DestinationSchemaWillNotUpdate
+from dlt.destinations.exceptions import DestinationSchemaWillNotUpdate, LoadJobTerminalException
 
 from tests.load.utils import TABLE_UPDATE
 
@@ -90,3 +91,41 @@ def test_create_table_with_partition_and_cluster(snowflake_client: SnowflakeClie
 
     # clustering must be the last
     assert sql.endswith('CLUSTER BY ("COL2","COL5")')
+
+
+def test_make_bucket_copy_sql() -> None:
+    table_name = '"TEST"."EVENT_TEST_TABLE"'
+    bucket_paths = ["s3://bucket/dataset/event_test_table/a.parquet", "s3://bucket/dataset/event_test_table/b.parquet"]
+    # files are relative to the stage
+    sql = SnowflakeLoadJob.make_bucket_copy_sql(table_name, "a.reference", bucket_paths, stage_name="PUBLIC.MY_STAGE")
+    assert sql.strip().startswith(f"COPY INTO {table_name}")
+    assert "FROM '@PUBLIC.MY_STAGE'" in sql
+    assert "FILES = ('dataset/event_test_table/a.parquet', 'dataset/event_test_table/b.parquet')" in sql
+    assert "TYPE = 'PARQUET'" in sql
+    assert "CREDENTIALS" not in sql
+
+    # files are relative to the bucket
+    aws_credentials = AwsCredentialsWithoutDefaults()
+    aws_credentials.aws_access_key_id = "key_id"
+    aws_credentials.aws_secret_access_key = "secret_key"
+    sql = SnowflakeLoadJob.make_bucket_copy_sql(table_name, "a.reference", bucket_paths, staging_credentials=aws_credentials)
+    assert "FROM 's3://bucket/'" in sql
+    assert "FILES = ('dataset/event_test_table/a.parquet', 'dataset/event_test_table/b.parquet')" in sql
+    assert "CREDENTIALS=(AWS_KEY_ID='key_id' AWS_SECRET_KEY='secret_key')" in sql
+
+    # files are relative to the container
+    azure_credentials = AzureCredentialsWithoutDefaults()
+    azure_credentials.azure_storage_account_name = "account"
+    azure_credentials.azure_storage_sas_token = "token"
+    sql = SnowflakeLoadJob.make_bucket_copy_sql(table_name, "a.reference", ["az://container/dataset/a.jsonl"], staging_credentials=azure_credentials)
+    assert "FROM 'azure://account.blob.core.windows.net/container/'" in sql
+    assert "FILES = ('dataset/a.jsonl')" in sql
+    assert "CREDENTIALS=(AZURE_SAS_TOKEN='?token')" in sql
+    assert "TYPE = 'JSON'" in sql
+
+    # gcs bucket requires a stage
+    with pytest.raises(LoadJobTerminalException):
+        SnowflakeLoadJob.make_bucket_copy_sql(table_name, "a.reference", ["gs://bucket/dataset/a.jsonl"])
+    sql = SnowflakeLoadJob.make_bucket_copy_sql(table_name, "a.reference", ["gs://bucket/dataset/a.jsonl"], stage_name="MY_STAGE")
+    assert "FROM @MY_STAGE/" in sql
+    assert "FILES = ('dataset/a.jsonl')" in sql
@@ -6,8 +6,8 @@ from typing import List, Sequence, Tuple
 import pytest
 from unittest.mock import patch
 
-from dlt.common.exceptions import TerminalException, TerminalValueError
-from dlt.common.schema import Schema
+from dlt.common.exceptions import DestinationTransientException, TerminalException, TerminalValueError
+from dlt.common.schema import Schema, TTableSchema
 from dlt.common.storages import FileStorage, LoadStorage
 from dlt.common.storages.load_storage import JobWithUnsupportedWriterException
 from dlt.common.utils import uniq_id
@@ -61,8 +61,10 @@ def test_spool_job_started() -> None:
         assert load.load_storage.storage.has_file(load.load_storage._get_job_file_path(load_id, LoadStorage.STARTED_JOBS_FOLDER, job.file_name()))
         jobs.append(job)
     # still running
-    remaining_jobs = load.complete_jobs(load_id, jobs, schema)
+    completed_jobs: List[LoadJob] = []
+    remaining_jobs = load.complete_jobs(load_id, jobs, schema, completed_jobs.append)
     assert len(remaining_jobs) == 2
+    assert completed_jobs == []
 
 
 def test_unsupported_writer_type() -> None:
@@ -147,9 +149,11 @@ def test_spool_job_failed() -> None:
         assert job.state() == "failed"
         assert load.load_storage.storage.has_file(load.load_storage._get_job_file_path(load_id, LoadStorage.STARTED_JOBS_FOLDER, job.file_name()))
         jobs.append(job)
-    # complete files
-    remaining_jobs = load.complete_jobs(load_id, jobs, schema)
+    # complete files, failed jobs free their slots
+    completed_jobs: List[LoadJob] = []
+    remaining_jobs = load.complete_jobs(load_id, jobs, schema, completed_jobs.append)
     assert len(remaining_jobs) == 0
+    assert completed_jobs == jobs
     for job in jobs:
         assert load.load_storage.storage.has_file(load.load_storage._get_job_file_path(load_id, LoadStorage.FAILED_JOBS_FOLDER, job.file_name()))
         assert load.load_storage.storage.has_file(load.load_storage._get_job_file_path(load_id, LoadStorage.FAILED_JOBS_FOLDER, job.file_name() + ".exception"))
@@ -232,8 +236,7 @@ def test_spool_job_retry_spool_new() -> None:
     # call higher level function that returns jobs and counts
     with ThreadPool() as pool:
         load.pool = pool
-        jobs_count, jobs = load.spool_new_jobs(load_id, schema)
-        assert jobs_count == 2
+        jobs = start_and_collect_jobs(load, load_id, schema)
         assert len(jobs) == 2
 
 
@@ -257,9 +260,11 @@ def test_spool_job_retry_started() -> None:
         jobs.append(job)
     files = load.load_storage.list_new_jobs(load_id)
     assert len(files) == 0
-    # should retry, that moves jobs into new folder
-    remaining_jobs = load.complete_jobs(load_id, jobs, schema)
+    # should retry, that moves jobs into new folder and frees the slots
+    completed_jobs: List[LoadJob] = []
+    remaining_jobs = load.complete_jobs(load_id, jobs, schema, completed_jobs.append)
     assert len(remaining_jobs) == 0
+    assert completed_jobs == jobs
     # clear retry flag
     dummy_impl.JOBS = {}
     files = load.load_storage.list_new_jobs(load_id)
@@ -296,8 +301,8 @@ def test_try_retrieve_job() -> None:
         NORMALIZED_FILES
     )
     load.pool = ThreadPool()
-    jobs_count, jobs = load.spool_new_jobs(load_id, schema)
-    assert jobs_count == 2
+    jobs = start_and_collect_jobs(load, load_id, schema)
+    assert len(jobs) == 2
     # now jobs are known
     with load.destination.client(schema, load.initial_client_config) as c:
         job_count, jobs = load.retrieve_jobs(c, load_id)
@@ -357,6 +362,82 @@ def test_retry_on_new_loop() -> None:
             assert LoadStorage.parse_job_file_name(fn).retry_count == 2
 
 
+def test_sliding_window_loop() -> None:
+    # single worker and more jobs than workers
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0), workers=1)
+    load_id, _ = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    # add more jobs to the package
+    new_jobs_path = load.load_storage._get_job_folder_path(load_id, "new_jobs")
+    for idx in range(4):
+        load.load_storage.storage.link_hard(
+            os.path.join(new_jobs_path, NORMALIZED_FILES[0]),
+            os.path.join(new_jobs_path, f"event_user.{uniq_id()}.0.jsonl")
+        )
+    with ThreadPool() as pool:
+        # new jobs are started when slot is freed so all jobs complete in a single run
+        load.run(pool)
+        assert len(load.load_storage.list_new_jobs(load_id)) == 0
+        package_info = load.load_storage.get_load_package_info(load_id)
+        assert len(package_info.jobs["completed_jobs"]) == 6
+        # utilization reported for each slot
+        assert len(load._slots_utilization[load_id]) == 1
+        assert 0.0 <= load._slots_utilization[load_id][0] <= 1.0
+        # complete package
+        load.run(pool)
+        assert not load.load_storage.storage.has_folder(load.load_storage.get_package_path(load_id))
+
+
+def test_reference_jobs_batches() -> None:
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0), with_staging=True)
+    # one file for event_loop_interrupted is still to be uploaded to staging
+    load_id, schema = prepare_load_package(
+        load.load_storage,
+        [NORMALIZED_FILES[1]]
+    )
+    new_jobs_path = load.load_storage._get_job_folder_path(load_id, "new_jobs")
+    for table_name in ["event_user"] * 3 + ["event_loop_interrupted"]:
+        load.load_storage.storage.save(os.path.join(new_jobs_path, f"{table_name}.{uniq_id()}.0.reference"), f"s3://bucket/{table_name}.jsonl")
+
+    batches: List[Tuple[str, List[str]]] = []
+    start_batch = dummy_impl.DummyClient.start_reference_jobs_batch
+
+    def _record_batch(self: dummy_impl.DummyClient, table: TTableSchema, file_paths: Sequence[str], load_id: str) -> List[LoadJob]:
+        batches.append((table["name"], [os.path.basename(p) for p in file_paths]))
+        return start_batch(self, table, file_paths, load_id)
+
+    with patch.object(dummy_impl.DummyClient, "start_reference_jobs_batch", _record_batch):
+        with patch.object(dummy_impl.DummyClient, "max_reference_jobs_batch", 2):
+            with ThreadPool() as pool:
+                load.run(pool)
+    # event_user references started in batches of max 2 files
+    assert [(name, len(files)) for name, files in batches[:2]] == [("event_user", 2), ("event_user", 1)]
+    # event_loop_interrupted references started only when the file was uploaded to staging
+    assert [(name, len(files)) for name, files in batches[2:]] == [("event_loop_interrupted", 1)]
+    # each file completed separately
+    package_info = load.load_storage.get_load_package_info(load_id)
+    assert len(package_info.jobs["new_jobs"]) == 0
+    assert len(package_info.jobs["completed_jobs"]) == 5
+
+
+def test_reference_jobs_batch_retry() -> None:
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0), with_staging=True)
+    load_id, schema = prepare_load_package(load.load_storage, [])
+    new_jobs_path = load.load_storage._get_job_folder_path(load_id, "new_jobs")
+    for _ in range(3):
+        load.load_storage.storage.save(os.path.join(new_jobs_path, f"event_user.{uniq_id()}.0.reference"), "s3://bucket/event_user.jsonl")
+
+    with patch.object(dummy_impl.DummyClient, "start_reference_jobs_batch", side_effect=DestinationTransientException("copy failed")):
+        with ThreadPool() as pool:
+            load.run(pool)
+    # all files in the batch go back to new jobs to be retried
+    new_jobs = load.load_storage.list_new_jobs(load_id)
+    assert len(new_jobs) == 3
+    assert all(LoadStorage.parse_job_file_name(job).retry_count == 1 for job in new_jobs)
+
+
 def test_retry_exceptions() -> None:
     load = setup_loader(client_config=DummyClientConfiguration(retry_prob=1.0))
     prepare_load_package(
@@ -436,7 +517,15 @@ def run_all(load: Load) -> None:
         sleep(0.1)
 
 
-def setup_loader(delete_completed_jobs: bool = False, client_config: DummyClientConfiguration = None) -> Load:
+def start_and_collect_jobs(load: Load, load_id: str, schema: Schema) -> List[LoadJob]:
+    """Starts all new jobs in `load.pool` and waits until they are started"""
+    spooling_jobs = load.start_new_jobs(load_id, schema, load.config.workers, set())
+    for spooling_job in spooling_jobs:
+        spooling_job.wait()
+    return Load.collect_spooled_jobs(spooling_jobs)
+
+
+def setup_loader(delete_completed_jobs: bool = False, client_config: DummyClientConfiguration = None, workers: int = 20, with_staging: bool = False) -> Load:
     # reset jobs for a test
     dummy_impl.JOBS = {}
     destination: DestinationReference = dummy  # type: ignore[assignment]
@@ -445,8 +534,10 @@ def setup_loader(delete_completed_jobs: bool = False, client_config: DummyClient
     # destination.client = lambda schema: dummy_impl.DummyClient(schema, client_config)
 
     # setup loader
-    with TEST_DICT_CONFIG_PROVIDER().values({"delete_completed_jobs": delete_completed_jobs}):
+    with TEST_DICT_CONFIG_PROVIDER().values({"delete_completed_jobs": delete_completed_jobs, "workers": workers}):
         return Load(
             destination,
-            initial_client_config=client_config
+            staging_destination=destination if with_staging else None,
+            initial_client_config=client_config,
+            initial_staging_client_config=client_config if with_staging else None
     )
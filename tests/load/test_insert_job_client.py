@@ -124,8 +124,8 @@ def test_query_split(client: InsertValuesJobClient, file_storage: FileStorage) -
     assert mocked_fragments.call_count == 10
     for idx, call in enumerate(mocked_fragments.call_args_list):
         fragment:List[str] = call.args[0]
-        # last elem of fragment is a data list, first element is id, and must end with ;\n
-        assert fragment[-1].startswith(f"'{idx}'")
+        # last elem of fragment is a single row, first element is id, and must end with ;
+        assert fragment[-1].startswith(f"('{idx}'")
         assert fragment[-1].endswith(");")
     assert_load_with_max_query(client, file_storage, 10, 2)
 
@@ -157,6 +157,29 @@ def test_query_split(client: InsertValuesJobClient, file_storage: FileStorage) -
     assert mocked_fragments.call_count == 1
 
 
+@pytest.mark.parametrize("client", destinations_configs(default_sql_configs=True, subset=DEFAULT_SUBSET), indirect=True, ids=lambda x: x.name)
+def test_max_rows_per_insert(client: InsertValuesJobClient, file_storage: FileStorage) -> None:
+    mocked_caps = client.sql_client.__class__.capabilities
+    insert_sql = prepare_insert_statement(10)
+
+    # statements with 3 rows are sent together in a single round trip
+    with patch.object(mocked_caps, "max_rows_per_insert", 3), patch.object(client.sql_client, "execute_fragments") as mocked_fragments:
+        user_table_name = prepare_table(client)
+        job = expect_load_file(client, file_storage, insert_sql, user_table_name)
+    assert mocked_fragments.call_count == 1
+    statements = "".join(mocked_fragments.call_args.args[0])
+    assert statements.count("INSERT INTO") == 4
+    assert statements.count(";") == 4
+    assert job.rows_count == 10
+    assert job.query_length == len(statements)
+
+    # load for real
+    with patch.object(mocked_caps, "max_rows_per_insert", 3):
+        assert_load_with_max_query(client, file_storage, 10, mocked_caps.max_query_length)
+        # statements do not fit together into a single round trip
+        assert_load_with_max_query(client, file_storage, 10, 300)
+
+
 def assert_load_with_max_query(client: InsertValuesJobClient, file_storage: FileStorage, insert_lines: int, max_query_length: int) -> None:
     # load and check for real
     mocked_caps = client.sql_client.__class__.capabilities
@@ -2,6 +2,7 @@ import io
 import pytest
 from typing import Iterator, List
 
+from dlt.common import json, pendulum
 from dlt.common.schema import Schema
 from dlt.common.configuration.container import Container
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
@@ -10,9 +11,12 @@ from dlt.common.schema.typing import TWriteDisposition, TColumnSchema, TTableSch
 
 from dlt.destinations import weaviate
 from dlt.destinations.weaviate.exceptions import PropertyNameConflict
-from dlt.destinations.weaviate.weaviate_client import WeaviateClient
+from dlt.destinations.weaviate.weaviate_client import LoadWeaviateJob, WeaviateClient
 
 from dlt.common.storages.file_storage import FileStorage
+from dlt.common.storages.load_storage import ParsedLoadJobFileName
+from dlt.common.data_writers import DataWriter
+from dlt.load import Load
 from dlt.common.schema.utils import new_table
 from tests.load.utils import TABLE_ROW_ALL_DATA_TYPES, TABLE_UPDATE, TABLE_UPDATE_COLUMNS_SCHEMA, expect_load_file, write_dataset
 
@@ -212,3 +216,41 @@ def test_load_case_sensitive_data_ci(ci_client: WeaviateClient, file_storage: Fi
     objects = response["data"]["Get"][ci_client.make_qualified_class_name(class_name)]
     # the latter of conflicting fields is stored (so data is lost)
     assert objects == [{'col1': 726171}]
+
+
+@pytest.mark.parametrize('conversion_workers', [0, 2])
+def test_load_parquet_file(client: WeaviateClient, file_storage: FileStorage, conversion_workers: int) -> None:
+    class_name = "col_class"
+    client.config.conversion_workers = conversion_workers
+    columns: TTableSchemaColumns = {
+        "col1": {"name": "col1", "data_type": "bigint", "nullable": False},
+        "col_ts": {"name": "col_ts", "data_type": "timestamp", "nullable": True},
+        "col_complex": {"name": "col_complex", "data_type": "complex", "nullable": True},
+    }
+    client.schema.update_schema(new_table(class_name, columns=list(columns.values())))
+    client.schema.bump_version()
+    client.update_stored_schema()
+    # more rows than the batch size so file is converted in several chunks
+    rows = [{"col1": i, "col_ts": pendulum.datetime(2023, 1, 1).add(days=i), "col_complex": {"v": i}} for i in range(250)]
+    file_name = ParsedLoadJobFileName(class_name, uniq_id(), 0, "parquet").job_id()
+    with file_storage.open_file(file_name, "wb") as f:
+        DataWriter.from_file_format("parquet", f, client.capabilities).write_all(columns, rows)
+    table = Load.get_load_table(client.schema, file_name)
+    job = client.start_file_load(table, file_storage.make_full_path(file_name), uniq_id())
+    assert job.state() == "completed"
+    response = client.query_class(class_name, ["col1", "col_complex"]).with_limit(300).do()
+    objects = response["data"]["Get"][client.make_qualified_class_name(class_name)]
+    assert sorted(obj["col1"] for obj in objects) == list(range(250))
+    assert {obj["col_complex"] for obj in objects} == {json.dumps({"v": i}) for i in range(250)}
+
+
+def test_complex_value_converters() -> None:
+    columns: TTableSchemaColumns = {"col_complex": {"name": "col_complex", "data_type": "complex", "nullable": True}}
+    # strings in jsonl files are complex values like any other and are serialized
+    convert_f = LoadWeaviateJob.make_value_converters(columns, "jsonl")["col_complex"]
+    assert convert_f("text") == json.dumps("text")
+    assert convert_f({"v": 1}) == json.dumps({"v": 1})
+    # complex values in parquet files are already serialized
+    convert_f = LoadWeaviateJob.make_value_converters(columns, "parquet")["col_complex"]
+    assert convert_f(json.dumps({"v": 1})) == json.dumps({"v": 1})
+    assert convert_f({"v": 1}) == json.dumps({"v": 1})
@@ -1,23 +1,28 @@
+import os
+import pickle
+import tempfile
 import pytest
 from fnmatch import fnmatch
-from typing import Dict, Iterator, List, Sequence, Tuple
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
 from multiprocessing import get_start_method, Pool
 from multiprocessing.dummy import Pool as ThreadPool
 
 from dlt.common import json
 from dlt.common.schema.schema import Schema
+from dlt.common.schema.utils import new_table
 from dlt.common.utils import uniq_id
 from dlt.common.typing import StrAny
 from dlt.common.data_types import TDataType
-from dlt.common.storages import NormalizeStorage, LoadStorage
+from dlt.common.storages import FileStorage, NormalizeStorage, LoadStorage
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.configuration.container import Container
 
 from dlt.extract.extract import ExtractorStorage
 from dlt.normalize import Normalize
+from dlt.normalize.normalize import ExtractedFilePart, SchemaSnapshot, _W_SCHEMA_CACHE
 
 from tests.cases import JSON_TYPED_DICT, JSON_TYPED_DICT_TYPES
-from tests.utils import TEST_DICT_CONFIG_PROVIDER, assert_no_dict_key_starts_with, clean_test_storage, init_test_logging
+from tests.utils import TEST_DICT_CONFIG_PROVIDER, TEST_STORAGE_ROOT, assert_no_dict_key_starts_with, clean_test_storage, init_test_logging, preserve_environ
 from tests.normalize.utils import json_case_path, INSERT_CAPS, JSONL_CAPS, DEFAULT_CAPS, ALL_CAPABILITIES
 
 
@@ -215,6 +220,149 @@ def test_multiprocess_row_counting(caps: DestinationCapabilitiesContext, raw_nor
     assert raw_normalize._row_counts["events__payload__pull_request__requested_reviewers"] == 24
 
 
+def test_multiprocess_more_chunks_than_workers(raw_normalize: Normalize, monkeypatch: pytest.MonkeyPatch) -> None:
+    # 6 files in 2 workers with 2 chunks per worker, chunks are picked by free workers
+    extract_cases(
+        raw_normalize.normalize_storage,
+        ["github.events.load_page_1_duck"] * 6
+    )
+    assert raw_normalize.config.chunks_per_worker == 2
+    snapshots_dirs: List[str] = []
+    mkdtemp = tempfile.mkdtemp
+
+    def _mkdtemp(prefix: str) -> str:
+        snapshots_dirs.append(mkdtemp(prefix=prefix, dir=TEST_STORAGE_ROOT))
+        return snapshots_dirs[-1]
+
+    monkeypatch.setattr(tempfile, "mkdtemp", _mkdtemp)
+    with Pool(processes=2) as p:
+        raw_normalize.run(p)
+    # schema snapshots are written outside of the package and removed
+    assert len(snapshots_dirs) == 1
+    assert not os.path.exists(snapshots_dirs[0])
+    assert raw_normalize._row_counts["events"] == 600
+    assert raw_normalize._row_counts["events__payload__pull_request__requested_reviewers"] == 144
+    assert len(raw_normalize.normalize_storage.list_files_to_normalize_sorted()) == 0
+    loads = raw_normalize.load_storage.list_packages()
+    assert len(loads) == 1
+    # schema snapshots shared with workers are not committed with the package
+    package_path = raw_normalize.load_storage.storage.make_full_path(raw_normalize.load_storage.get_package_path(loads[0]))
+    assert not any(fnmatch(f, "schema_snapshot.*") for f in os.listdir(package_path))
+
+
+def test_schema_snapshot_cached_in_worker() -> None:
+    clean_test_storage()
+    schema = Schema("snap")
+    snapshot_path = os.path.join(TEST_STORAGE_ROOT, "snap.pickle")
+    with open(snapshot_path, "wb") as f:
+        pickle.dump(schema, f)
+    snapshot = SchemaSnapshot("snap", "id_1", snapshot_path)
+    w_schema, applied_deltas = Normalize._w_get_schema(snapshot)
+    assert applied_deltas == 0
+    assert w_schema.name == "snap"
+    # cache as worker does after a task without schema updates
+    _W_SCHEMA_CACHE["snap"] = ("id_1", None, w_schema, applied_deltas)
+    # snapshot file is not read again, only new deltas are applied
+    os.remove(snapshot_path)
+    delta = {"items": [new_table("items", columns=[{"name": "id", "data_type": "bigint", "nullable": False}])]}
+    snapshot = snapshot._replace(deltas=[delta])
+    c_schema, applied_deltas = Normalize._w_get_schema(snapshot)
+    assert c_schema is w_schema
+    assert applied_deltas == 1
+    assert c_schema.get_table_columns("items")["id"]["data_type"] == "bigint"
+    # schema is taken out of the cache while in use
+    assert "snap" not in _W_SCHEMA_CACHE
+    # new snapshot is loaded from file
+    _W_SCHEMA_CACHE["snap"] = ("id_1", None, c_schema, applied_deltas)
+    with pytest.raises(FileNotFoundError):
+        Normalize._w_get_schema(snapshot._replace(snapshot_id="id_2"))
+    # snapshot of another run with the same content reuses the cached schema
+    version_hash = schema.to_dict()["version_hash"]
+    _W_SCHEMA_CACHE["snap"] = ("id_1", version_hash, w_schema, 0)
+    r_schema, applied_deltas = Normalize._w_get_schema(SchemaSnapshot("snap", "id_3", snapshot_path, [], version_hash))
+    assert r_schema is w_schema
+    assert applied_deltas == 0
+    # but not if deltas were applied to the cached schema
+    _W_SCHEMA_CACHE["snap"] = ("id_1", version_hash, w_schema, 1)
+    with pytest.raises(FileNotFoundError):
+        Normalize._w_get_schema(SchemaSnapshot("snap", "id_3", snapshot_path, [], version_hash))
+    # stored schema is always restored
+    assert Normalize._w_get_schema(schema.to_dict())[0] is not c_schema
+
+
+def test_multiprocess_split_large_file(raw_normalize: Normalize) -> None:
+    # write many lines into extracted file, only uncompressed files are split
+    os.environ["DATA_WRITER__BUFFER_MAX_ITEMS"] = "7"
+    os.environ["DATA_WRITER__DISABLE_COMPRESSION"] = "True"
+    extract_cases(
+        raw_normalize.normalize_storage,
+        ["github.events.load_page_1_duck"]
+    )
+    # split any file into parts
+    raw_normalize.config.file_part_min_bytes = 1
+    with Pool(processes=3) as p:
+        raw_normalize.run(p)
+    # each line normalized exactly once
+    assert raw_normalize._row_counts["events"] == 100
+    assert raw_normalize._row_counts["events__payload__pull_request__requested_reviewers"] == 24
+    loads = raw_normalize.load_storage.list_packages()
+    assert len(loads) == 1
+    # parts were written by several workers
+    table_files = [f for f in raw_normalize.load_storage.list_new_jobs(loads[0]) if LoadStorage.parse_job_file_name(f).table_name == "events"]
+    assert len(table_files) > 1
+
+
+def test_multiprocess_gzip_file_not_split(raw_normalize: Normalize, monkeypatch: pytest.MonkeyPatch) -> None:
+    os.environ["DATA_WRITER__BUFFER_MAX_ITEMS"] = "7"
+    extract_cases(
+        raw_normalize.normalize_storage,
+        ["github.events.load_page_1_duck"]
+    )
+    extracted_files = raw_normalize.normalize_storage.list_files_to_normalize_sorted()
+    assert FileStorage.is_gzipped(raw_normalize.normalize_storage.storage.make_full_path(extracted_files[0]))
+    # record the parts sent to the workers
+    groups: List[List[ExtractedFilePart]] = []
+    group_f = Normalize.group_worker_files_by_size
+
+    def _group_worker_files_by_size(*args: Any, **kwargs: Any) -> List[List[ExtractedFilePart]]:
+        file_groups = group_f(*args, **kwargs)
+        groups.extend(file_groups)
+        return file_groups
+
+    monkeypatch.setattr(Normalize, "group_worker_files_by_size", staticmethod(_group_worker_files_by_size))
+    raw_normalize.config.file_part_min_bytes = 1
+    with Pool(processes=3) as p:
+        raw_normalize.run(p)
+    assert raw_normalize._row_counts["events"] == 100
+    # compressed files are normalized whole
+    parts = [part for group in groups for part in group]
+    assert sorted(part.file_name for part in parts) == sorted(extracted_files)
+    assert all(part.parts_count == 1 for part in parts)
+
+
+@pytest.mark.parametrize("caps", JSONL_CAPS, indirect=True)
+def test_multiprocess_merge_job_files(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
+    os.environ["DATA_WRITER__BUFFER_MAX_ITEMS"] = "7"
+    extract_cases(
+        raw_normalize.normalize_storage,
+        ["github.events.load_page_1_duck"]
+    )
+    os.environ["DATA_WRITER__DISABLE_COMPRESSION"] = "True"
+    raw_normalize.config.file_part_min_bytes = 1
+    raw_normalize.config.merge_job_files_max_bytes = 1024 * 1024 * 1024
+    with Pool(processes=3) as p:
+        raw_normalize.run(p)
+    assert raw_normalize._row_counts["events"] == 100
+    loads = raw_normalize.load_storage.list_packages()
+    # parts written by several workers are merged into a single file per table
+    new_jobs = raw_normalize.load_storage.list_new_jobs(loads[0])
+    table_names = [LoadStorage.parse_job_file_name(f).table_name for f in new_jobs]
+    assert len(table_names) == len(set(table_names))
+    events_file = next(f for f in new_jobs if LoadStorage.parse_job_file_name(f).table_name == "events")
+    with FileStorage.open_zipsafe_ro(raw_normalize.load_storage.storage.make_full_path(events_file)) as f:
+        assert len(f.readlines()) == 100
+
+
 @pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
 def test_normalize_many_schemas(caps: DestinationCapabilitiesContext, rasa_normalize: Normalize) -> None:
     extract_cases(
@@ -349,6 +497,52 @@ def test_group_worker_files() -> None:
     assert Normalize.group_worker_files(files, 3) == [["chd.3"], ["chd.4", "tab1.2"], ["tab1.1", "tab1.3"]]
 
 
+def test_group_worker_files_by_size() -> None:
+    group_f = Normalize.group_worker_files_by_size
+
+    assert group_f([], [], 4) == []
+    assert group_f(["f001"], [100], 1) == [[("f001", 0, 1)]]
+    assert group_f(["f001"], [100], 100) == [[("f001", 0, 1)]]
+    # single large file gets its own group, small files are balanced in the others
+    files = ["big", "s1", "s2", "s3", "s4"]
+    assert group_f(files, [1000, 10, 10, 10, 10], 3) == [[("big", 0, 1)], [("s1", 0, 1), ("s3", 0, 1)], [("s2", 0, 1), ("s4", 0, 1)]]
+    # large file is split into parts, each in a separate group
+    groups = group_f(files, [1000, 10, 10, 10, 10], 3, file_part_min_bytes=100)
+    assert len(groups) == 3
+    for group in groups:
+        assert sum(1 for part in group if part.file_name == "big") == 1
+    assert sorted(part for group in groups for part in group if part.file_name == "big") == [("big", 0, 3), ("big", 1, 3), ("big", 2, 3)]
+    # parts are not smaller than min bytes
+    groups = group_f(files, [1000, 10, 10, 10, 10], 3, file_part_min_bytes=500)
+    assert sorted(part for group in groups for part in group if part.file_name == "big") == [("big", 0, 2), ("big", 1, 2)]
+    # files below min bytes are not split
+    assert len(group_f(["f001"], [100], 4, file_part_min_bytes=100)) == 1
+    # files that are not splittable are never split
+    groups = group_f(files, [1000, 10, 10, 10, 10], 3, file_part_min_bytes=100, splittable=[False, True, True, True, True])
+    assert [("big", 0, 1)] in groups
+
+
+def test_read_jsonl_file_parts() -> None:
+    file_path = os.path.join(TEST_STORAGE_ROOT, "items.jsonl")
+    os.makedirs(TEST_STORAGE_ROOT, exist_ok=True)
+    with open(file_path, "wb") as f:
+        for i in range(100):
+            f.write(json.dumpb({"id": i, "value": "x" * (i % 7)}) + b"\n")
+    size = os.path.getsize(file_path)
+    for parts_count in (1, 3, 7, 100, 200):
+        ids: List[int] = []
+        for part_no in range(parts_count):
+            start, end = Normalize._get_part_range(size, part_no, parts_count)
+            with open(file_path, "rb") as f:
+                part_ids = [item["id"] for _, item, _ in Normalize._w_read_jsonl_lines(f, start, end)]
+                # reading stops at the end of the range
+                if end is not None:
+                    assert f.tell() < end + 100
+            ids.extend(part_ids)
+        # parts are contiguous and each line is read exactly once
+        assert ids == list(range(100))
+
+
 EXPECTED_ETH_TABLES = ["blocks", "blocks__transactions", "blocks__transactions__logs", "blocks__transactions__logs__topics",
                        "blocks__uncles", "blocks__transactions__access_list", "blocks__transactions__access_list__storage_keys"]
 
@@ -0,0 +1,116 @@
+import pytest
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import dlt
+from dlt.common import json, pendulum
+from dlt.common.normalizers.json.relational import DLT_ID_LENGTH_BYTES
+from dlt.common.libs import pyarrow as pyarrow_helpers
+from dlt.common.libs.pyarrow import generate_dlt_ids, get_column_type_from_py_arrow, nested_to_json_strings, py_arrow_to_table_schema_columns
+from dlt.common.utils import uniq_id, uniq_id_base64
+
+from tests.utils import preserve_environ
+
+
+def _arrow_table(rows: int, offset: int = 0) -> pa.Table:
+    now = pendulum.now().replace(microsecond=0)
+    return pa.table({
+        "Id": list(range(offset, offset + rows)),
+        "Name": [f"name_{i}" for i in range(offset, offset + rows)],
+        "Ts": pa.array([now] * rows, type=pa.timestamp("us", tz="UTC")),
+        "Amount": pa.array([1.5] * rows, type=pa.float64()),
+    })
+
+
+def test_py_arrow_to_table_schema_columns() -> None:
+    columns = py_arrow_to_table_schema_columns(_arrow_table(1).schema)
+    assert columns["Id"]["data_type"] == "bigint"
+    assert columns["Name"]["data_type"] == "text"
+    assert columns["Ts"]["data_type"] == "timestamp"
+    assert columns["Ts"]["precision"] == 6
+    assert columns["Amount"]["data_type"] == "double"
+    assert get_column_type_from_py_arrow(pa.decimal128(10, 2)) == {"data_type": "decimal", "precision": 10, "scale": 2}
+    assert get_column_type_from_py_arrow(pa.list_(pa.int32())) == {"data_type": "complex"}
+
+
+def test_nested_to_json_strings() -> None:
+    values = [{"a": [1, 2], "s": "line\nbreak"}, None, {"a": [], "s": ""}]
+    column = pa.chunked_array([pa.array(values), pa.array(values[:1])])
+    strings = nested_to_json_strings(column)
+    assert strings.type == pa.string()
+    assert strings.to_pylist() == [json.dumps(values[0]), None, json.dumps(values[2]), json.dumps(values[0])]
+    assert len(nested_to_json_strings(pa.array([], type=pa.list_(pa.int64())))) == 0
+
+
+def test_generate_dlt_ids(monkeypatch: pytest.MonkeyPatch) -> None:
+    ids = generate_dlt_ids(1000)
+    assert len(ids) == 1000
+    assert len(set(ids.to_pylist())) == 1000
+    # same length as ids generated by the relational normalizer
+    assert all(len(_id) == len(uniq_id_base64(DLT_ID_LENGTH_BYTES)) for _id in ids.to_pylist())
+    assert ids.type == pa.string()
+    assert len(generate_dlt_ids(0)) == 0
+    ids = generate_dlt_ids(10, id_length_bytes=7)
+    assert all(len(_id) == len(uniq_id_base64(7)) for _id in ids.to_pylist())
+    # ids are split into arrays that do not overflow the string offsets
+    monkeypatch.setattr(pyarrow_helpers, "DLT_IDS_CHUNK_SIZE", 300)
+    ids = generate_dlt_ids(1000)
+    assert ids.num_chunks == 4
+    assert len(set(ids.to_pylist())) == 1000
+
+
+@pytest.mark.parametrize("item_type", ["table", "record_batch", "pandas"])
+def test_extract_and_normalize_arrow(item_type: str) -> None:
+    def _items():
+        for i in range(3):
+            table = _arrow_table(10, i * 10)
+            if item_type == "record_batch":
+                yield table.to_batches()[0]
+            elif item_type == "pandas":
+                yield table.to_pandas()
+            else:
+                yield table
+
+    pipeline = dlt.pipeline("arrow_" + uniq_id(), destination="duckdb")
+    pipeline.extract(dlt.resource(_items(), name="items"))
+    # arrow items are extracted into parquet files
+    extracted = pipeline._get_normalize_storage().list_files_to_normalize_sorted()
+    assert any(f.endswith(".parquet") for f in extracted)
+
+    pipeline.normalize(loader_file_format="parquet")
+    load_id = pipeline._get_load_storage().list_packages()[0]
+    jobs = pipeline._get_load_storage().list_new_jobs(load_id)
+    items_job = [job for job in jobs if "items" in job]
+    assert len(items_job) == 1
+    table = pq.read_table(pipeline._get_load_storage().storage.make_full_path(items_job[0]))
+    # column names normalized and dlt columns added
+    assert table.column_names == ["id", "name", "ts", "amount", "_dlt_load_id", "_dlt_id"]
+    assert table.num_rows == 30
+    assert table.column("id").to_pylist() == list(range(30))
+    assert set(table.column("_dlt_load_id").to_pylist()) == {load_id}
+    assert len(set(table.column("_dlt_id").to_pylist())) == 30
+
+    # schema inferred from arrow schema
+    columns = pipeline.default_schema.get_table_columns("items")
+    assert columns["id"]["data_type"] == "bigint"
+    assert columns["ts"]["data_type"] == "timestamp"
+    assert columns["amount"]["data_type"] == "double"
+    assert columns["_dlt_id"]["unique"] is True
+
+    info = pipeline.load()
+    assert not info.has_failed_jobs
+    with pipeline.sql_client() as client:
+        rows = client.execute_sql("SELECT COUNT(*), COUNT(DISTINCT _dlt_id), MAX(id) FROM items")
+        assert rows[0] == (30, 30, 29)
+
+
+def test_arrow_to_insert_values() -> None:
+    """Destinations that do not load parquet get arrow items normalized row by row"""
+    table = _arrow_table(5).append_column("Obj", pa.array([{"a": 1}] * 5))
+    pipeline = dlt.pipeline("arrow_" + uniq_id(), destination="duckdb")
+    info = pipeline.run(dlt.resource([table, table], name="items"), loader_file_format="insert_values")
+    assert not info.has_failed_jobs
+    with pipeline.sql_client() as client:
+        rows = client.execute_sql("SELECT COUNT(*), COUNT(DISTINCT _dlt_id), SUM(obj__a) FROM items")
+        assert rows[0] == (10, 10, 10)
@@ -2,7 +2,7 @@ import itertools
 import logging
 import os
 import random
-from typing import Any, Optional, Iterator, Dict, Any, cast
+from typing import Any, List, Optional, Iterator, Dict, Any, cast
 from tenacity import retry_if_exception, Retrying, stop_after_attempt
 from pydantic import BaseModel
 
@@ -17,6 +17,7 @@ from dlt.common.configuration.specs.gcp_credentials import GcpOAuthCredentials
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.exceptions import DestinationHasFailedJobs, DestinationTerminalException, PipelineStateNotAvailable, UnknownDestinationModule
 from dlt.common.pipeline import PipelineContext
+from dlt.common.runners import pool_runner
 from dlt.common.runtime.collector import AliveCollector, EnlightenCollector, LogCollector, TqdmCollector
 from dlt.common.schema.utils import new_column
 from dlt.common.utils import uniq_id
@@ -24,6 +25,7 @@ from dlt.common.utils import uniq_id
 from dlt.extract.exceptions import InvalidResourceDataTypeBasic, PipeGenInvalid, SourceExhausted
 from dlt.extract.extract import ExtractorStorage
 from dlt.extract.source import DltResource, DltSource
+from dlt.load import Load
 from dlt.load.exceptions import LoadClientJobFailed
 from dlt.pipeline.exceptions import InvalidPipelineName, PipelineNotActive, PipelineStepFailed
 from dlt.pipeline.helpers import retry_load
@@ -1090,3 +1092,148 @@ def test_extract_pydantic_models() -> None:
     expect_extracted_file(
         storage, pipeline.default_schema_name, "users", json.dumps([{"user_id": 1, "name": "a"}, {"user_id": 2, "name": "b"}])
     )
+
+
+def test_run_micro_batches() -> None:
+    os.environ["EXTRACT__MICRO_BATCH_ITEMS"] = "10"
+    pipeline = dlt.pipeline(pipeline_name="micro_batches_" + uniq_id(), destination="duckdb")
+    loaded_counts = []
+
+    @dlt.resource(primary_key="id", write_disposition="merge")
+    def pages(updated_at=dlt.sources.incremental("id")):
+        for page in range(7):
+            # previous micro batches were loaded before the extraction continued
+            if page > 0 and page % 2 == 0:
+                with pipeline.sql_client() as client:
+                    loaded_counts.append(client.execute_sql("SELECT COUNT(1) FROM pages")[0][0])
+            yield [{"id": idx} for idx in range(page * 5, page * 5 + 5)]
+
+    info = pipeline.run(pages())
+    # packages of all micro batches are reported
+    assert_load_info(info, expected_load_packages=4)
+    assert len(info.load_packages) == 4
+    assert loaded_counts == [10, 20, 30]
+    # micro batches do not add steps to the trace
+    assert [step.step for step in pipeline.last_trace.steps] == ["extract", "normalize", "load", "run"]
+    assert pipeline.last_trace.last_load_info is info
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT COUNT(1) FROM pages")[0][0] == 35
+        # each micro batch was loaded in a separate package with the matching state
+        assert client.execute_sql("SELECT COUNT(1) FROM _dlt_loads")[0][0] == 4
+        state_versions = [row[0] for row in client.execute_sql("SELECT version FROM _dlt_pipeline_state ORDER BY version")]
+    assert state_versions == sorted(set(state_versions))
+    assert pipeline.state["_state_version"] == state_versions[-1]
+    assert pipeline.state["sources"][pipeline.default_schema_name]["resources"]["pages"]["incremental"]["id"]["last_value"] == 34
+
+    # tables with replace write disposition are loaded in one package
+    info = pipeline.run(pages(), write_disposition="replace")
+    assert_load_info(info)
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT COUNT(1) FROM _dlt_loads")[0][0] == 5
+
+
+def test_run_micro_batches_load_failed(monkeypatch: pytest.MonkeyPatch) -> None:
+    os.environ["EXTRACT__MICRO_BATCH_ITEMS"] = "10"
+    pipeline = dlt.pipeline(pipeline_name="micro_batches_" + uniq_id(), destination="duckdb")
+
+    @dlt.resource(primary_key="id", write_disposition="merge")
+    def pages(updated_at=dlt.sources.incremental("id")):
+        for page in range(7):
+            yield [{"id": idx} for idx in range(page * 5, page * 5 + 5)]
+
+    # load of the second micro batch fails, each load step runs its own Load instance
+    load_run = Load.run
+    loads: List[Load] = []
+
+    def _load_run(self: Load, pool: Any) -> Any:
+        if self not in loads:
+            loads.append(self)
+        if len(loads) == 2:
+            raise RuntimeError("load failed")
+        return load_run(self, pool)
+
+    monkeypatch.setattr(Load, "run", _load_run)
+    with pytest.raises(PipelineStepFailed) as py_ex:
+        pipeline.run(pages())
+    assert py_ex.value.step == "load"
+    monkeypatch.setattr(Load, "run", load_run)
+    # the failed load is reported in the extract step without its info
+    extract_step = pipeline.last_trace.steps[0]
+    assert extract_step.step == "extract"
+    assert extract_step.step_exception is not None
+    assert extract_step.step_info is None
+
+    # local state matches the package of the failed micro batch, extraction after it is dropped
+    def _last_value() -> int:
+        return pipeline.state["sources"][pipeline.default_schema_name]["resources"]["pages"]["incremental"]["id"]["last_value"]  # type: ignore[no-any-return]
+
+    assert _last_value() == 19
+    failed_version = pipeline.state["_state_version"]
+    assert pipeline.list_normalized_load_packages()
+    assert not pipeline.list_extracted_resources()
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT COUNT(1) FROM pages")[0][0] == 10
+        assert client.execute_sql("SELECT MAX(version) FROM _dlt_pipeline_state")[0][0] < failed_version
+
+    # pending package is loaded together with its state
+    pipeline.run()
+    assert pipeline.state["_state_version"] == failed_version
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT COUNT(1) FROM pages")[0][0] == 20
+        assert client.execute_sql("SELECT MAX(version) FROM _dlt_pipeline_state")[0][0] == failed_version
+
+    # extraction continues from the state of the loaded data
+    info = pipeline.run(pages())
+    assert_load_info(info, expected_load_packages=2)
+    assert _last_value() == 34
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT COUNT(1) FROM pages")[0][0] == 35
+        state_versions = [row[0] for row in client.execute_sql("SELECT version FROM _dlt_pipeline_state ORDER BY version")]
+    assert state_versions == sorted(set(state_versions))
+    assert pipeline.state["_state_version"] == state_versions[-1]
+
+
+def test_run_micro_batches_disabled_for_transformers() -> None:
+    os.environ["EXTRACT__MICRO_BATCH_ITEMS"] = "10"
+    pipeline = dlt.pipeline(pipeline_name="micro_batches_" + uniq_id(), destination="duckdb")
+
+    @dlt.resource(primary_key="id", write_disposition="merge")
+    def pages(updated_at=dlt.sources.incremental("id")):
+        for page in range(7):
+            yield [{"id": idx} for idx in range(page * 5, page * 5 + 5)]
+
+    # the cursor of `pages` moves before the transformer yields the items
+    @dlt.transformer(primary_key="id", write_disposition="merge")
+    def details(items):
+        for item in items:
+            yield {"id": item["id"], "detail": str(item["id"])}
+
+    @dlt.source
+    def pages_with_details():
+        pages_ = pages()
+        return pages_, pages_ | details
+
+    info = pipeline.run(pages_with_details())
+    assert_load_info(info)
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT COUNT(1) FROM pages")[0][0] == 35
+        assert client.execute_sql("SELECT COUNT(1) FROM details")[0][0] == 35
+        assert client.execute_sql("SELECT COUNT(1) FROM _dlt_loads")[0][0] == 1
+
+
+def test_normalize_persistent_pool() -> None:
+    os.environ["NORMALIZE__PERSISTENT_POOL"] = "true"
+    pipeline = dlt.pipeline(pipeline_name="persistent_pool_" + uniq_id(), destination="duckdb")
+    try:
+        pipeline.extract([{"id": 1}, {"id": 2}], table_name="items")
+        pipeline.normalize(workers=2)
+        pool = pool_runner._PERSISTENT_POOLS[("process", 2)]
+        pipeline.extract([{"id": 3, "name": "new column"}], table_name="items")
+        pipeline.normalize(workers=2)
+        # same pool used by the next run
+        assert pool_runner._PERSISTENT_POOLS[("process", 2)] is pool
+        assert pool._state == "RUN"
+        assert_load_info(pipeline.load(), expected_load_packages=2)
+        assert pipeline.default_schema.get_table_columns("items")["name"]["data_type"] == "text"
+    finally:
+        pool_runner.close_persistent_pools()
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import shutil
 import pytest
@@ -340,6 +341,27 @@ def test_resource_state_in_pipeline() -> None:
         p.extract(r)
     assert isinstance(pip_ex.value.__context__, ResourceNameNotAvailable)
 
+    # get resource state in async generators evaluated together on the event loop
+    async def _gen_inner_async_gen(last_value: int):
+        for idx in range(3):
+            await asyncio.sleep(0.01)
+            state = dlt.current.resource_state()
+            assert state.get("last_value", last_value) == last_value + idx
+            state["last_value"] = last_value + idx + 1
+            yield idx
+
+    r_1 = dlt.resource(_gen_inner_async_gen, name="async_gen_1")
+    r_2 = dlt.resource(_gen_inner_async_gen, name="async_gen_2")
+
+    @dlt.source
+    def async_gens():
+        return r_1(10), r_2(20)
+
+    p.extract(async_gens())
+    resources_state = state_module._last_full_state["sources"]["async_gens"]["resources"]
+    assert resources_state["async_gen_1"]["last_value"] == 13
+    assert resources_state["async_gen_2"]["last_value"] == 23
+
 
 def test_transformer_state_write() -> None:
     r = some_data_resource_state()